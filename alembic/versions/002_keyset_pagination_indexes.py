@@ -0,0 +1,28 @@
+"""Keyset pagination indexes
+
+Revision ID: 002
+Revises: 001
+Create Date: 2024-02-01 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '002'
+down_revision = '001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE INDEX idx_books_title_id ON books(title, id)")
+    op.execute("CREATE INDEX idx_books_published_year_id ON books(published_year, id)")
+    op.execute("CREATE INDEX idx_books_created_at_id ON books(created_at, id)")
+    op.execute("CREATE INDEX idx_books_updated_at_id ON books(updated_at, id)")
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_books_updated_at_id")
+    op.execute("DROP INDEX IF EXISTS idx_books_created_at_id")
+    op.execute("DROP INDEX IF EXISTS idx_books_published_year_id")
+    op.execute("DROP INDEX IF EXISTS idx_books_title_id")
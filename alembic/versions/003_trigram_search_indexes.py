@@ -0,0 +1,47 @@
+"""Trigram search indexes
+
+Revision ID: 003
+Revises: 002
+Create Date: 2024-02-15 00:00:00.000000
+
+"""
+import logging
+
+from alembic import context, op
+import sqlalchemy as sa
+
+revision = '003'
+down_revision = '002'
+branch_labels = None
+depends_on = None
+
+logger = logging.getLogger("alembic.runtime.migration")
+
+
+def upgrade() -> None:
+    available = op.get_bind().execute(
+        sa.text("SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'")
+    ).scalar()
+    if not available:
+        if context.get_x_argument(as_dictionary=True).get("skip_trgm") == "true":
+            logger.warning("pg_trgm is not available on this server; skipping trigram indexes")
+            return
+        raise RuntimeError(
+            "pg_trgm is not available on this server. Install the PostgreSQL contrib "
+            "package, or run `alembic -x skip_trgm=true upgrade head` to continue without "
+            "trigram indexes (substring filters will fall back to sequential scans)."
+        )
+
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    
+    op.execute("CREATE INDEX idx_books_title_trgm ON books USING GIN (title gin_trgm_ops)")
+    op.execute("CREATE INDEX idx_authors_name_trgm ON authors USING GIN (name gin_trgm_ops)")
+    op.execute(
+        "CREATE INDEX idx_authors_nationality_trgm ON authors USING GIN (nationality gin_trgm_ops)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_authors_nationality_trgm")
+    op.execute("DROP INDEX IF EXISTS idx_authors_name_trgm")
+    op.execute("DROP INDEX IF EXISTS idx_books_title_trgm")
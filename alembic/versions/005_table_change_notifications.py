@@ -0,0 +1,106 @@
+"""Table change notifications
+
+Revision ID: 005
+Revises: 004
+Create Date: 2024-03-15 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '005'
+down_revision = '004'
+branch_labels = None
+depends_on = None
+
+TABLES = ("books", "authors", "users")
+
+
+def upgrade() -> None:
+    op.execute("""
+        CREATE OR REPLACE FUNCTION notify_table_change()
+        RETURNS TRIGGER AS $$
+        DECLARE
+            source TEXT;
+            changed_count BIGINT;
+            payload JSONB;
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                source := 'SELECT * FROM new_rows';
+            ELSIF TG_OP = 'DELETE' THEN
+                source := 'SELECT * FROM old_rows';
+            ELSE
+                source := 'SELECT * FROM old_rows UNION ALL SELECT * FROM new_rows';
+            END IF;
+            
+            EXECUTE format('SELECT count(*) FROM (%s) AS changed', source) INTO changed_count;
+            IF changed_count = 0 THEN
+                RETURN NULL;
+            END IF;
+            
+            IF changed_count > 200 THEN
+                payload := jsonb_build_object('all', true);
+            ELSE
+                EXECUTE format(
+                    'SELECT jsonb_build_object(
+                        ''ids'', coalesce(jsonb_agg(DISTINCT r->''id''), ''[]''),
+                        ''genres'', coalesce(jsonb_agg(DISTINCT r->''genre'') FILTER (WHERE r ? ''genre''), ''[]''),
+                        ''author_ids'', coalesce(jsonb_agg(DISTINCT r->''author_id'') FILTER (WHERE r ? ''author_id''), ''[]'')
+                    )
+                    FROM (SELECT to_jsonb(changed) AS r FROM (%s) AS changed) AS rows',
+                    source
+                ) INTO payload;
+            END IF;
+            
+            PERFORM pg_notify(
+                'table_changes',
+                (payload || jsonb_build_object('table', TG_TABLE_NAME, 'op', TG_OP))::text
+            );
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    
+    op.execute("""
+        CREATE OR REPLACE FUNCTION notify_table_truncate()
+        RETURNS TRIGGER AS $$
+        BEGIN
+            PERFORM pg_notify(
+                'table_changes',
+                jsonb_build_object('table', TG_TABLE_NAME, 'op', 'RESYNC', 'all', true)::text
+            );
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    
+    for table in TABLES:
+        op.execute(f"""
+            CREATE TRIGGER {table}_notify_insert AFTER INSERT ON {table}
+                REFERENCING NEW TABLE AS new_rows
+                FOR EACH STATEMENT EXECUTE FUNCTION notify_table_change()
+        """)
+        op.execute(f"""
+            CREATE TRIGGER {table}_notify_update AFTER UPDATE ON {table}
+                REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+                FOR EACH STATEMENT EXECUTE FUNCTION notify_table_change()
+        """)
+        op.execute(f"""
+            CREATE TRIGGER {table}_notify_delete AFTER DELETE ON {table}
+                REFERENCING OLD TABLE AS old_rows
+                FOR EACH STATEMENT EXECUTE FUNCTION notify_table_change()
+        """)
+        op.execute(f"""
+            CREATE TRIGGER {table}_notify_truncate AFTER TRUNCATE ON {table}
+                FOR EACH STATEMENT EXECUTE FUNCTION notify_table_truncate()
+        """)
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_notify_insert ON {table}")
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_notify_update ON {table}")
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_notify_delete ON {table}")
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_notify_truncate ON {table}")
+    op.execute("DROP FUNCTION IF EXISTS notify_table_change()")
+    op.execute("DROP FUNCTION IF EXISTS notify_table_truncate()")
@@ -0,0 +1,82 @@
+import argparse
+import asyncio
+import statistics
+import time
+
+from httpx import ASGITransport, AsyncClient
+
+from src.infrastructure.database import BATCH, INTERACTIVE, DatabasePool
+from src.main import app
+
+PROBE_INTERVAL = 0.02
+
+
+def percentile(samples: list[float], fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+async def batch_job(workload: str, hold: float) -> None:
+    with DatabasePool.workload_scope(workload):
+        async with DatabasePool.acquire() as connection:
+            await connection.execute("SELECT pg_sleep($1)", hold)
+
+
+async def probe(client: AsyncClient, done: asyncio.Event, samples: list[float]) -> None:
+    while not done.is_set():
+        started = time.perf_counter()
+        response = await client.get("/api/v1/books/", params={"limit": 10})
+        response.raise_for_status()
+        samples.append((time.perf_counter() - started) * 1000)
+        await asyncio.sleep(PROBE_INTERVAL)
+
+
+async def run(workload: str, jobs: int, hold: float) -> dict:
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://bench") as client:
+        done = asyncio.Event()
+        samples: list[float] = []
+        prober = asyncio.create_task(probe(client, done, samples))
+        started = time.perf_counter()
+        await asyncio.gather(*(batch_job(workload, hold) for _ in range(jobs)))
+        elapsed = time.perf_counter() - started
+        done.set()
+        await prober
+
+    return {
+        "mode": "shared" if workload == INTERACTIVE else "bulkhead",
+        "batch_seconds": elapsed,
+        "probes": len(samples),
+        "p50_ms": statistics.median(samples),
+        "p99_ms": percentile(samples, 0.99),
+        "max_ms": max(samples),
+    }
+
+
+async def main_async(jobs: int, hold: float) -> list[dict]:
+    await DatabasePool.initialize()
+    try:
+        return [await run(INTERACTIVE, jobs, hold), await run(BATCH, jobs, hold)]
+    finally:
+        await DatabasePool.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Measure GET /books latency while long batch jobs hold connections"
+    )
+    parser.add_argument("--jobs", type=int, default=40)
+    parser.add_argument("--hold", type=float, default=0.5)
+    args = parser.parse_args()
+
+    results = asyncio.run(main_async(args.jobs, args.hold))
+
+    print(f"{'pool':<10}{'batch s':>9}{'probes':>8}{'p50 ms':>10}{'p99 ms':>10}{'max ms':>10}")
+    for result in results:
+        print(
+            f"{result['mode']:<10}{result['batch_seconds']:>9.2f}{result['probes']:>8}"
+            f"{result['p50_ms']:>10.2f}{result['p99_ms']:>10.2f}{result['max_ms']:>10.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+import argparse
+import asyncio
+import csv
+import json
+import resource
+import subprocess
+import sys
+import time
+from io import StringIO
+
+import asyncpg
+
+from src.core.config import settings
+from src.infrastructure.database import DatabasePool
+from src.infrastructure.repositories import BookRepositoryImpl
+
+SCHEMA = "bench_export"
+
+EXPORT_QUERY = f"""
+    SELECT id, title, author_id, genre, published_year, isbn, description, created_at, updated_at
+    FROM {SCHEMA}.books
+    ORDER BY created_at DESC, id DESC
+"""
+
+
+def database_url() -> str:
+    return str(settings.database_url.unicode_string()).replace(
+        "postgresql+asyncpg://", "postgresql://"
+    )
+
+
+async def seed(rows: int) -> None:
+    connection = await asyncpg.connect(database_url())
+    try:
+        await connection.execute(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE")
+        await connection.execute(f"CREATE SCHEMA {SCHEMA}")
+        await connection.execute(
+            f"""
+            CREATE TABLE {SCHEMA}.books AS
+            SELECT i AS id,
+                   'Benchmark Book ' || i AS title,
+                   1 + i % 1000 AS author_id,
+                   (ARRAY['Fiction', 'Science', 'History', 'Poetry'])[1 + i % 4] AS genre,
+                   1900 + i % 120 AS published_year,
+                   CASE WHEN i % 3 = 0 THEN NULL ELSE '978-' || i END AS isbn,
+                   repeat(md5(i::text), 4) AS description,
+                   now() - i * interval '1 second' AS created_at,
+                   now() AS updated_at
+            FROM generate_series(1, $1) AS i
+            """,
+            rows,
+        )
+    finally:
+        await connection.close()
+
+
+async def drop() -> None:
+    connection = await asyncpg.connect(database_url())
+    try:
+        await connection.execute(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE")
+    finally:
+        await connection.close()
+
+
+async def export_legacy() -> tuple[int, int]:
+    async with DatabasePool.acquire() as connection:
+        rows = await connection.fetch(EXPORT_QUERY)
+    books = [BookRepositoryImpl._row_to_book(row) for row in rows]
+
+    output = StringIO()
+    writer = csv.writer(output)
+    writer.writerow(["id", "title", "author_id", "genre", "published_year", "isbn", "description"])
+    for book in books:
+        writer.writerow([
+            book.id,
+            book.title,
+            book.author_id,
+            book.genre.value,
+            book.published_year,
+            book.isbn or "",
+            book.description or "",
+        ])
+    return len(books), len(output.getvalue().encode("utf-8"))
+
+
+async def export_copy() -> tuple[int, int]:
+    query = f"""
+        SELECT id, title, author_id, genre, published_year, isbn, description
+        FROM ({EXPORT_QUERY}) AS books
+    """
+    size = 0
+    lines = 0
+    async for chunk in DatabasePool.copy_out(query, format="csv", header=True):
+        size += len(chunk)
+        lines += chunk.count(b"\n")
+    return lines - 1, size
+
+
+async def worker(mode: str) -> None:
+    await DatabasePool.initialize()
+    try:
+        started = time.perf_counter()
+        rows, size = await (export_copy() if mode == "copy" else export_legacy())
+        elapsed = time.perf_counter() - started
+    finally:
+        await DatabasePool.close()
+
+    print(json.dumps({
+        "mode": mode,
+        "rows": rows,
+        "bytes": size,
+        "seconds": elapsed,
+        "rows_per_second": rows / elapsed if elapsed else 0.0,
+        "max_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    }))
+
+
+def run_worker(mode: str) -> dict:
+    completed = subprocess.run(
+        [sys.executable, "-m", "benchmarks.csv_export", "--worker", mode],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark CSV export throughput")
+    parser.add_argument("--rows", type=int, default=500_000)
+    parser.add_argument("--worker", choices=["legacy", "copy"], help=argparse.SUPPRESS)
+    parser.add_argument("--keep", action="store_true", help="Keep the seeded schema")
+    args = parser.parse_args()
+
+    if args.worker:
+        asyncio.run(worker(args.worker))
+        return
+
+    print(f"Seeding {args.rows} rows into {SCHEMA}.books ...")
+    asyncio.run(seed(args.rows))
+    try:
+        results = [run_worker("legacy"), run_worker("copy")]
+    finally:
+        if not args.keep:
+            asyncio.run(drop())
+
+    print(f"{'exporter':<10}{'rows':>10}{'MB':>10}{'seconds':>10}{'rows/s':>12}{'max RSS MB':>12}")
+    for result in results:
+        print(
+            f"{result['mode']:<10}{result['rows']:>10}{result['bytes'] / 2**20:>10.1f}"
+            f"{result['seconds']:>10.2f}{result['rows_per_second']:>12.0f}"
+            f"{result['max_rss_mb']:>12.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
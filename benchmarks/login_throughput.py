@@ -0,0 +1,121 @@
+import argparse
+import asyncio
+import statistics
+import time
+import uuid
+
+from httpx import ASGITransport, AsyncClient
+
+from src.core import security
+from src.domain.services import auth_service
+from src.infrastructure.database import DatabasePool
+from src.main import app
+
+PASSWORD = "BenchPassword1"
+PROBE_INTERVAL = 0.01
+
+
+async def inline_verify_password(plain_password: str, hashed_password: str) -> bool:
+    return security.verify_password(plain_password, hashed_password)
+
+
+def percentile(samples: list[float], fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+async def register(client: AsyncClient) -> str:
+    username = f"bench_{uuid.uuid4().hex[:12]}"
+    response = await client.post(
+        "/api/v1/auth/register",
+        json={"email": f"{username}@example.com", "username": username, "password": PASSWORD},
+    )
+    response.raise_for_status()
+    return username
+
+
+async def login_burst(client: AsyncClient, username: str, logins: int, concurrency: int) -> float:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def login() -> None:
+        async with semaphore:
+            response = await client.post(
+                "/api/v1/auth/login", data={"username": username, "password": PASSWORD}
+            )
+            response.raise_for_status()
+
+    started = time.perf_counter()
+    await asyncio.gather(*(login() for _ in range(logins)))
+    return time.perf_counter() - started
+
+
+async def probe(client: AsyncClient, done: asyncio.Event, samples: list[float]) -> None:
+    loop = asyncio.get_running_loop()
+    scheduled = loop.time()
+    while not done.is_set():
+        scheduled += PROBE_INTERVAL
+        await asyncio.sleep(max(0.0, scheduled - loop.time()))
+        response = await client.get("/health")
+        response.raise_for_status()
+        samples.append((loop.time() - scheduled) * 1000)
+        scheduled = max(scheduled, loop.time())
+
+
+async def run(mode: str, logins: int, concurrency: int) -> dict:
+    if mode == "inline":
+        auth_service.verify_password_async = inline_verify_password
+    else:
+        auth_service.verify_password_async = security.verify_password_async
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://bench") as client:
+        username = await register(client)
+        done = asyncio.Event()
+        samples: list[float] = []
+        prober = asyncio.create_task(probe(client, done, samples))
+        elapsed = await login_burst(client, username, logins, concurrency)
+        done.set()
+        await prober
+
+    return {
+        "mode": mode,
+        "logins_per_second": logins / elapsed,
+        "health_requests": len(samples),
+        "health_p50_ms": statistics.median(samples),
+        "health_p99_ms": percentile(samples, 0.99),
+        "health_max_ms": max(samples),
+    }
+
+
+async def main_async(logins: int, concurrency: int) -> list[dict]:
+    await DatabasePool.initialize()
+    try:
+        return [
+            await run("inline", logins, concurrency),
+            await run("executor", logins, concurrency),
+        ]
+    finally:
+        await DatabasePool.close()
+        security.shutdown_password_executor()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Measure /health latency while logins run concurrently"
+    )
+    parser.add_argument("--logins", type=int, default=64)
+    parser.add_argument("--concurrency", type=int, default=16)
+    args = parser.parse_args()
+
+    results = asyncio.run(main_async(args.logins, args.concurrency))
+
+    print(f"{'hashing':<10}{'logins/s':>10}{'probes':>8}{'p50 ms':>10}{'p99 ms':>10}{'max ms':>10}")
+    for result in results:
+        print(
+            f"{result['mode']:<10}{result['logins_per_second']:>10.1f}"
+            f"{result['health_requests']:>8}{result['health_p50_ms']:>10.2f}"
+            f"{result['health_p99_ms']:>10.2f}{result['health_max_ms']:>10.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
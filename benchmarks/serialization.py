@@ -0,0 +1,97 @@
+import argparse
+import asyncio
+import json
+import time
+from typing import Callable
+
+import asyncpg
+import orjson
+
+from src.api.v1.schemas import BookPagination, BookResponse
+from src.infrastructure.database import DatabasePool
+from src.infrastructure.repositories import BookRepositoryImpl
+from src.infrastructure.repositories.book_repository_impl import BOOK_COLUMNS
+
+ROWS_QUERY = """
+    SELECT i AS id,
+           'Benchmark Book ' || i AS title,
+           1 + i % 1000 AS author_id,
+           (ARRAY['Fiction', 'Science', 'History', 'Poetry'])[1 + i % 4] AS genre,
+           1900 + i % 120 AS published_year,
+           CASE WHEN i % 3 = 0 THEN NULL ELSE '978-' || i END AS isbn,
+           repeat(md5(i::text), 4) AS description,
+           now()::timestamp - i * interval '1 second' AS created_at,
+           now()::timestamp AS updated_at
+    FROM generate_series(1, $1) AS i
+"""
+
+
+def page_envelope(items: list) -> dict:
+    return {
+        "items": items,
+        "total": len(items),
+        "page": 1,
+        "size": len(items),
+        "pages": 1,
+        "has_next": False,
+        "next_cursor": None,
+        "count_mode": "exact",
+    }
+
+
+def serialize_legacy(rows: list[asyncpg.Record]) -> bytes:
+    books = [BookRepositoryImpl._row_to_book(row) for row in rows]
+    page = BookPagination(**page_envelope([BookResponse.model_validate(book) for book in books]))
+    return json.dumps(
+        page.model_dump(mode="json"),
+        ensure_ascii=False,
+        allow_nan=False,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+def serialize_fast(rows: list[asyncpg.Record]) -> bytes:
+    items = [{column: row[column] for column in BOOK_COLUMNS} for row in rows]
+    return orjson.dumps(page_envelope(items))
+
+
+def measure(serializer: Callable[[list], bytes], rows: list, repeat: int) -> tuple[float, int]:
+    serializer(rows)
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        body = serializer(rows)
+        best = min(best, time.perf_counter() - started)
+    return best, len(body)
+
+
+async def fetch_rows(count: int) -> list[asyncpg.Record]:
+    await DatabasePool.initialize()
+    try:
+        async with DatabasePool.acquire() as connection:
+            return await connection.fetch(ROWS_QUERY, count)
+    finally:
+        await DatabasePool.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare per-row cost of list response serialization")
+    parser.add_argument("--rows", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    rows = asyncio.run(fetch_rows(args.rows))
+    if orjson.loads(serialize_legacy(rows)) != orjson.loads(serialize_fast(rows)):
+        raise SystemExit("Serializers disagree on the response body")
+
+    print(f"{'serializer':<12}{'rows':>8}{'bytes':>10}{'total ms':>10}{'us/row':>10}")
+    for name, serializer in (("legacy", serialize_legacy), ("orjson", serialize_fast)):
+        seconds, size = measure(serializer, rows, args.repeat)
+        print(
+            f"{name:<12}{len(rows):>8}{size:>10}{seconds * 1000:>10.3f}"
+            f"{seconds * 1_000_000 / len(rows):>10.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+import argparse
+import asyncio
+import json
+from typing import Any, List
+
+import asyncpg
+
+from src.core.config import settings
+
+SCHEMA = "bench_trigram"
+
+WORDS = [
+    "shadow", "river", "empire", "garden", "winter", "silent", "crimson", "journey",
+    "ocean", "forgotten", "kingdom", "midnight", "letters", "glass", "mountain", "secret",
+    "storm", "daughter", "iron", "summer", "house", "stars", "wolf", "memory",
+    "city", "broken", "golden", "night", "fire", "island", "history", "science",
+]
+
+QUERIES = {
+    "lower_like": "SELECT id FROM {schema}.books WHERE LOWER(title) LIKE LOWER($1)",
+    "ilike": "SELECT id FROM {schema}.books WHERE title ILIKE $1",
+}
+
+
+def database_url() -> str:
+    return str(settings.database_url.unicode_string()).replace(
+        "postgresql+asyncpg://", "postgresql://"
+    )
+
+
+async def seed(connection: asyncpg.Connection, rows: int) -> None:
+    await connection.execute(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE")
+    await connection.execute(f"CREATE SCHEMA {SCHEMA}")
+    await connection.execute(
+        f"""
+        CREATE TABLE {SCHEMA}.books (
+            id SERIAL PRIMARY KEY,
+            title VARCHAR(500) NOT NULL
+        )
+        """
+    )
+    await connection.execute(
+        f"""
+        INSERT INTO {SCHEMA}.books (title)
+        SELECT initcap(w[1 + (i * 7) % n]) || ' ' || w[1 + (i * 13) % n] || ' '
+               || w[1 + (i * 31 / 7) % n] || ' ' || substr(md5(i::text), 1, 6)
+        FROM generate_series(1, $2) AS i,
+             LATERAL (SELECT $1::text[] AS w, array_length($1::text[], 1) AS n) AS words
+        """,
+        WORDS,
+        rows,
+    )
+    await connection.execute(f"CREATE INDEX ON {SCHEMA}.books (title)")
+    await connection.execute(f"ANALYZE {SCHEMA}.books")
+
+
+async def explain(connection: asyncpg.Connection, query: str, *args: Any) -> dict:
+    plan = await connection.fetchval(f"EXPLAIN (ANALYZE, FORMAT JSON) {query}", *args)
+    result = json.loads(plan)[0]
+    return {
+        "ms": result["Execution Time"],
+        "node": result["Plan"]["Node Type"],
+        "rows": result["Plan"]["Actual Rows"],
+    }
+
+
+async def measure(
+    connection: asyncpg.Connection, patterns: List[str], repeats: int
+) -> dict:
+    results = {}
+    for pattern in patterns:
+        for name, template in QUERIES.items():
+            query = template.format(schema=SCHEMA)
+            runs = [await explain(connection, query, f"%{pattern}%") for _ in range(repeats)]
+            best = min(runs, key=lambda run: run["ms"])
+            results[(pattern, name)] = best
+    return results
+
+
+async def run(rows: int, repeats: int, patterns: List[str], keep: bool) -> None:
+    connection = await asyncpg.connect(database_url())
+    try:
+        available = await connection.fetchval(
+            "SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'"
+        )
+        if not available:
+            raise SystemExit(
+                "pg_trgm is not available on this server; run the benchmark against a "
+                "server with the PostgreSQL contrib package installed"
+            )
+        await connection.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        print(f"Seeding {rows} rows into {SCHEMA}.books ...")
+        await seed(connection, rows)
+
+        before = await measure(connection, patterns, repeats)
+
+        await connection.execute(
+            f"CREATE INDEX books_title_trgm ON {SCHEMA}.books USING GIN (title gin_trgm_ops)"
+        )
+        await connection.execute(f"ANALYZE {SCHEMA}.books")
+        after = await measure(connection, patterns, repeats)
+
+        print(f"{'pattern':<14}{'query':<12}{'btree only':>22}{'with pg_trgm GIN':>32}")
+        for (pattern, name), plain in before.items():
+            indexed = after[(pattern, name)]
+            print(
+                f"{pattern:<14}{name:<12}"
+                f"{plain['ms']:>10.2f} ms {plain['node']:<10}"
+                f"{indexed['ms']:>10.2f} ms {indexed['node']:<20}"
+                f"rows={indexed['rows']}"
+            )
+    finally:
+        if not keep:
+            await connection.execute(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE")
+        await connection.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark substring title search")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--pattern", action="append", dest="patterns")
+    parser.add_argument("--keep", action="store_true", help="Keep the seeded schema")
+    args = parser.parse_args()
+
+    patterns = args.patterns or ["midnight", "wolf", "forgotten kin", "a3f9"]
+    asyncio.run(run(args.rows, args.repeats, patterns, args.keep))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,27 @@
-from .auth import get_auth_service, get_current_active_user, get_current_user
+from .auth import (
+    get_auth_service,
+    get_current_active_user,
+    get_current_superuser,
+    get_current_user,
+)
+from .database import use_batch_workload
+from .conditional import body_etag, is_not_modified, make_etag, not_modified, validator_headers
+from .responses import get_author_responses, get_book_responses
 from .services import get_author_service, get_book_service
 
 __all__ = [
     "get_book_service",
     "get_author_service",
+    "get_book_responses",
+    "get_author_responses",
     "get_auth_service",
     "get_current_user",
     "get_current_active_user",
+    "get_current_superuser",
+    "make_etag",
+    "body_etag",
+    "is_not_modified",
+    "not_modified",
+    "validator_headers",
+    "use_batch_workload",
 ]
\ No newline at end of file
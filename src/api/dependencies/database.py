@@ -0,0 +1,5 @@
+from src.infrastructure.database import BATCH, DatabasePool
+
+
+async def use_batch_workload() -> None:
+    DatabasePool.use_workload(BATCH)
@@ -0,0 +1,13 @@
+from src.infrastructure.cache import ResponseCache
+from src.infrastructure.repositories import AuthorRepositoryImpl, BookRepositoryImpl
+
+_book_responses = ResponseCache(BookRepositoryImpl.cache)
+_author_responses = ResponseCache(AuthorRepositoryImpl.cache)
+
+
+async def get_book_responses() -> ResponseCache:
+    return _book_responses
+
+
+async def get_author_responses() -> ResponseCache:
+    return _author_responses
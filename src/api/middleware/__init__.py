@@ -1,3 +1,7 @@
+from .database_routing import DatabaseRoutingMiddleware
+from .profiling import ProfilingMiddleware
+from .server_timing import ServerTimingMiddleware
+from .tracing import TracingMiddleware
 from .exception_handler import (
     domain_exception_handler,
     http_exception_handler,
@@ -5,6 +9,10 @@ from .exception_handler import (
 )
 
 __all__ = [
+    "DatabaseRoutingMiddleware",
+    "ProfilingMiddleware",
+    "ServerTimingMiddleware",
+    "TracingMiddleware",
     "domain_exception_handler",
     "validation_exception_handler",
     "http_exception_handler",
@@ -0,0 +1,16 @@
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from src.infrastructure.database import DatabasePool
+
+
+class DatabaseRoutingMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        with DatabasePool.request_scope():
+            await self.app(scope, receive, send)
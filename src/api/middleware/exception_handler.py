@@ -8,6 +8,7 @@ from src.core.exceptions import (
     DomainException,
     ForbiddenException,
     NotFoundException,
+    ServiceUnavailableException,
     UnauthorizedException,
     ValidationException,
 )
@@ -26,6 +27,8 @@ async def domain_exception_handler(request: Request, exc: DomainException) -> JS
         status_code = status.HTTP_401_UNAUTHORIZED
     elif isinstance(exc, ForbiddenException):
         status_code = status.HTTP_403_FORBIDDEN
+    elif isinstance(exc, ServiceUnavailableException):
+        status_code = status.HTTP_503_SERVICE_UNAVAILABLE
     
     return JSONResponse(
         status_code=status_code,
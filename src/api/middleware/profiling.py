@@ -0,0 +1,86 @@
+import asyncio
+import cProfile
+import hmac
+import logging
+import random
+import time
+import tracemalloc
+import uuid
+from datetime import datetime, timezone
+from typing import Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.core.config import settings
+from src.infrastructure.profiling import ProfileStore
+
+logger = logging.getLogger(__name__)
+
+PROFILE_HEADER = "x-debug-profile"
+
+
+class ProfilingMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+        self._active = False
+        self._last_started = 0.0
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not settings.profiling_enabled or not self._should_profile(scope):
+            await self.app(scope, receive, send)
+            return
+        
+        self._active = True
+        self._last_started = time.monotonic()
+        profile_id = f"{datetime.now(timezone.utc):%Y%m%dT%H%M%S}-{uuid.uuid4().hex[:8]}"
+        status_code: Optional[int] = None
+        
+        async def send_with_profile(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                MutableHeaders(scope=message).append("X-Profile-Id", profile_id)
+            await send(message)
+        
+        owns_tracemalloc = not tracemalloc.is_tracing()
+        if owns_tracemalloc:
+            tracemalloc.start()
+        before = tracemalloc.take_snapshot()
+        profiler = cProfile.Profile()
+        started = time.perf_counter()
+        profiler.enable()
+        try:
+            await self.app(scope, receive, send_with_profile)
+        finally:
+            profiler.disable()
+            duration = time.perf_counter() - started
+            allocations = tracemalloc.take_snapshot().compare_to(before, "lineno")
+            if owns_tracemalloc:
+                tracemalloc.stop()
+            try:
+                await asyncio.to_thread(
+                    ProfileStore.save,
+                    profile_id,
+                    scope["method"],
+                    scope["path"],
+                    status_code,
+                    duration,
+                    profiler,
+                    allocations,
+                )
+            except OSError:
+                logger.exception("Could not save profile %s", profile_id)
+            finally:
+                self._active = False
+    
+    def _should_profile(self, scope: Scope) -> bool:
+        token = settings.profiling_token
+        supplied = Headers(scope=scope).get(PROFILE_HEADER)
+        if not token or supplied is None or self._active:
+            return False
+        if not hmac.compare_digest(supplied.encode(), token.encode()):
+            return False
+        if time.monotonic() - self._last_started < settings.profiling_min_interval:
+            return False
+        return random.random() < settings.profiling_sample_rate
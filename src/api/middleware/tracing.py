@@ -0,0 +1,35 @@
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.core.config import settings
+from src.core.tracing import start_trace
+
+
+class TracingMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not settings.tracing_enabled:
+            await self.app(scope, receive, send)
+            return
+        
+        method = scope["method"]
+        with start_trace(f"{method} {scope['path']}", method=method, path=scope["path"]) as root:
+            if root is None:
+                await self.app(scope, receive, send)
+                return
+            
+            async def send_with_trace(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    root.attributes["status_code"] = message["status"]
+                    MutableHeaders(scope=message).append("X-Trace-Id", root.trace_id)
+                await send(message)
+            
+            try:
+                await self.app(scope, receive, send_with_trace)
+            finally:
+                route = scope.get("route")
+                if route is not None:
+                    root.name = f"{method} {route.path}"
+                    root.attributes["endpoint"] = route.name
@@ -1,5 +1,6 @@
 from fastapi import APIRouter
 
+from .admin import router as admin_router
 from .auth import router as auth_router
 from .authors import router as authors_router
 from .books import router as books_router
@@ -10,4 +11,5 @@ api_router = APIRouter()
 api_router.include_router(auth_router)
 api_router.include_router(books_router)
 api_router.include_router(authors_router)
-api_router.include_router(import_export_router)
\ No newline at end of file
+api_router.include_router(import_export_router)
+api_router.include_router(admin_router)
\ No newline at end of file
@@ -0,0 +1,56 @@
+import asyncio
+from dataclasses import asdict
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import PlainTextResponse
+
+from src.api.dependencies import get_current_superuser
+from src.api.v1.schemas import LoopBlockResponse, ProfileSummary, SpanResponse, TraceList
+from src.core.config import settings
+from src.core.tracing import exporter
+from src.infrastructure.metrics import LoopMonitor
+from src.infrastructure.profiling import ProfileStore
+
+router = APIRouter(
+    prefix="/admin",
+    tags=["admin"],
+    dependencies=[Depends(get_current_superuser)],
+)
+
+
+@router.get("/traces", response_model=TraceList)
+async def get_traces(limit: int = Query(20, ge=1, le=1000)) -> TraceList:
+    return TraceList(
+        enabled=settings.tracing_enabled,
+        traces=[[SpanResponse(**span) for span in trace] for trace in exporter.recent(limit)],
+    )
+
+
+@router.get("/loop-blocks", response_model=list[LoopBlockResponse])
+async def get_loop_blocks(limit: int = Query(20, ge=1, le=1000)) -> list[LoopBlockResponse]:
+    return [
+        LoopBlockResponse(
+            detected_at=block.detected_at,
+            duration_ms=block.duration * 1000,
+            task=block.task,
+            stack=block.stack,
+        )
+        for block in LoopMonitor.blocks(limit)
+    ]
+
+
+@router.get("/profiles", response_model=list[ProfileSummary])
+async def get_profiles() -> list[ProfileSummary]:
+    records = await asyncio.to_thread(ProfileStore.list)
+    return [ProfileSummary(**asdict(record)) for record in records]
+
+
+@router.get("/profiles/{profile_id}", response_class=PlainTextResponse)
+async def get_profile_report(profile_id: str) -> PlainTextResponse:
+    report = await asyncio.to_thread(ProfileStore.report, profile_id)
+    if report is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Profile {profile_id} not found",
+        )
+    return PlainTextResponse(report)
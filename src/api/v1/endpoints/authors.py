@@ -1,8 +1,18 @@
-from typing import Annotated, Optional
+from typing import Annotated, Optional, Union
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import ORJSONResponse
 
-from src.api.dependencies import get_author_service, get_current_active_user
+from src.api.dependencies import (
+    body_etag,
+    get_author_responses,
+    get_author_service,
+    get_current_active_user,
+    is_not_modified,
+    make_etag,
+    not_modified,
+    validator_headers,
+)
 from src.api.v1.schemas import (
     AuthorCreate,
     AuthorPagination,
@@ -10,8 +20,10 @@ from src.api.v1.schemas import (
     AuthorUpdate,
 )
 from src.core.exceptions import ConflictException, NotFoundException, ValidationException
+from src.core.pagination import CountMode
 from src.domain.entities import Author, User
 from src.domain.services import AuthorService
+from src.infrastructure.cache import ResponseCache
 
 router = APIRouter(prefix="/authors", tags=["authors"])
 
@@ -42,38 +54,63 @@ async def create_author(
 
 @router.get("/", response_model=AuthorPagination)
 async def get_authors(
+    request: Request,
+    author_service: Annotated[AuthorService, Depends(get_author_service)],
     page: Annotated[int, Query(ge=1)] = 1,
     size: Annotated[int, Query(ge=1, le=100)] = 50,
     name: Optional[str] = None,
     nationality: Optional[str] = None,
-    author_service: Annotated[AuthorService, Depends(get_author_service)] = None,
-) -> AuthorPagination:
-    result = await author_service.get_authors(
+    count: CountMode = CountMode.EXACT,
+) -> Union[AuthorPagination, Response]:
+    result = await author_service.get_author_rows(
         page=page,
         size=size,
         name=name,
         nationality=nationality,
+        count=count,
     )
     
-    return AuthorPagination(
-        items=[AuthorResponse.model_validate(author) for author in result["items"]],
-        total=result["total"],
-        page=result["page"],
-        size=result["size"],
-        pages=result["pages"],
-    )
+    response = ORJSONResponse(result)
+    etag = body_etag(response.body)
+    if is_not_modified(request, etag, None):
+        return not_modified(etag, None)
+    response.headers.update(validator_headers(etag, None))
+    return response
 
 
 @router.get("/{author_id}", response_model=AuthorResponse)
 async def get_author(
     author_id: int,
+    request: Request,
+    response: Response,
     author_service: Annotated[AuthorService, Depends(get_author_service)],
-) -> AuthorResponse:
+    responses: Annotated[ResponseCache, Depends(get_author_responses)],
+) -> Union[AuthorResponse, Response]:
+    cached = responses.get(author_id)
+    if cached is not None:
+        updated_at, body = cached
+        etag = make_etag("author", author_id, updated_at)
+        if is_not_modified(request, etag, updated_at):
+            return not_modified(etag, updated_at)
+        return Response(
+            content=body,
+            media_type="application/json",
+            headers=validator_headers(etag, updated_at),
+        )
+    
     try:
         author = await author_service.get_author(author_id)
-        return AuthorResponse.model_validate(author)
     except NotFoundException as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    
+    etag = make_etag("author", author_id, author.updated_at)
+    if is_not_modified(request, etag, author.updated_at):
+        return not_modified(etag, author.updated_at)
+    
+    result = AuthorResponse.model_validate(author)
+    responses.put(author_id, author.updated_at, result.model_dump_json().encode())
+    response.headers.update(validator_headers(etag, author.updated_at))
+    return result
 
 
 @router.put("/{author_id}", response_model=AuthorResponse)
@@ -1,18 +1,32 @@
-from typing import Annotated, Optional
+from typing import Annotated, Optional, Union
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import ORJSONResponse
 
-from src.api.dependencies import get_book_service, get_current_active_user
+from src.api.dependencies import (
+    body_etag,
+    get_book_responses,
+    get_book_service,
+    get_current_active_user,
+    is_not_modified,
+    make_etag,
+    not_modified,
+    use_batch_workload,
+    validator_headers,
+)
 from src.api.v1.schemas import (
     BookBulkCreate,
+    BookBulkResult,
     BookCreate,
     BookPagination,
     BookResponse,
     BookUpdate,
 )
 from src.core.exceptions import ConflictException, NotFoundException, ValidationException
+from src.core.pagination import CountMode
 from src.domain.entities import Book, Genre, User
 from src.domain.services import BookService
+from src.infrastructure.cache import ResponseCache
 
 router = APIRouter(prefix="/books", tags=["books"])
 
@@ -45,6 +59,8 @@ async def create_book(
 
 @router.get("/", response_model=BookPagination)
 async def get_books(
+    request: Request,
+    book_service: Annotated[BookService, Depends(get_book_service)],
     page: Annotated[int, Query(ge=1)] = 1,
     size: Annotated[int, Query(ge=1, le=100)] = 50,
     title: Optional[str] = None,
@@ -54,19 +70,57 @@ async def get_books(
     year_to: Optional[int] = None,
     sort_by: Optional[str] = Query(None, pattern="^(title|published_year|created_at|updated_at)$"),
     order: Annotated[str, Query(pattern="^(asc|desc)$")] = "asc",
-    book_service: Annotated[BookService, Depends(get_book_service)] = None,
+    cursor: Optional[str] = None,
+    count: CountMode = CountMode.EXACT,
+) -> Union[BookPagination, Response]:
+    try:
+        result = await book_service.get_book_rows(
+            page=page,
+            size=size,
+            title=title,
+            author_id=author_id,
+            genre=genre.value if genre else None,
+            year_from=year_from,
+            year_to=year_to,
+            sort_by=sort_by,
+            order=order,
+            cursor=cursor,
+            count=count,
+        )
+    except ValidationException as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    
+    response = ORJSONResponse(result)
+    etag = body_etag(response.body)
+    if is_not_modified(request, etag, None):
+        return not_modified(etag, None)
+    response.headers.update(validator_headers(etag, None))
+    return response
+
+
+@router.get("/search", response_model=BookPagination)
+async def search_books(
+    book_service: Annotated[BookService, Depends(get_book_service)],
+    q: Annotated[str, Query(min_length=1, max_length=500)],
+    page: Annotated[int, Query(ge=1)] = 1,
+    size: Annotated[int, Query(ge=1, le=100)] = 50,
+    author_id: Optional[int] = None,
+    genre: Optional[Genre] = None,
+    year_from: Optional[int] = None,
+    year_to: Optional[int] = None,
 ) -> BookPagination:
-    result = await book_service.get_books(
-        page=page,
-        size=size,
-        title=title,
-        author_id=author_id,
-        genre=genre.value if genre else None,
-        year_from=year_from,
-        year_to=year_to,
-        sort_by=sort_by,
-        order=order,
-    )
+    try:
+        result = await book_service.search_books(
+            query=q,
+            page=page,
+            size=size,
+            author_id=author_id,
+            genre=genre.value if genre else None,
+            year_from=year_from,
+            year_to=year_to,
+        )
+    except ValidationException as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     
     return BookPagination(
         items=[BookResponse.model_validate(book) for book in result["items"]],
@@ -74,19 +128,44 @@ async def get_books(
         page=result["page"],
         size=result["size"],
         pages=result["pages"],
+        has_next=result["has_next"],
+        count_mode=result["count_mode"],
     )
 
 
 @router.get("/{book_id}", response_model=BookResponse)
 async def get_book(
     book_id: int,
+    request: Request,
+    response: Response,
     book_service: Annotated[BookService, Depends(get_book_service)],
-) -> BookResponse:
+    responses: Annotated[ResponseCache, Depends(get_book_responses)],
+) -> Union[BookResponse, Response]:
+    cached = responses.get(book_id)
+    if cached is not None:
+        updated_at, body = cached
+        etag = make_etag("book", book_id, updated_at)
+        if is_not_modified(request, etag, updated_at):
+            return not_modified(etag, updated_at)
+        return Response(
+            content=body,
+            media_type="application/json",
+            headers=validator_headers(etag, updated_at),
+        )
+    
     try:
         book = await book_service.get_book(book_id)
-        return BookResponse.model_validate(book)
     except NotFoundException as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    
+    etag = make_etag("book", book_id, book.updated_at)
+    if is_not_modified(request, etag, book.updated_at):
+        return not_modified(etag, book.updated_at)
+    
+    result = BookResponse.model_validate(book)
+    responses.put(book_id, book.updated_at, result.model_dump_json().encode())
+    response.headers.update(validator_headers(etag, book.updated_at))
+    return result
 
 
 @router.put("/{book_id}", response_model=BookResponse)
@@ -130,12 +209,18 @@ async def delete_book(
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
 
 
-@router.post("/bulk", response_model=list[BookResponse], status_code=status.HTTP_201_CREATED)
+@router.post(
+    "/bulk",
+    response_model=Union[list[BookResponse], BookBulkResult],
+    status_code=status.HTTP_201_CREATED,
+    dependencies=[Depends(use_batch_workload)],
+)
 async def bulk_create_books(
     bulk_data: BookBulkCreate,
     book_service: Annotated[BookService, Depends(get_book_service)],
     current_user: Annotated[User, Depends(get_current_active_user)],
-) -> list[BookResponse]:
+    returning: bool = True,
+) -> Union[list[BookResponse], BookBulkResult]:
     try:
         books = [
             Book(
@@ -151,6 +236,10 @@ async def bulk_create_books(
             )
             for book_data in bulk_data.books
         ]
+        if not returning:
+            created = await book_service.bulk_insert_books(books)
+            return BookBulkResult(created=created)
+        
         created_books = await book_service.bulk_create_books(books)
         return [BookResponse.model_validate(book) for book in created_books]
     except ValidationException as e:
@@ -1,27 +1,45 @@
 import csv
 import json
+import logging
 from io import StringIO
-from typing import Annotated
+from typing import Annotated, Any, AsyncIterator, Iterator, Mapping, Optional
 
-from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, status
+import orjson
+
+from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile, status
 from fastapi.responses import StreamingResponse
 
-from src.api.dependencies import get_book_service, get_current_active_user
-from src.api.v1.schemas import BookResponse
+from src.api.dependencies import get_book_service, get_current_active_user, use_batch_workload
+from src.api.v1.schemas import BookResponse, ImportBatchResult, ImportReport
+from src.core.config import settings
 from src.core.exceptions import ConflictException, ValidationException
 from src.domain.entities import Book, Genre, User
 from src.domain.services import BookService
+from src.infrastructure.importers import JsonArrayReader, csv_rows, iter_batches
+
+logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/import-export", tags=["import-export"])
+EXPORT_FIELDS = ("id", "title", "author_id", "genre", "published_year", "isbn", "description")
 
+router = APIRouter(
+    prefix="/import-export",
+    tags=["import-export"],
+    dependencies=[Depends(use_batch_workload)],
+)
 
-@router.post("/import/json", response_model=list[BookResponse], status_code=status.HTTP_201_CREATED)
+
+@router.post(
+    "/import/json",
+    response_model=list[BookResponse],
+    status_code=status.HTTP_201_CREATED,
+    deprecated=True,
+)
 async def import_books_json(
+    book_service: Annotated[BookService, Depends(get_book_service)],
+    current_user: Annotated[User, Depends(get_current_active_user)],
     file: UploadFile = File(...),
-    book_service: Annotated[BookService, Depends(get_book_service)] = None,
-    current_user: Annotated[User, Depends(get_current_active_user)] = None,
 ) -> list[BookResponse]:
-    if not file.filename.endswith('.json'):
+    if not (file.filename or "").endswith('.json'):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="File must be JSON format"
@@ -74,13 +92,18 @@ async def import_books_json(
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
 
 
-@router.post("/import/csv", response_model=list[BookResponse], status_code=status.HTTP_201_CREATED)
+@router.post(
+    "/import/csv",
+    response_model=list[BookResponse],
+    status_code=status.HTTP_201_CREATED,
+    deprecated=True,
+)
 async def import_books_csv(
+    book_service: Annotated[BookService, Depends(get_book_service)],
+    current_user: Annotated[User, Depends(get_current_active_user)],
     file: UploadFile = File(...),
-    book_service: Annotated[BookService, Depends(get_book_service)] = None,
-    current_user: Annotated[User, Depends(get_current_active_user)] = None,
 ) -> list[BookResponse]:
-    if not file.filename.endswith('.csv'):
+    if not (file.filename or "").endswith('.csv'):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="File must be CSV format"
@@ -128,62 +151,216 @@ async def import_books_csv(
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
 
 
+@router.post("/import/json/stream", response_model=ImportReport, status_code=status.HTTP_201_CREATED)
+async def import_books_json_stream(
+    book_service: Annotated[BookService, Depends(get_book_service)],
+    current_user: Annotated[User, Depends(get_current_active_user)],
+    file: UploadFile = File(...),
+    batch_size: Annotated[int, Query(ge=1, le=10000)] = settings.import_batch_size,
+) -> ImportReport:
+    if not (file.filename or "").endswith('.json'):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="File must be JSON format"
+        )
+    
+    return await _import_in_batches(JsonArrayReader(file.file), batch_size, book_service)
+
+
+@router.post("/import/csv/stream", response_model=ImportReport, status_code=status.HTTP_201_CREATED)
+async def import_books_csv_stream(
+    book_service: Annotated[BookService, Depends(get_book_service)],
+    current_user: Annotated[User, Depends(get_current_active_user)],
+    file: UploadFile = File(...),
+    batch_size: Annotated[int, Query(ge=1, le=10000)] = settings.import_batch_size,
+) -> ImportReport:
+    if not (file.filename or "").endswith('.csv'):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="File must be CSV format"
+        )
+    
+    return await _import_in_batches(csv_rows(file.file), batch_size, book_service)
+
+
 @router.get("/export/json")
 async def export_books_json(
     book_service: Annotated[BookService, Depends(get_book_service)],
+    title: Optional[str] = None,
+    author_id: Optional[int] = None,
+    genre: Optional[Genre] = None,
+    year_from: Optional[int] = None,
+    year_to: Optional[int] = None,
+    sort_by: Optional[str] = Query(None, pattern="^(title|published_year|created_at|updated_at)$"),
+    order: Annotated[str, Query(pattern="^(asc|desc)$")] = "asc",
 ) -> StreamingResponse:
-    result = await book_service.get_books(page=1, size=10000)
-    books = result["items"]
-    
-    export_data = [
-        {
-            "id": book.id,
-            "title": book.title,
-            "author_id": book.author_id,
-            "genre": book.genre.value,
-            "published_year": book.published_year,
-            "isbn": book.isbn,
-            "description": book.description,
-        }
-        for book in books
-    ]
-    
-    json_str = json.dumps(export_data, indent=2, default=str)
+    chunks = book_service.stream_book_rows(
+        title=title,
+        author_id=author_id,
+        genre=genre.value if genre else None,
+        year_from=year_from,
+        year_to=year_to,
+        sort_by=sort_by,
+        order=order,
+    )
     
     return StreamingResponse(
-        StringIO(json_str),
+        _json_array_stream(chunks),
         media_type="application/json",
         headers={"Content-Disposition": "attachment; filename=books_export.json"}
     )
 
 
+@router.get("/export/ndjson")
+async def export_books_ndjson(
+    book_service: Annotated[BookService, Depends(get_book_service)],
+    title: Optional[str] = None,
+    author_id: Optional[int] = None,
+    genre: Optional[Genre] = None,
+    year_from: Optional[int] = None,
+    year_to: Optional[int] = None,
+    sort_by: Optional[str] = Query(None, pattern="^(title|published_year|created_at|updated_at)$"),
+    order: Annotated[str, Query(pattern="^(asc|desc)$")] = "asc",
+) -> StreamingResponse:
+    chunks = book_service.stream_book_rows(
+        title=title,
+        author_id=author_id,
+        genre=genre.value if genre else None,
+        year_from=year_from,
+        year_to=year_to,
+        sort_by=sort_by,
+        order=order,
+    )
+    
+    return StreamingResponse(
+        _ndjson_stream(chunks),
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": "attachment; filename=books_export.ndjson"}
+    )
+
+
 @router.get("/export/csv")
 async def export_books_csv(
     book_service: Annotated[BookService, Depends(get_book_service)],
+    title: Optional[str] = None,
+    author_id: Optional[int] = None,
+    genre: Optional[Genre] = None,
+    year_from: Optional[int] = None,
+    year_to: Optional[int] = None,
+    sort_by: Optional[str] = Query(None, pattern="^(title|published_year|created_at|updated_at)$"),
+    order: Annotated[str, Query(pattern="^(asc|desc)$")] = "asc",
 ) -> StreamingResponse:
-    result = await book_service.get_books(page=1, size=10000)
-    books = result["items"]
+    chunks = book_service.export_books_csv(
+        title=title,
+        author_id=author_id,
+        genre=genre.value if genre else None,
+        year_from=year_from,
+        year_to=year_to,
+        sort_by=sort_by,
+        order=order,
+    )
+    
+    return StreamingResponse(
+        chunks,
+        media_type="text/csv",
+        headers={"Content-Disposition": "attachment; filename=books_export.csv"}
+    )
+
+
+async def _import_in_batches(
+    rows: Iterator[Any],
+    batch_size: int,
+    book_service: BookService,
+) -> ImportReport:
+    report = ImportReport()
+    try:
+        async for batch in iter_batches(rows, batch_size):
+            first_row = report.total_rows + 1
+            report.total_rows += len(batch)
+            result = ImportBatchResult(
+                batch=len(report.batches) + 1,
+                first_row=first_row,
+                last_row=report.total_rows,
+                inserted=0,
+            )
+            
+            try:
+                books = [_parse_import_row(row, first_row + i) for i, row in enumerate(batch)]
+                result.inserted = await book_service.bulk_insert_books(
+                    books, row_offset=first_row - 1
+                )
+            except (ValidationException, ConflictException) as e:
+                result.error = str(e)
+                report.failed_rows += len(batch)
+            
+            report.inserted += result.inserted
+            report.batches.append(result)
+            logger.info(
+                "Import batch %d (rows %d-%d): inserted %d, %s",
+                result.batch,
+                result.first_row,
+                result.last_row,
+                result.inserted,
+                result.error or "ok",
+            )
+    except (ValueError, csv.Error) as e:
+        report.completed = False
+        report.error = f"Import stopped after row {report.total_rows}: {e}"
+    except Exception:
+        logger.exception("Import stopped after row %d", report.total_rows)
+        report.completed = False
+        report.error = f"Import stopped after row {report.total_rows}: the batch could not be written"
     
-    output = StringIO()
-    writer = csv.writer(output)
+    return report
+
+
+def _parse_import_row(row: Any, row_number: int) -> Book:
+    if not isinstance(row, dict):
+        raise ValidationException(f"Row {row_number}: expected an object")
     
-    writer.writerow(["id", "title", "author_id", "genre", "published_year", "isbn", "description"])
+    try:
+        genre = Genre(row.get("genre"))
+    except ValueError:
+        raise ValidationException(f"Row {row_number}: Invalid genre: {row.get('genre')}")
     
-    for book in books:
-        writer.writerow([
-            book.id,
-            book.title,
-            book.author_id,
-            book.genre.value,
-            book.published_year,
-            book.isbn or "",
-            book.description or "",
-        ])
+    try:
+        author_id = int(row["author_id"])
+        published_year = int(row["published_year"])
+    except (KeyError, TypeError, ValueError):
+        raise ValidationException(
+            f"Row {row_number}: author_id and published_year must be integers"
+        )
     
-    output.seek(0)
+    for field in ("title", "isbn", "description"):
+        if row.get(field) is not None and not isinstance(row[field], str):
+            raise ValidationException(f"Row {row_number}: {field} must be a string")
     
-    return StreamingResponse(
-        output,
-        media_type="text/csv",
-        headers={"Content-Disposition": "attachment; filename=books_export.csv"}
-    )
\ No newline at end of file
+    return Book(
+        id=None,
+        title=row.get("title") or "",
+        author_id=author_id,
+        genre=genre,
+        published_year=published_year,
+        isbn=row.get("isbn") or None,
+        description=row.get("description") or None,
+        created_at=None,
+        updated_at=None,
+    )
+
+
+def _export_item(row: Mapping[str, Any]) -> dict:
+    return {field: row[field] for field in EXPORT_FIELDS}
+
+
+async def _json_array_stream(chunks: AsyncIterator[list[Mapping[str, Any]]]) -> AsyncIterator[bytes]:
+    yield b"["
+    separator = b"\n"
+    async for chunk in chunks:
+        yield separator + b",\n".join(orjson.dumps(_export_item(row)) for row in chunk)
+        separator = b",\n"
+    yield b"\n]\n"
+
+
+async def _ndjson_stream(chunks: AsyncIterator[list[Mapping[str, Any]]]) -> AsyncIterator[bytes]:
+    async for chunk in chunks:
+        yield b"".join(orjson.dumps(_export_item(row)) + b"\n" for row in chunk)
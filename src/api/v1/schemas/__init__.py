@@ -1,3 +1,4 @@
+from .admin import LoopBlockResponse, ProfileSummary, SpanResponse, TraceList
 from .auth import Token, UserLogin, UserRegister, UserResponse
 from .author import (
     AuthorCreate,
@@ -7,11 +8,13 @@ from .author import (
 )
 from .book import (
     BookBulkCreate,
+    BookBulkResult,
     BookCreate,
     BookPagination,
     BookResponse,
     BookUpdate,
 )
+from .import_export import ImportBatchResult, ImportReport
 
 __all__ = [
     "BookCreate",
@@ -19,6 +22,9 @@ __all__ = [
     "BookResponse",
     "BookPagination",
     "BookBulkCreate",
+    "BookBulkResult",
+    "ImportBatchResult",
+    "ImportReport",
     "AuthorCreate",
     "AuthorUpdate",
     "AuthorResponse",
@@ -27,4 +33,8 @@ __all__ = [
     "UserLogin",
     "Token",
     "UserResponse",
+    "SpanResponse",
+    "ProfileSummary",
+    "LoopBlockResponse",
+    "TraceList",
 ]
\ No newline at end of file
@@ -0,0 +1,38 @@
+from datetime import datetime
+from typing import Any, Optional
+
+from pydantic import BaseModel
+
+
+class SpanResponse(BaseModel):
+    trace_id: str
+    span_id: str
+    parent_id: Optional[str] = None
+    name: str
+    layer: str
+    start: float
+    duration_ms: float
+    error: Optional[str] = None
+    attributes: dict[str, Any] = {}
+
+
+class TraceList(BaseModel):
+    enabled: bool
+    traces: list[list[SpanResponse]] = []
+
+
+class ProfileSummary(BaseModel):
+    id: str
+    method: str
+    path: str
+    status_code: Optional[int] = None
+    duration_ms: float
+    created_at: datetime
+    files: list[str]
+
+
+class LoopBlockResponse(BaseModel):
+    detected_at: datetime
+    duration_ms: float
+    task: Optional[str] = None
+    stack: list[str] = []
@@ -3,6 +3,8 @@ from typing import Optional
 
 from pydantic import BaseModel, Field, field_validator
 
+from src.core.pagination import CountMode
+
 
 class AuthorBase(BaseModel):
     name: str = Field(..., min_length=1, max_length=255)
@@ -37,7 +39,9 @@ class AuthorResponse(AuthorBase):
 
 class AuthorPagination(BaseModel):
     items: list[AuthorResponse]
-    total: int
+    total: Optional[int]
     page: int
     size: int
-    pages: int
\ No newline at end of file
+    pages: Optional[int]
+    has_next: bool = False
+    count_mode: CountMode = CountMode.EXACT
\ No newline at end of file
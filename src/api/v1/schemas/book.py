@@ -3,6 +3,7 @@ from typing import Optional
 
 from pydantic import BaseModel, Field, field_validator
 
+from src.core.pagination import CountMode
 from src.domain.entities import Genre
 
 
@@ -49,11 +50,18 @@ class BookResponse(BookBase):
 
 class BookPagination(BaseModel):
     items: list[BookResponse]
-    total: int
+    total: Optional[int]
     page: int
     size: int
-    pages: int
+    pages: Optional[int]
+    has_next: bool = False
+    count_mode: CountMode = CountMode.EXACT
+    next_cursor: Optional[str] = None
 
 
 class BookBulkCreate(BaseModel):
-    books: list[BookCreate]
\ No newline at end of file
+    books: list[BookCreate]
+
+
+class BookBulkResult(BaseModel):
+    created: int
@@ -0,0 +1,20 @@
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class ImportBatchResult(BaseModel):
+    batch: int
+    first_row: int
+    last_row: int
+    inserted: int
+    error: Optional[str] = None
+
+
+class ImportReport(BaseModel):
+    total_rows: int = 0
+    inserted: int = 0
+    failed_rows: int = 0
+    batches: list[ImportBatchResult] = []
+    completed: bool = True
+    error: Optional[str] = None
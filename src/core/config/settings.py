@@ -1,7 +1,7 @@
-from typing import Any, ClassVar
+from typing import Annotated, Any, ClassVar, List, Literal, Optional
 
 from pydantic import Field, PostgresDsn, field_validator
-from pydantic_settings import BaseSettings, SettingsConfigDict
+from pydantic_settings import BaseSettings, NoDecode, SettingsConfigDict
 
 
 class Settings(BaseSettings):
@@ -18,6 +18,58 @@ class Settings(BaseSettings):
     algorithm: str = Field(default="HS256")
     access_token_expire_minutes: int = Field(default=30)
     environment: str = Field(default="development")
+    count_estimate_threshold: int = Field(default=10000)
+    export_chunk_size: int = Field(default=1000)
+    import_batch_size: int = Field(default=1000)
+    bulk_copy_threshold: int = Field(default=500)
+    password_hash_workers: int = Field(default=4, ge=1)
+    password_hash_executor: Literal["thread", "process"] = Field(default="thread")
+    user_cache_size: int = Field(default=1024, ge=0)
+    user_cache_ttl: float = Field(default=30.0, ge=0)
+    entity_cache_size: int = Field(default=4096, ge=0)
+    entity_cache_ttl: float = Field(default=60.0, ge=0)
+    list_cache_size: int = Field(default=2048, ge=0)
+    list_cache_ttl: float = Field(default=30.0, ge=0)
+    list_cache_max_bytes: int = Field(default=32 * 1024 * 1024, ge=0)
+    notifications_enabled: bool = Field(default=True)
+    notifications_reconnect_delay: float = Field(default=1.0, gt=0)
+    notifications_max_reconnect_delay: float = Field(default=30.0, gt=0)
+    notifications_keepalive: float = Field(default=30.0, gt=0)
+    statement_cache_size: int = Field(default=256, ge=1)
+    pool_min_size: int = Field(default=10, ge=0)
+    pool_max_size: int = Field(default=20, ge=1)
+    pool_acquire_timeout: float = Field(default=10.0, gt=0)
+    pool_command_timeout: float = Field(default=60.0, gt=0)
+    batch_pool_min_size: int = Field(default=1, ge=0)
+    batch_pool_max_size: int = Field(default=4, ge=1)
+    batch_pool_acquire_timeout: float = Field(default=60.0, gt=0)
+    batch_pool_command_timeout: float = Field(default=600.0, gt=0)
+    server_timing_enabled: bool = Field(default=True)
+    slow_query_threshold: float = Field(default=0.5, ge=0)
+    slow_query_explain: bool = Field(default=True)
+    slow_query_explain_interval: float = Field(default=60.0, ge=0)
+    tracing_enabled: bool = Field(default=False)
+    tracing_sample_rate: float = Field(default=1.0, ge=0, le=1)
+    tracing_buffer_size: int = Field(default=200, ge=1)
+    tracing_file: Optional[str] = Field(default=None)
+    profiling_enabled: bool = Field(default=False)
+    profiling_token: Optional[str] = Field(default=None)
+    profiling_sample_rate: float = Field(default=1.0, ge=0, le=1)
+    profiling_min_interval: float = Field(default=10.0, ge=0)
+    profiling_dir: str = Field(default="profiles")
+    profiling_max_profiles: int = Field(default=50, ge=1)
+    profiling_top_functions: int = Field(default=40, ge=1)
+    profiling_top_allocations: int = Field(default=25, ge=1)
+    loop_monitor_enabled: bool = Field(default=False)
+    loop_monitor_interval: float = Field(default=1.0, gt=0)
+    loop_block_threshold: float = Field(default=0.5, gt=0)
+    loop_block_history: int = Field(default=50, ge=1)
+    loop_block_stack_depth: int = Field(default=15, ge=1)
+    health_check_timeout: float = Field(default=2.0, gt=0)
+    health_pool_saturation: float = Field(default=0.9, gt=0, le=1)
+    replica_database_urls: Annotated[List[PostgresDsn], NoDecode] = Field(default_factory=list)
+    replica_max_lag: float = Field(default=5.0, ge=0)
+    replica_check_interval: float = Field(default=2.0, gt=0)
 
     api_v1_prefix: ClassVar[str] = "/api/v1"
     project_name: ClassVar[str] = "Book Management System"
@@ -30,5 +82,12 @@ class Settings(BaseSettings):
             return v.replace("postgresql://", "postgresql+asyncpg://")
         return v
 
+    @field_validator("replica_database_urls", mode="before")
+    @classmethod
+    def validate_replica_database_urls(cls, v: Any) -> Any:
+        if isinstance(v, str):
+            v = [url.strip() for url in v.split(",") if url.strip()]
+        return [cls.validate_database_url(url) for url in v]
+
 
 settings = Settings()
\ No newline at end of file
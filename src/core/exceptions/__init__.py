@@ -3,6 +3,7 @@ from .base import (
     DomainException,
     ForbiddenException,
     NotFoundException,
+    ServiceUnavailableException,
     UnauthorizedException,
     ValidationException,
 )
@@ -14,4 +15,5 @@ __all__ = [
     "ConflictException",
     "UnauthorizedException",
     "ForbiddenException",
+    "ServiceUnavailableException",
 ]
\ No newline at end of file
@@ -33,4 +33,9 @@ class UnauthorizedException(DomainException):
 
 class ForbiddenException(DomainException):
     def __init__(self, message: str = "Forbidden") -> None:
-        super().__init__(message, "FORBIDDEN")
\ No newline at end of file
+        super().__init__(message, "FORBIDDEN")
+
+
+class ServiceUnavailableException(DomainException):
+    def __init__(self, message: str = "Service unavailable") -> None:
+        super().__init__(message, "SERVICE_UNAVAILABLE")
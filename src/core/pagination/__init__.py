@@ -0,0 +1,4 @@
+from .count_mode import CountMode
+from .cursor import decode_cursor, encode_cursor
+
+__all__ = ["CountMode", "encode_cursor", "decode_cursor"]
@@ -0,0 +1,23 @@
+import base64
+import binascii
+import json
+from typing import Any, Dict
+
+from src.core.exceptions import ValidationException
+
+
+def encode_cursor(payload: Dict[str, Any]) -> str:
+    raw = json.dumps(payload, separators=(",", ":"), default=str).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def decode_cursor(cursor: str) -> Dict[str, Any]:
+    padded = cursor + "=" * (-len(cursor) % 4)
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (binascii.Error, ValueError, UnicodeError):
+        raise ValidationException("Invalid pagination cursor", "cursor")
+
+    if not isinstance(payload, dict):
+        raise ValidationException("Invalid pagination cursor", "cursor")
+    return payload
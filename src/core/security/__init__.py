@@ -1,4 +1,18 @@
 from .jwt import create_access_token, decode_token
-from .password import get_password_hash, verify_password
+from .password import (
+    get_password_hash,
+    get_password_hash_async,
+    shutdown_password_executor,
+    verify_password,
+    verify_password_async,
+)
 
-__all__ = ["create_access_token", "decode_token", "verify_password", "get_password_hash"]
\ No newline at end of file
+__all__ = [
+    "create_access_token",
+    "decode_token",
+    "verify_password",
+    "get_password_hash",
+    "verify_password_async",
+    "get_password_hash_async",
+    "shutdown_password_executor",
+]
\ No newline at end of file
@@ -0,0 +1,15 @@
+from .request_timing import (
+    RequestTiming,
+    current_timing,
+    record_timing,
+    request_timing,
+    timed_methods,
+)
+
+__all__ = [
+    "RequestTiming",
+    "current_timing",
+    "record_timing",
+    "request_timing",
+    "timed_methods",
+]
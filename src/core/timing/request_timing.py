@@ -0,0 +1,90 @@
+import functools
+import inspect
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, Optional, Type, TypeVar
+
+T = TypeVar("T")
+
+
+class RequestTiming:
+    def __init__(self) -> None:
+        self.started = time.perf_counter()
+        self.durations: Dict[str, float] = {}
+        self.finished: Dict[str, float] = {}
+        self._depth: Dict[str, int] = {}
+
+    def add(self, phase: str, seconds: float) -> None:
+        self.durations[phase] = self.durations.get(phase, 0.0) + seconds
+
+    def enter(self, phase: str) -> bool:
+        depth = self._depth.get(phase, 0)
+        self._depth[phase] = depth + 1
+        return depth == 0
+
+    def exit(self, phase: str, started: Optional[float]) -> None:
+        self._depth[phase] -= 1
+        if started is not None:
+            now = time.perf_counter()
+            self.add(phase, now - started)
+            self.finished[phase] = now
+
+    def server_timing(self, serialized_after: str = "service") -> str:
+        now = time.perf_counter()
+        durations = dict(self.durations)
+        if serialized_after in self.finished:
+            durations["serialize"] = now - self.finished[serialized_after]
+        durations["total"] = now - self.started
+        return ", ".join(
+            f"{phase};dur={seconds * 1000:.2f}" for phase, seconds in durations.items()
+        )
+
+
+_current: ContextVar[Optional[RequestTiming]] = ContextVar("request_timing", default=None)
+
+
+def current_timing() -> Optional[RequestTiming]:
+    return _current.get()
+
+
+@contextmanager
+def request_timing() -> Iterator[RequestTiming]:
+    timing = RequestTiming()
+    token = _current.set(timing)
+    try:
+        yield timing
+    finally:
+        _current.reset(token)
+
+
+def record_timing(phase: str, seconds: float) -> None:
+    timing = _current.get()
+    if timing is not None:
+        timing.add(phase, seconds)
+
+
+def _timed(method: Callable[..., Any], phase: str) -> Callable[..., Any]:
+    @functools.wraps(method)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        timing = _current.get()
+        if timing is None:
+            return await method(*args, **kwargs)
+        
+        started = time.perf_counter() if timing.enter(phase) else None
+        try:
+            return await method(*args, **kwargs)
+        finally:
+            timing.exit(phase, started)
+
+    return wrapper
+
+
+def timed_methods(phase: str) -> Callable[[Type[T]], Type[T]]:
+    def decorate(cls: Type[T]) -> Type[T]:
+        for name, attribute in list(vars(cls).items()):
+            if not name.startswith("_") and inspect.iscoroutinefunction(attribute):
+                setattr(cls, name, _timed(attribute, phase))
+        return cls
+
+    return decorate
@@ -0,0 +1,3 @@
+from .tracer import Span, current_span, exporter, record_span, start_trace, traced
+
+__all__ = ["Span", "current_span", "exporter", "record_span", "start_trace", "traced"]
@@ -0,0 +1,161 @@
+import functools
+import inspect
+import json
+import os
+import queue
+import random
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Type, TypeVar
+
+from src.core.config import settings
+
+T = TypeVar("T")
+
+
+@dataclass
+class Span:
+    trace_id: str
+    span_id: str
+    parent_id: Optional[str]
+    name: str
+    layer: str
+    start: float
+    duration_ms: float = 0.0
+    error: Optional[str] = None
+    attributes: Dict[str, Any] = field(default_factory=dict)
+
+
+class Trace:
+    def __init__(self, trace_id: str) -> None:
+        self.trace_id = trace_id
+        self.spans: List[Span] = []
+
+    def new_span(self, name: str, layer: str, parent: Optional[Span], start: float) -> Span:
+        span = Span(
+            trace_id=self.trace_id,
+            span_id=f"{random.getrandbits(64):016x}",
+            parent_id=parent.span_id if parent is not None else None,
+            name=name,
+            layer=layer,
+            start=start,
+        )
+        self.spans.append(span)
+        return span
+
+
+class SpanExporter:
+    def __init__(self) -> None:
+        self._traces: Deque[List[Dict[str, Any]]] = deque(maxlen=settings.tracing_buffer_size)
+        self._pending: "queue.Queue[tuple[str, str]]" = queue.Queue()
+        self._writer: Optional[threading.Thread] = None
+
+    def export(self, trace: Trace) -> None:
+        spans = [asdict(span) for span in trace.spans]
+        self._traces.append(spans)
+        if settings.tracing_file:
+            lines = "".join(json.dumps(span, default=str) + "\n" for span in spans)
+            self._pending.put((settings.tracing_file, lines))
+            if self._writer is None or not self._writer.is_alive():
+                self._writer = threading.Thread(target=self._write, name="span-writer", daemon=True)
+                self._writer.start()
+
+    def flush(self) -> None:
+        self._pending.join()
+
+    def _write(self) -> None:
+        while True:
+            path, lines = self._pending.get()
+            try:
+                os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+                with open(path, "a", encoding="utf-8") as file:
+                    file.write(lines)
+            except OSError:
+                pass
+            finally:
+                self._pending.task_done()
+
+    def recent(self, limit: int) -> List[List[Dict[str, Any]]]:
+        return list(self._traces)[-limit:][::-1] if limit > 0 else []
+
+    def clear(self) -> None:
+        self._traces = deque(maxlen=settings.tracing_buffer_size)
+
+
+exporter = SpanExporter()
+
+_trace: ContextVar[Optional[Trace]] = ContextVar("trace", default=None)
+_span: ContextVar[Optional[Span]] = ContextVar("span", default=None)
+
+
+def current_span() -> Optional[Span]:
+    return _span.get()
+
+
+@contextmanager
+def start_trace(name: str, **attributes: Any) -> Iterator[Optional[Span]]:
+    if not settings.tracing_enabled or random.random() >= settings.tracing_sample_rate:
+        yield None
+        return
+
+    trace = Trace(f"{random.getrandbits(128):032x}")
+    started = time.perf_counter()
+    root = trace.new_span(name, "endpoint", None, time.time())
+    root.attributes.update(attributes)
+    trace_token = _trace.set(trace)
+    span_token = _span.set(root)
+    try:
+        yield root
+    except BaseException as exc:
+        root.error = type(exc).__name__
+        raise
+    finally:
+        root.duration_ms = (time.perf_counter() - started) * 1000
+        _span.reset(span_token)
+        _trace.reset(trace_token)
+        exporter.export(trace)
+
+
+def record_span(name: str, layer: str, duration: float, **attributes: Any) -> None:
+    trace = _trace.get()
+    if trace is None:
+        return
+    span = trace.new_span(name, layer, _span.get(), time.time() - duration)
+    span.duration_ms = duration * 1000
+    span.attributes.update(attributes)
+
+
+def _traced(method: Callable[..., Any], name: str, layer: str) -> Callable[..., Any]:
+    @functools.wraps(method)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        trace = _trace.get()
+        if trace is None:
+            return await method(*args, **kwargs)
+
+        started = time.perf_counter()
+        span = trace.new_span(name, layer, _span.get(), time.time())
+        token = _span.set(span)
+        try:
+            return await method(*args, **kwargs)
+        except BaseException as exc:
+            span.error = type(exc).__name__
+            raise
+        finally:
+            span.duration_ms = (time.perf_counter() - started) * 1000
+            _span.reset(token)
+
+    return wrapper
+
+
+def traced(layer: str) -> Callable[[Type[T]], Type[T]]:
+    def decorate(cls: Type[T]) -> Type[T]:
+        for name, attribute in list(vars(cls).items()):
+            if not name.startswith("_") and inspect.iscoroutinefunction(attribute):
+                setattr(cls, name, _traced(attribute, f"{cls.__name__}.{name}", layer))
+        return cls
+
+    return decorate
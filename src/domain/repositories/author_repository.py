@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from src.domain.entities import Author
 
@@ -17,6 +17,10 @@ class AuthorRepository(ABC):
     async def get_by_name(self, name: str) -> Optional[Author]:
         pass
 
+    @abstractmethod
+    async def get_existing_ids(self, author_ids: List[int]) -> Set[int]:
+        pass
+
     @abstractmethod
     async def get_all(
         self,
@@ -27,6 +31,28 @@ class AuthorRepository(ABC):
     ) -> List[Author]:
         pass
 
+    @abstractmethod
+    async def get_page(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        name: Optional[str] = None,
+        nationality: Optional[str] = None,
+        with_total: bool = True,
+    ) -> Tuple[List[Author], Optional[int]]:
+        pass
+
+    @abstractmethod
+    async def get_page_rows(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        name: Optional[str] = None,
+        nationality: Optional[str] = None,
+        with_total: bool = True,
+    ) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        pass
+
     @abstractmethod
     async def update(self, author_id: int, author: Author) -> Optional[Author]:
         pass
@@ -41,4 +67,12 @@ class AuthorRepository(ABC):
         name: Optional[str] = None,
         nationality: Optional[str] = None,
     ) -> int:
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    async def estimate_count(
+        self,
+        name: Optional[str] = None,
+        nationality: Optional[str] = None,
+    ) -> int:
+        pass
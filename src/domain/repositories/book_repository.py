@@ -1,10 +1,19 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Any, AsyncIterator, Dict, List, Mapping, Optional, Set, Tuple
 
 from src.domain.entities import Book
 
 
+SORT_FIELDS = ("title", "published_year", "created_at", "updated_at")
+
+
 class BookRepository(ABC):
+    @staticmethod
+    def resolve_sort(sort_by: Optional[str], order: str) -> Tuple[str, str]:
+        if sort_by and sort_by in SORT_FIELDS:
+            return sort_by, order.upper()
+        return "created_at", "DESC"
+
     @abstractmethod
     async def create(self, book: Book) -> Book:
         pass
@@ -25,9 +34,98 @@ class BookRepository(ABC):
         year_to: Optional[int] = None,
         sort_by: Optional[str] = None,
         order: str = "asc",
+        after: Optional[Tuple[Any, int]] = None,
     ) -> List[Book]:
         pass
 
+    @abstractmethod
+    async def get_page(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        title: Optional[str] = None,
+        author_id: Optional[int] = None,
+        genre: Optional[str] = None,
+        year_from: Optional[int] = None,
+        year_to: Optional[int] = None,
+        sort_by: Optional[str] = None,
+        order: str = "asc",
+        after: Optional[Tuple[Any, int]] = None,
+        with_total: bool = True,
+    ) -> Tuple[List[Book], Optional[int]]:
+        pass
+
+    @abstractmethod
+    async def get_page_rows(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        title: Optional[str] = None,
+        author_id: Optional[int] = None,
+        genre: Optional[str] = None,
+        year_from: Optional[int] = None,
+        year_to: Optional[int] = None,
+        sort_by: Optional[str] = None,
+        order: str = "asc",
+        after: Optional[Tuple[Any, int]] = None,
+        with_total: bool = True,
+    ) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        pass
+
+    @abstractmethod
+    async def search(
+        self,
+        query: str,
+        limit: int = 100,
+        offset: int = 0,
+        author_id: Optional[int] = None,
+        genre: Optional[str] = None,
+        year_from: Optional[int] = None,
+        year_to: Optional[int] = None,
+    ) -> Tuple[List[Book], int]:
+        pass
+
+    @abstractmethod
+    def stream(
+        self,
+        title: Optional[str] = None,
+        author_id: Optional[int] = None,
+        genre: Optional[str] = None,
+        year_from: Optional[int] = None,
+        year_to: Optional[int] = None,
+        sort_by: Optional[str] = None,
+        order: str = "asc",
+        chunk_size: int = 1000,
+    ) -> AsyncIterator[List[Book]]:
+        pass
+
+    @abstractmethod
+    def stream_rows(
+        self,
+        title: Optional[str] = None,
+        author_id: Optional[int] = None,
+        genre: Optional[str] = None,
+        year_from: Optional[int] = None,
+        year_to: Optional[int] = None,
+        sort_by: Optional[str] = None,
+        order: str = "asc",
+        chunk_size: int = 1000,
+    ) -> AsyncIterator[List[Mapping[str, Any]]]:
+        pass
+
+    @abstractmethod
+    def copy_csv(
+        self,
+        title: Optional[str] = None,
+        author_id: Optional[int] = None,
+        genre: Optional[str] = None,
+        year_from: Optional[int] = None,
+        year_to: Optional[int] = None,
+        sort_by: Optional[str] = None,
+        order: str = "asc",
+    ) -> AsyncIterator[bytes]:
+        pass
+
     @abstractmethod
     async def update(self, book_id: int, book: Book) -> Optional[Book]:
         pass
@@ -47,10 +145,33 @@ class BookRepository(ABC):
     ) -> int:
         pass
 
+    @abstractmethod
+    async def estimate_count(
+        self,
+        title: Optional[str] = None,
+        author_id: Optional[int] = None,
+        genre: Optional[str] = None,
+        year_from: Optional[int] = None,
+        year_to: Optional[int] = None,
+    ) -> int:
+        pass
+
     @abstractmethod
     async def bulk_create(self, books: List[Book]) -> List[Book]:
         pass
 
+    @abstractmethod
+    async def copy_create(self, books: List[Book]) -> List[Book]:
+        pass
+
+    @abstractmethod
+    async def copy_insert(self, books: List[Book]) -> int:
+        pass
+
     @abstractmethod
     async def get_by_isbn(self, isbn: str) -> Optional[Book]:
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    async def get_existing_isbns(self, isbns: List[str]) -> Set[str]:
+        pass
@@ -1,11 +1,19 @@
 from typing import Optional
 
 from src.core.exceptions import ConflictException, UnauthorizedException, ValidationException
-from src.core.security import create_access_token, get_password_hash, verify_password
+from src.core.security import (
+    create_access_token,
+    get_password_hash_async,
+    verify_password_async,
+)
+from src.core.timing import timed_methods
+from src.core.tracing import traced
 from src.domain.entities import User
 from src.domain.repositories import UserRepository
 
 
+@traced("service")
+@timed_methods("service")
 class AuthService:
     def __init__(self, user_repository: UserRepository):
         self.user_repository = user_repository
@@ -21,7 +29,7 @@ class AuthService:
         if existing_username:
             raise ConflictException(f"User with username '{username}' already exists")
         
-        hashed_password = get_password_hash(password)
+        hashed_password = await get_password_hash_async(password)
         user = User(
             id=None,
             email=email,
@@ -38,7 +46,7 @@ class AuthService:
         if not user:
             user = await self.user_repository.get_by_email(username)
         
-        if not user or not verify_password(password, user.hashed_password):
+        if not user or not await verify_password_async(password, user.hashed_password):
             return None
         
         if not user.is_active:
@@ -1,10 +1,16 @@
-from typing import Optional
+from typing import Any, Awaitable, Callable, List, Optional, Tuple
 
+from src.core.config import settings
 from src.core.exceptions import ConflictException, NotFoundException, ValidationException
+from src.core.pagination import CountMode
+from src.core.timing import timed_methods
+from src.core.tracing import traced
 from src.domain.entities import Author
 from src.domain.repositories import AuthorRepository
 
 
+@traced("service")
+@timed_methods("service")
 class AuthorService:
     def __init__(self, author_repository: AuthorRepository):
         self.author_repository = author_repository
@@ -30,27 +36,64 @@ class AuthorService:
         size: int = 50,
         name: Optional[str] = None,
         nationality: Optional[str] = None,
+        count: CountMode = CountMode.EXACT,
+    ) -> dict:
+        return await self._get_page(
+            self.author_repository.get_page, page, size, name, nationality, count
+        )
+
+    async def get_author_rows(
+        self,
+        page: int = 1,
+        size: int = 50,
+        name: Optional[str] = None,
+        nationality: Optional[str] = None,
+        count: CountMode = CountMode.EXACT,
+    ) -> dict:
+        return await self._get_page(
+            self.author_repository.get_page_rows, page, size, name, nationality, count
+        )
+
+    async def _get_page(
+        self,
+        fetch_page: Callable[..., Awaitable[Tuple[List[Any], Optional[int]]]],
+        page: int,
+        size: int,
+        name: Optional[str],
+        nationality: Optional[str],
+        count: CountMode,
     ) -> dict:
         offset = (page - 1) * size
         
-        authors = await self.author_repository.get_all(
-            limit=size,
+        estimate = None
+        if count == CountMode.ESTIMATE:
+            estimate = await self.author_repository.estimate_count(
+                name=name,
+                nationality=nationality,
+            )
+            if estimate < settings.count_estimate_threshold:
+                count = CountMode.EXACT
+        
+        authors, total = await fetch_page(
+            limit=size + 1,
             offset=offset,
             name=name,
             nationality=nationality,
+            with_total=count == CountMode.EXACT,
         )
+        if count == CountMode.ESTIMATE:
+            total = estimate
         
-        total = await self.author_repository.count(
-            name=name,
-            nationality=nationality,
-        )
+        has_next = len(authors) > size
         
         return {
-            "items": authors,
+            "items": authors[:size],
             "total": total,
             "page": page,
             "size": size,
-            "pages": (total + size - 1) // size,
+            "pages": (total + size - 1) // size if total is not None else None,
+            "has_next": has_next,
+            "count_mode": count,
         }
 
     async def update_author(self, author_id: int, author: Author) -> Author:
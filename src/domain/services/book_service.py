@@ -1,11 +1,21 @@
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Mapping, Optional, Tuple
 
+from src.core.config import settings
 from src.core.exceptions import ConflictException, NotFoundException, ValidationException
+from src.core.pagination import CountMode, decode_cursor, encode_cursor
+from src.core.timing import timed_methods
+from src.core.tracing import traced
 from src.domain.entities import Book
 from src.domain.repositories import AuthorRepository, BookRepository
 
+MAX_REPORTED_ROW_ERRORS = 10
+MAX_TITLE_LENGTH = 500
+MAX_ISBN_LENGTH = 20
 
+
+@traced("service")
+@timed_methods("service")
 class BookService:
     def __init__(self, book_repository: BookRepository, author_repository: AuthorRepository):
         self.book_repository = book_repository
@@ -38,12 +48,14 @@ class BookService:
         year_to: Optional[int] = None,
         sort_by: Optional[str] = None,
         order: str = "asc",
+        cursor: Optional[str] = None,
+        count: CountMode = CountMode.EXACT,
     ) -> dict:
-        offset = (page - 1) * size
-        
-        books = await self.book_repository.get_all(
-            limit=size,
-            offset=offset,
+        return await self._get_page(
+            self.book_repository.get_page,
+            lambda book, field: (getattr(book, field), book.id),
+            page=page,
+            size=size,
             title=title,
             author_id=author_id,
             genre=genre,
@@ -51,24 +63,204 @@ class BookService:
             year_to=year_to,
             sort_by=sort_by,
             order=order,
+            cursor=cursor,
+            count=count,
         )
+
+    async def get_book_rows(
+        self,
+        page: int = 1,
+        size: int = 50,
+        title: Optional[str] = None,
+        author_id: Optional[int] = None,
+        genre: Optional[str] = None,
+        year_from: Optional[int] = None,
+        year_to: Optional[int] = None,
+        sort_by: Optional[str] = None,
+        order: str = "asc",
+        cursor: Optional[str] = None,
+        count: CountMode = CountMode.EXACT,
+    ) -> dict:
+        return await self._get_page(
+            self.book_repository.get_page_rows,
+            lambda row, field: (row[field], row["id"]),
+            page=page,
+            size=size,
+            title=title,
+            author_id=author_id,
+            genre=genre,
+            year_from=year_from,
+            year_to=year_to,
+            sort_by=sort_by,
+            order=order,
+            cursor=cursor,
+            count=count,
+        )
+
+    async def _get_page(
+        self,
+        fetch_page: Callable[..., Awaitable[Tuple[List[Any], Optional[int]]]],
+        cursor_key: Callable[[Any, str], Tuple[Any, int]],
+        page: int,
+        size: int,
+        title: Optional[str],
+        author_id: Optional[int],
+        genre: Optional[str],
+        year_from: Optional[int],
+        year_to: Optional[int],
+        sort_by: Optional[str],
+        order: str,
+        cursor: Optional[str],
+        count: CountMode,
+    ) -> dict:
+        sort_field, direction = self.book_repository.resolve_sort(sort_by, order)
+        after = self._decode_cursor(cursor, sort_field, direction) if cursor else None
+        offset = 0 if after else (page - 1) * size
         
-        total = await self.book_repository.count(
+        estimate = None
+        if count == CountMode.ESTIMATE:
+            estimate = await self.book_repository.estimate_count(
+                title=title,
+                author_id=author_id,
+                genre=genre,
+                year_from=year_from,
+                year_to=year_to,
+            )
+            if estimate < settings.count_estimate_threshold:
+                count = CountMode.EXACT
+        
+        books, total = await fetch_page(
+            limit=size + 1,
+            offset=offset,
             title=title,
             author_id=author_id,
             genre=genre,
             year_from=year_from,
             year_to=year_to,
+            sort_by=sort_by,
+            order=order,
+            after=after,
+            with_total=count == CountMode.EXACT,
         )
+        if count == CountMode.ESTIMATE:
+            total = estimate
+        
+        has_next = len(books) > size
+        next_cursor = None
+        if has_next:
+            books = books[:size]
+            value, last_id = cursor_key(books[-1], sort_field)
+            next_cursor = self._encode_cursor(value, last_id, sort_field, direction)
         
         return {
             "items": books,
             "total": total,
             "page": page,
             "size": size,
+            "pages": (total + size - 1) // size if total is not None else None,
+            "has_next": has_next,
+            "next_cursor": next_cursor,
+            "count_mode": count,
+        }
+
+    async def search_books(
+        self,
+        query: str,
+        page: int = 1,
+        size: int = 50,
+        author_id: Optional[int] = None,
+        genre: Optional[str] = None,
+        year_from: Optional[int] = None,
+        year_to: Optional[int] = None,
+    ) -> dict:
+        if not query or not query.strip():
+            raise ValidationException("Search query cannot be empty", "q")
+        
+        books, total = await self.book_repository.search(
+            query=query.strip(),
+            limit=size + 1,
+            offset=(page - 1) * size,
+            author_id=author_id,
+            genre=genre,
+            year_from=year_from,
+            year_to=year_to,
+        )
+        
+        return {
+            "items": books[:size],
+            "total": total,
+            "page": page,
+            "size": size,
             "pages": (total + size - 1) // size,
+            "has_next": len(books) > size,
+            "count_mode": CountMode.EXACT,
         }
 
+    async def stream_books(
+        self,
+        title: Optional[str] = None,
+        author_id: Optional[int] = None,
+        genre: Optional[str] = None,
+        year_from: Optional[int] = None,
+        year_to: Optional[int] = None,
+        sort_by: Optional[str] = None,
+        order: str = "asc",
+    ) -> AsyncIterator[List[Book]]:
+        async for chunk in self.book_repository.stream(
+            title=title,
+            author_id=author_id,
+            genre=genre,
+            year_from=year_from,
+            year_to=year_to,
+            sort_by=sort_by,
+            order=order,
+            chunk_size=settings.export_chunk_size,
+        ):
+            yield chunk
+
+    async def stream_book_rows(
+        self,
+        title: Optional[str] = None,
+        author_id: Optional[int] = None,
+        genre: Optional[str] = None,
+        year_from: Optional[int] = None,
+        year_to: Optional[int] = None,
+        sort_by: Optional[str] = None,
+        order: str = "asc",
+    ) -> AsyncIterator[List[Mapping[str, Any]]]:
+        async for chunk in self.book_repository.stream_rows(
+            title=title,
+            author_id=author_id,
+            genre=genre,
+            year_from=year_from,
+            year_to=year_to,
+            sort_by=sort_by,
+            order=order,
+            chunk_size=settings.export_chunk_size,
+        ):
+            yield chunk
+
+    async def export_books_csv(
+        self,
+        title: Optional[str] = None,
+        author_id: Optional[int] = None,
+        genre: Optional[str] = None,
+        year_from: Optional[int] = None,
+        year_to: Optional[int] = None,
+        sort_by: Optional[str] = None,
+        order: str = "asc",
+    ) -> AsyncIterator[bytes]:
+        async for chunk in self.book_repository.copy_csv(
+            title=title,
+            author_id=author_id,
+            genre=genre,
+            year_from=year_from,
+            year_to=year_to,
+            sort_by=sort_by,
+            order=order,
+        ):
+            yield chunk
+
     async def update_book(self, book_id: int, book: Book) -> Book:
         existing = await self.book_repository.get_by_id(book_id)
         if not existing:
@@ -91,31 +283,123 @@ class BookService:
         if not deleted:
             raise NotFoundException("Book", book_id)
 
-    async def bulk_create_books(self, books: List[Book]) -> List[Book]:
-        for book in books:
-            await self._validate_book(book)
+    async def bulk_create_books(self, books: List[Book], row_offset: int = 0) -> List[Book]:
+        await self._validate_bulk(books, row_offset)
         
-        isbn_list = [b.isbn for b in books if b.isbn]
-        if len(isbn_list) != len(set(isbn_list)):
-            raise ValidationException("Duplicate ISBNs in bulk import")
+        if len(books) >= settings.bulk_copy_threshold:
+            return await self.book_repository.copy_create(books)
+        return await self.book_repository.bulk_create(books)
+
+    async def bulk_insert_books(self, books: List[Book], row_offset: int = 0) -> int:
+        await self._validate_bulk(books, row_offset)
         
-        for isbn in isbn_list:
-            existing = await self.book_repository.get_by_isbn(isbn)
-            if existing:
-                raise ConflictException(f"Book with ISBN {isbn} already exists")
+        return await self.book_repository.copy_insert(books)
+
+    async def _validate_bulk(self, books: List[Book], row_offset: int = 0) -> None:
+        rows = list(enumerate(books, start=row_offset + 1))
         
-        return await self.book_repository.bulk_create(books)
+        errors = []
+        for row, book in rows:
+            try:
+                self._validate_book_fields(book)
+            except ValidationException as e:
+                errors.append(f"Row {row}: {e.message}")
+        self._raise_row_errors(errors, ValidationException)
+        
+        existing_authors = await self.author_repository.get_existing_ids(
+            list({book.author_id for book in books})
+        )
+        self._raise_row_errors(
+            [
+                f"Row {row}: Author with id {book.author_id} does not exist"
+                for row, book in rows
+                if book.author_id not in existing_authors
+            ],
+            ValidationException,
+        )
+        
+        first_rows: Dict[str, int] = {}
+        errors = []
+        for row, book in rows:
+            if not book.isbn:
+                continue
+            if book.isbn in first_rows:
+                errors.append(
+                    f"Row {row}: Duplicate ISBN {book.isbn} in bulk import "
+                    f"(first seen in row {first_rows[book.isbn]})"
+                )
+            else:
+                first_rows[book.isbn] = row
+        self._raise_row_errors(errors, ValidationException)
+        
+        existing_isbns = await self.book_repository.get_existing_isbns(list(first_rows))
+        self._raise_row_errors(
+            [
+                f"Row {row}: Book with ISBN {book.isbn} already exists"
+                for row, book in rows
+                if book.isbn in existing_isbns
+            ],
+            ConflictException,
+        )
 
     async def _validate_book(self, book: Book) -> None:
-        if not book.title or not book.title.strip():
-            raise ValidationException("Book title cannot be empty")
+        self._validate_book_fields(book)
         
         author = await self.author_repository.get_by_id(book.author_id)
         if not author:
             raise ValidationException(f"Author with id {book.author_id} does not exist")
+
+    @staticmethod
+    def _validate_book_fields(book: Book) -> None:
+        if not book.title or not book.title.strip():
+            raise ValidationException("Book title cannot be empty")
+        if len(book.title) > MAX_TITLE_LENGTH:
+            raise ValidationException(f"Book title cannot exceed {MAX_TITLE_LENGTH} characters")
+        if book.isbn and len(book.isbn) > MAX_ISBN_LENGTH:
+            raise ValidationException(f"ISBN cannot exceed {MAX_ISBN_LENGTH} characters")
         
         current_year = datetime.now().year
         if book.published_year < 1800 or book.published_year > current_year:
             raise ValidationException(
                 f"Published year must be between 1800 and {current_year}"
-            )
\ No newline at end of file
+            )
+
+    @staticmethod
+    def _raise_row_errors(errors: List[str], exception_type: type) -> None:
+        if not errors:
+            return
+        
+        message = "; ".join(errors[:MAX_REPORTED_ROW_ERRORS])
+        if len(errors) > MAX_REPORTED_ROW_ERRORS:
+            message += f"; and {len(errors) - MAX_REPORTED_ROW_ERRORS} more"
+        raise exception_type(message)
+
+    @staticmethod
+    def _encode_cursor(value: Any, book_id: int, sort_field: str, direction: str) -> str:
+        if isinstance(value, datetime):
+            value = value.isoformat()
+        return encode_cursor({"sort": sort_field, "order": direction, "value": value, "id": book_id})
+
+    @staticmethod
+    def _decode_cursor(cursor: str, sort_field: str, direction: str) -> Tuple[Any, int]:
+        payload = decode_cursor(cursor)
+        if payload.get("sort") != sort_field or payload.get("order") != direction:
+            raise ValidationException("Cursor does not match the requested sort order", "cursor")
+        
+        value = payload.get("value")
+        book_id = payload.get("id")
+        if value is None or book_id is None:
+            raise ValidationException("Invalid pagination cursor", "cursor")
+        
+        try:
+            if sort_field in ("created_at", "updated_at"):
+                value = datetime.fromisoformat(value)
+            elif sort_field == "published_year":
+                value = int(value)
+            else:
+                value = str(value)
+            book_id = int(book_id)
+        except (TypeError, ValueError):
+            raise ValidationException("Invalid pagination cursor", "cursor")
+        
+        return value, book_id
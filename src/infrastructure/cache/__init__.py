@@ -0,0 +1,6 @@
+from .entry import CachedEntity
+from .responses import ResponseCache
+from .ttl_lru import TTLLRUCache
+from .versions import VersionCounters
+
+__all__ = ["CachedEntity", "ResponseCache", "TTLLRUCache", "VersionCounters"]
@@ -0,0 +1,10 @@
+from dataclasses import dataclass
+from typing import Generic, Optional, TypeVar
+
+E = TypeVar("E")
+
+
+@dataclass(frozen=True)
+class CachedEntity(Generic[E]):
+    entity: E
+    body: Optional[bytes] = None
@@ -0,0 +1,23 @@
+from datetime import datetime
+from typing import Any, Optional, Tuple
+
+from src.infrastructure.cache.entry import CachedEntity
+from src.infrastructure.cache.ttl_lru import TTLLRUCache
+
+
+class ResponseCache:
+    def __init__(self, entities: TTLLRUCache[int, CachedEntity[Any]]) -> None:
+        self.entities = entities
+
+    def get(self, key: int) -> Optional[Tuple[datetime, bytes]]:
+        cached = self.entities.peek(key)
+        if cached is None or cached.body is None or cached.entity.updated_at is None:
+            return None
+        self.entities.get(key)
+        return cached.entity.updated_at, cached.body
+
+    def put(self, key: int, updated_at: Optional[datetime], body: bytes) -> None:
+        cached = self.entities.peek(key)
+        if cached is None or cached.entity.updated_at != updated_at:
+            return
+        self.entities.replace(key, CachedEntity(cached.entity, body))
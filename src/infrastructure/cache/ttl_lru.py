@@ -0,0 +1,126 @@
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Generic, Hashable, Optional, Tuple, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLLRUCache(Generic[K, V]):
+    def __init__(
+        self,
+        max_size: int,
+        ttl: float,
+        max_bytes: Optional[int] = None,
+        sizer: Optional[Callable[[V], int]] = None,
+    ) -> None:
+        self.max_size = max_size
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.sizer = sizer
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[K, Tuple[float, V, int]]" = OrderedDict()
+        self._bytes = 0
+        self._generation = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_size > 0 and self.ttl > 0 and self.max_bytes != 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def generation(self) -> int:
+        return self._generation
+
+    def get(self, key: K) -> Optional[V]:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        
+        if entry[0] <= time.monotonic():
+            self._remove(key)
+            self.misses += 1
+            return None
+        
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def peek(self, key: K) -> Optional[V]:
+        entry = self._entries.get(key)
+        if entry is None or entry[0] <= time.monotonic():
+            return None
+        return entry[1]
+
+    def set(self, key: K, value: V, generation: Optional[int] = None) -> None:
+        if not self.enabled:
+            return
+        if generation is not None and generation != self._generation:
+            return
+        
+        size = self.sizer(value) if self.sizer else 0
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+        
+        self._remove(key)
+        self._entries[key] = (time.monotonic() + self.ttl, value, size)
+        self._bytes += size
+        self._evict()
+
+    def replace(self, key: K, value: V) -> bool:
+        entry = self._entries.get(key)
+        if entry is None:
+            return False
+        
+        size = self.sizer(value) if self.sizer else 0
+        self._entries[key] = (entry[0], value, size)
+        self._bytes += size - entry[2]
+        self._evict()
+        return True
+
+    def invalidate(self, key: K) -> None:
+        self._generation += 1
+        self._remove(key)
+
+    def invalidate_where(self, predicate: Callable[[V], bool]) -> int:
+        self._generation += 1
+        stale = [key for key, entry in self._entries.items() if predicate(entry[1])]
+        for key in stale:
+            self._remove(key)
+        return len(stale)
+
+    def clear(self) -> None:
+        self._generation += 1
+        self._entries.clear()
+        self._bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+        }
+
+    def _remove(self, key: K) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry[2]
+
+    def _evict(self) -> None:
+        while self._entries and (
+            len(self._entries) > self.max_size
+            or (self.max_bytes is not None and self._bytes > self.max_bytes)
+        ):
+            _, entry = self._entries.popitem(last=False)
+            self._bytes -= entry[2]
+            self.evictions += 1
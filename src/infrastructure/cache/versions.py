@@ -0,0 +1,22 @@
+from typing import Dict, Hashable, Iterable, Tuple
+
+
+class VersionCounters:
+    def __init__(self) -> None:
+        self._epoch = 0
+        self._global = 0
+        self._scopes: Dict[Hashable, int] = {}
+
+    def token(self, scopes: Iterable[Hashable] = ()) -> Tuple[int, ...]:
+        scopes = tuple(scopes)
+        if not scopes:
+            return (self._epoch, self._global)
+        return (self._epoch, *(self._scopes.get(scope, 0) for scope in scopes))
+
+    def bump(self, scopes: Iterable[Hashable] = ()) -> None:
+        self._global += 1
+        for scope in scopes:
+            self._scopes[scope] = self._scopes.get(scope, 0) + 1
+
+    def bump_all(self) -> None:
+        self._epoch += 1
@@ -1,3 +1,15 @@
 from .connection import DatabasePool
+from .filters import Filter, FilterSpec
+from .notifications import ChangeEvent, NotificationListener
+from .workloads import BATCH, INTERACTIVE, Workload
 
-__all__ = ["DatabasePool"]
\ No newline at end of file
+__all__ = [
+    "DatabasePool",
+    "Filter",
+    "FilterSpec",
+    "ChangeEvent",
+    "NotificationListener",
+    "Workload",
+    "INTERACTIVE",
+    "BATCH",
+]
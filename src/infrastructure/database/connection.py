@@ -1,45 +1,456 @@
-from contextlib import asynccontextmanager
-from typing import AsyncGenerator
+import asyncio
+import functools
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager, contextmanager, suppress
+from contextvars import ContextVar
+from typing import Any, AsyncGenerator, AsyncIterator, Dict, Iterable, Iterator, List, Optional, Tuple
 
 import asyncpg
 from asyncpg import Connection, Pool
 
 from src.core.config import settings
+from src.core.exceptions import ServiceUnavailableException
+from src.core.timing import record_timing
+from src.core.tracing import current_span, record_span
+from src.infrastructure.database.replicas import ReplicaSet
+from src.infrastructure.database.slow_queries import SlowQueryLog, normalize_sql
+from src.infrastructure.database.workloads import INTERACTIVE, Workload, configured_workloads
+from src.infrastructure.metrics import current_operation, registry
+
+_primary_pinned: ContextVar[bool] = ContextVar("primary_pinned", default=False)
+_workload: ContextVar[str] = ContextVar("workload", default=INTERACTIVE)
+
+
+def _asyncpg_dsn(url: Any) -> str:
+    return str(url.unicode_string()).replace("postgresql+asyncpg://", "postgresql://")
+
+
+def _pool_samples() -> Iterable[Tuple[Tuple[str, ...], float]]:
+    for stats in DatabasePool.pool_stats():
+        for state in ("size", "idle", "in_use", "max"):
+            yield (stats["pool"], stats["workload"], state), stats[state]
+
+
+def _statement_cache_samples(key: str) -> Iterable[Tuple[Tuple[str, ...], float]]:
+    yield (), DatabasePool.statement_stats()[key]
+
+
+def _replica_samples(key: str) -> Iterable[Tuple[Tuple[str, ...], float]]:
+    for replica in DatabasePool.replica_stats():
+        if replica[key] is not None:
+            yield (replica["name"],), float(replica[key])
+
+
+ACQUIRE_WAIT_SECONDS = registry.histogram(
+    "db_pool_acquire_wait_seconds",
+    "Time spent waiting for a pooled connection",
+    ("pool", "workload"),
+)
+ACQUIRE_TIMEOUTS = registry.counter(
+    "db_pool_acquire_timeouts_total",
+    "Connection acquisitions that gave up after the workload's acquire timeout",
+    ("pool", "workload"),
+)
+TRANSACTION_SECONDS = registry.histogram(
+    "db_transaction_duration_seconds",
+    "Time from BEGIN to COMMIT or ROLLBACK",
+    ("workload", "readonly"),
+)
+STATEMENT_SECONDS = registry.histogram(
+    "db_statement_duration_seconds",
+    "Statement latency as seen by asyncpg, by repository operation",
+    ("operation",),
+)
+STATEMENT_ERRORS = registry.counter(
+    "db_statement_errors_total",
+    "Statements that raised, by repository operation",
+    ("operation",),
+)
+registry.gauge(
+    "db_pool_connections",
+    "Pooled connections by state",
+    ("pool", "workload", "state"),
+    collect=_pool_samples,
+)
+registry.counter(
+    "db_statement_cache_hits_total",
+    "Approximate statement cache hits, from an LRU mirror of each connection's asyncpg cache",
+    collect=lambda: _statement_cache_samples("hits"),
+)
+registry.counter(
+    "db_statement_cache_misses_total",
+    "Approximate statement cache misses, from an LRU mirror of each connection's asyncpg cache",
+    collect=lambda: _statement_cache_samples("misses"),
+)
+registry.counter(
+    "db_statement_cache_evictions_total",
+    "Approximate statement cache evictions, from an LRU mirror of each connection's asyncpg cache",
+    collect=lambda: _statement_cache_samples("evictions"),
+)
+registry.gauge(
+    "db_replica_healthy",
+    "Whether a replica is serving reads",
+    ("replica",),
+    collect=lambda: _replica_samples("healthy"),
+)
+registry.gauge(
+    "db_replica_lag_seconds",
+    "Replay lag measured by the last replica health check",
+    ("replica",),
+    collect=lambda: _replica_samples("lag"),
+)
+
+
+class InstrumentedConnection(Connection):
+    async def execute(self, query: str, *args: Any, **kwargs: Any) -> Any:
+        with self._observed(query, args):
+            return await super().execute(query, *args, **kwargs)
+
+    async def executemany(self, command: str, args: Any, **kwargs: Any) -> None:
+        with self._observed(command, args):
+            await super().executemany(command, args, **kwargs)
+
+    async def fetch(self, query: str, *args: Any, **kwargs: Any) -> Any:
+        with self._observed(query, args):
+            return await super().fetch(query, *args, **kwargs)
+
+    async def fetchval(self, query: str, *args: Any, **kwargs: Any) -> Any:
+        with self._observed(query, args):
+            return await super().fetchval(query, *args, **kwargs)
+
+    async def fetchrow(self, query: str, *args: Any, **kwargs: Any) -> Any:
+        with self._observed(query, args):
+            return await super().fetchrow(query, *args, **kwargs)
+
+    async def fetchmany(self, query: str, args: Any, **kwargs: Any) -> Any:
+        with self._observed(query, args):
+            return await super().fetchmany(query, args, **kwargs)
+
+    @contextmanager
+    def _observed(self, query: str, args: Any) -> Iterator[None]:
+        started = time.perf_counter()
+        exception: Optional[BaseException] = None
+        try:
+            yield
+        except BaseException as e:
+            exception = e
+            raise
+        finally:
+            DatabasePool._observe_query(self, query, args, time.perf_counter() - started, exception)
 
 
 class DatabasePool:
-    _instance: Pool | None = None
+    _pools: Dict[str, Pool] = {}
+    _pool_labels: Dict[Pool, Tuple[str, str]] = {}
+    _workloads: Dict[str, Workload] = {}
+    _replicas: Optional[ReplicaSet] = None
+    _statements: Dict[int, "OrderedDict[str, None]"] = {}
+    _statement_hits = 0
+    _statement_misses = 0
+    _statement_evictions = 0
+
+    @classmethod
+    def dsn(cls) -> str:
+        return _asyncpg_dsn(settings.database_url)
+
+    @classmethod
+    def replica_dsns(cls) -> List[str]:
+        return [_asyncpg_dsn(url) for url in settings.replica_database_urls]
 
     @classmethod
     async def initialize(cls) -> None:
-        if cls._instance is None:
-            database_url = str(settings.database_url.unicode_string()).replace(
-                "postgresql+asyncpg://", "postgresql://"
-            )
-            cls._instance = await asyncpg.create_pool(
-                database_url,
-                min_size=10,
-                max_size=20,
-                command_timeout=60,
-            )
+        if not cls._pools:
+            cls._workloads = configured_workloads()
+            cls._pools = await cls._create_pools(cls.dsn(), "primary")
+        if cls._replicas is None and settings.replica_database_urls:
+            cls._replicas = ReplicaSet(cls.replica_dsns(), cls._create_pools)
+            await cls._replicas.start()
 
     @classmethod
     async def close(cls) -> None:
-        if cls._instance:
-            await cls._instance.close()
-            cls._instance = None
+        await SlowQueryLog.flush()
+        if cls._replicas is not None:
+            await cls._replicas.close()
+            cls._replicas = None
+        pools, cls._pools = cls._pools, {}
+        for pool in pools.values():
+            await pool.close()
+        cls._workloads = {}
+        cls._pool_labels.clear()
+        cls._statements.clear()
+
+    @classmethod
+    async def _create_pools(cls, dsn: str, name: str) -> Dict[str, Pool]:
+        pools: Dict[str, Pool] = {}
+        try:
+            for workload in cls._workloads.values():
+                pools[workload.name] = await asyncpg.create_pool(
+                    dsn,
+                    min_size=workload.min_size,
+                    max_size=workload.max_size,
+                    command_timeout=workload.command_timeout,
+                    statement_cache_size=settings.statement_cache_size,
+                    server_settings={"application_name": f"book-{name}-{workload.name}"},
+                    init=cls._init_connection,
+                    connection_class=InstrumentedConnection,
+                )
+                cls._pool_labels[pools[workload.name]] = (name, workload.name)
+        except BaseException:
+            for pool in pools.values():
+                cls._pool_labels.pop(pool, None)
+                pool.terminate()
+            raise
+        return pools
+
+    @classmethod
+    async def _init_connection(cls, connection: Connection) -> None:
+        cls._statements[id(connection)] = OrderedDict()
+        connection.add_termination_listener(functools.partial(cls._forget_connection, id(connection)))
+
+    @classmethod
+    def _forget_connection(cls, key: int, connection: Connection) -> None:
+        cls._statements.pop(key, None)
+
+    @classmethod
+    def _observe_query(
+        cls,
+        connection: Connection,
+        query: str,
+        args: Any,
+        elapsed: float,
+        exception: Optional[BaseException],
+    ) -> None:
+        statements = cls._statements.get(id(connection))
+        if statements is not None:
+            cls._track_statement(statements, query)
+        operation = current_operation()
+        STATEMENT_SECONDS.observe(elapsed, operation)
+        record_timing("db", elapsed)
+        if current_span() is not None:
+            record_span(
+                "db",
+                "database",
+                elapsed,
+                statement=normalize_sql(query),
+                error=type(exception).__name__ if exception else None,
+            )
+        if exception is not None:
+            STATEMENT_ERRORS.inc(operation)
+            return
+        SlowQueryLog.observe(query, args, elapsed, operation, cls._explain)
+
+    @classmethod
+    async def _explain(cls, query: str, args: Any) -> str:
+        async with cls.acquire() as connection:
+            rows = await connection.fetch(f"EXPLAIN {query}", *args)
+        return "\n".join(row[0] for row in rows)
+
+    @classmethod
+    def _track_statement(cls, statements: "OrderedDict[str, None]", query: str) -> None:
+        if ";" in query.strip().rstrip(";"):
+            return
+        if query in statements:
+            statements.move_to_end(query)
+            cls._statement_hits += 1
+            return
+        
+        cls._statement_misses += 1
+        statements[query] = None
+        while len(statements) > settings.statement_cache_size:
+            statements.popitem(last=False)
+            cls._statement_evictions += 1
+
+    @classmethod
+    def statement_stats(cls) -> Dict[str, int]:
+        return {
+            "connections": len(cls._statements),
+            "statements": sum(len(statements) for statements in cls._statements.values()),
+            "hits": cls._statement_hits,
+            "misses": cls._statement_misses,
+            "evictions": cls._statement_evictions,
+        }
 
     @classmethod
     @asynccontextmanager
     async def acquire(cls) -> AsyncGenerator[Connection, None]:
-        if cls._instance is None:
+        if not cls._pools:
             await cls.initialize()
-        async with cls._instance.acquire() as connection:
+        workload = cls.workload()
+        pool = cls._pools[workload.name]
+        connection = await cls._checkout(pool, workload)
+        try:
             yield connection
+        finally:
+            await pool.release(connection)
 
     @classmethod
     @asynccontextmanager
-    async def transaction(cls) -> AsyncGenerator[Connection, None]:
+    async def reader(cls) -> AsyncGenerator[Connection, None]:
+        if not cls._pools:
+            await cls.initialize()
+        workload = cls.workload()
+        replicas = cls._replicas
+        pool = cls._pools[workload.name]
+        connection = None
+        if replicas is not None and not _primary_pinned.get():
+            replica = replicas.choose(workload.name)
+            if replica is not None:
+                try:
+                    connection = await cls._checkout(replica, workload)
+                    pool = replica
+                except ServiceUnavailableException:
+                    pass
+                except (OSError, asyncpg.PostgresConnectionError, asyncpg.InterfaceError):
+                    replicas.eject(replica)
+
+        if connection is None:
+            connection = await cls._checkout(pool, workload)
+        try:
+            yield connection
+        finally:
+            await pool.release(connection)
+
+    @classmethod
+    async def _checkout(cls, pool: Pool, workload: Workload) -> Connection:
+        labels = cls._pool_labels.get(pool, ("unknown", workload.name))
+        started = time.perf_counter()
+        try:
+            connection = await pool.acquire(timeout=workload.acquire_timeout)
+        except asyncio.TimeoutError:
+            ACQUIRE_TIMEOUTS.inc(*labels)
+            raise ServiceUnavailableException(
+                f"No {workload.name} database connection available"
+            ) from None
+        ACQUIRE_WAIT_SECONDS.observe(time.perf_counter() - started, *labels)
+        return connection
+
+    @classmethod
+    @asynccontextmanager
+    async def writer(cls) -> AsyncGenerator[Connection, None]:
+        cls.pin_primary()
+        async with cls.acquire() as connection:
+            yield connection
+
+    @classmethod
+    @asynccontextmanager
+    async def transaction(cls, readonly: bool = False) -> AsyncGenerator[Connection, None]:
+        async with (cls.reader() if readonly else cls.writer()) as connection:
+            started = time.perf_counter()
+            try:
+                async with connection.transaction(readonly=readonly):
+                    yield connection
+            finally:
+                TRANSACTION_SECONDS.observe(
+                    time.perf_counter() - started, cls.workload().name, str(readonly).lower()
+                )
+
+    @classmethod
+    def pool_stats(cls) -> List[Dict[str, Any]]:
+        stats = []
+        for pool, (name, workload) in list(cls._pool_labels.items()):
+            size = pool.get_size()
+            idle = pool.get_idle_size()
+            maximum = pool.get_max_size()
+            stats.append(
+                {
+                    "pool": name,
+                    "workload": workload,
+                    "size": size,
+                    "idle": idle,
+                    "in_use": size - idle,
+                    "max": maximum,
+                    "saturation": (size - idle) / maximum if maximum else 0.0,
+                }
+            )
+        return stats
+
+    @classmethod
+    async def ping(cls) -> float:
+        started = time.perf_counter()
         async with cls.acquire() as connection:
-            async with connection.transaction():
-                yield connection
\ No newline at end of file
+            await connection.fetchval("SELECT 1")
+        return time.perf_counter() - started
+
+    @classmethod
+    def pin_primary(cls) -> None:
+        _primary_pinned.set(True)
+
+    @classmethod
+    def is_pinned(cls) -> bool:
+        return _primary_pinned.get()
+
+    @classmethod
+    def workload(cls) -> Workload:
+        if not cls._workloads:
+            cls._workloads = configured_workloads()
+        return cls._workloads[_workload.get()]
+
+    @classmethod
+    def use_workload(cls, name: str) -> None:
+        if not cls._workloads:
+            cls._workloads = configured_workloads()
+        if name not in cls._workloads:
+            raise ValueError(f"Unknown workload: {name}")
+        _workload.set(name)
+
+    @classmethod
+    @contextmanager
+    def workload_scope(cls, name: str) -> Iterator[None]:
+        token = _workload.set(_workload.get())
+        try:
+            cls.use_workload(name)
+            yield
+        finally:
+            _workload.reset(token)
+
+    @classmethod
+    @contextmanager
+    def request_scope(cls) -> Iterator[None]:
+        pinned = _primary_pinned.set(False)
+        workload = _workload.set(INTERACTIVE)
+        try:
+            yield
+        finally:
+            _workload.reset(workload)
+            _primary_pinned.reset(pinned)
+
+    @classmethod
+    def replica_stats(cls) -> List[Dict[str, Any]]:
+        return cls._replicas.stats() if cls._replicas is not None else []
+
+    @classmethod
+    async def check_replicas(cls) -> None:
+        if cls._replicas is not None:
+            await cls._replicas.check()
+
+    @classmethod
+    async def copy_out(cls, query: str, *args: Any, **copy_options: Any) -> AsyncIterator[bytes]:
+        queue: asyncio.Queue = asyncio.Queue(maxsize=16)
+
+        async def write(data: bytearray) -> None:
+            await queue.put(bytes(data))
+
+        async def copy() -> None:
+            async with cls.reader() as connection:
+                await connection.copy_from_query(query, *args, output=write, **copy_options)
+
+        task = asyncio.create_task(copy())
+        try:
+            while True:
+                getter = asyncio.ensure_future(queue.get())
+                await asyncio.wait({getter, task}, return_when=asyncio.FIRST_COMPLETED)
+                if getter.done():
+                    yield getter.result()
+                    continue
+                getter.cancel()
+                break
+
+            while not queue.empty():
+                yield queue.get_nowait()
+            task.result()
+        finally:
+            if not task.done():
+                task.cancel()
+                with suppress(asyncio.CancelledError):
+                    await task
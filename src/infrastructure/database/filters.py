@@ -0,0 +1,30 @@
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class Filter:
+    column: str
+    operator: str = "="
+    pattern: Optional[str] = None
+
+
+class FilterSpec:
+    def __init__(self, **filters: Filter) -> None:
+        self.filters: Dict[str, Filter] = filters
+
+    def compile(self, **values: Any) -> Tuple[str, List[Any]]:
+        unknown = set(values) - set(self.filters)
+        if unknown:
+            raise TypeError(f"Unknown filters: {', '.join(sorted(unknown))}")
+        
+        query = ""
+        params: List[Any] = []
+        for name, spec in self.filters.items():
+            value = values.get(name)
+            if not value:
+                continue
+            
+            params.append(spec.pattern.format(value) if spec.pattern else value)
+            query += f" AND {spec.column} {spec.operator} ${len(params)}"
+        return query, params
@@ -0,0 +1,152 @@
+import asyncio
+import inspect
+import json
+import logging
+from contextlib import suppress
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, ClassVar, Dict, List, Optional, Union
+
+import asyncpg
+from asyncpg import Connection
+
+from src.core.config import settings
+from src.infrastructure.database.connection import DatabasePool
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "table_changes"
+TABLES = ("books", "authors", "users")
+
+
+@dataclass(frozen=True)
+class ChangeEvent:
+    table: str
+    op: str
+    ids: List[int] = field(default_factory=list)
+    genres: List[str] = field(default_factory=list)
+    author_ids: List[int] = field(default_factory=list)
+    all: bool = False
+
+    @classmethod
+    def from_payload(cls, payload: str) -> "ChangeEvent":
+        data = json.loads(payload)
+        return cls(
+            table=data["table"],
+            op=data["op"],
+            ids=data.get("ids", []),
+            genres=data.get("genres", []),
+            author_ids=data.get("author_ids", []),
+            all=data.get("all", False),
+        )
+
+
+ChangeHandler = Callable[[ChangeEvent], Union[None, Awaitable[None]]]
+
+
+class NotificationListener:
+    _handlers: ClassVar[Dict[str, List[ChangeHandler]]] = {}
+    _task: ClassVar[Optional[asyncio.Task]] = None
+    _connection: ClassVar[Optional[Connection]] = None
+    _connected: ClassVar[Optional[asyncio.Event]] = None
+
+    @classmethod
+    def register(cls, table: str, handler: ChangeHandler) -> None:
+        handlers = cls._handlers.setdefault(table, [])
+        if handler not in handlers:
+            handlers.append(handler)
+
+    @classmethod
+    def unregister(cls, table: str, handler: ChangeHandler) -> None:
+        with suppress(ValueError):
+            cls._handlers.get(table, []).remove(handler)
+
+    @classmethod
+    async def start(cls) -> None:
+        if cls._task is None:
+            cls._connected = asyncio.Event()
+            cls._task = asyncio.create_task(cls._run(cls._connected))
+
+    @classmethod
+    async def stop(cls) -> None:
+        if cls._task is not None:
+            cls._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await cls._task
+            cls._task = None
+
+    @classmethod
+    async def wait_connected(cls, timeout: Optional[float] = None) -> None:
+        if cls._connected is None:
+            raise RuntimeError("Notification listener is not running")
+        await asyncio.wait_for(cls._connected.wait(), timeout)
+
+    @classmethod
+    def backend_pid(cls) -> Optional[int]:
+        return cls._connection.get_server_pid() if cls._connection else None
+
+    @classmethod
+    async def dispatch(cls, event: ChangeEvent) -> None:
+        for handler in list(cls._handlers.get(event.table, [])):
+            try:
+                result = handler(event)
+                if inspect.isawaitable(result):
+                    await result
+            except Exception:
+                logger.exception("Change handler failed for %s %s", event.table, event.op)
+
+    @classmethod
+    async def _run(cls, connected: asyncio.Event) -> None:
+        delay = settings.notifications_reconnect_delay
+        while True:
+            try:
+                connection = await asyncpg.connect(DatabasePool.dsn())
+            except (OSError, asyncpg.PostgresError, asyncio.TimeoutError) as e:
+                logger.warning("Notification listener could not connect: %s", e)
+            except Exception:
+                logger.exception("Notification listener could not connect")
+            else:
+                delay = settings.notifications_reconnect_delay
+                try:
+                    await cls._listen(connection, connected)
+                except (OSError, asyncpg.PostgresError, asyncpg.InterfaceError, asyncio.TimeoutError) as e:
+                    logger.warning("Notification listener lost its connection: %s", e)
+                except Exception:
+                    logger.exception("Notification listener failed")
+                finally:
+                    connected.clear()
+                    cls._connection = None
+                    with suppress(Exception):
+                        await connection.close(timeout=1)
+            
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, settings.notifications_max_reconnect_delay)
+
+    @classmethod
+    async def _listen(cls, connection: Connection, connected: asyncio.Event) -> None:
+        queue: asyncio.Queue = asyncio.Queue()
+        connection.add_termination_listener(lambda _: queue.put_nowait(None))
+        await connection.add_listener(
+            CHANNEL, lambda _connection, _pid, _channel, payload: queue.put_nowait(payload)
+        )
+        cls._connection = connection
+        connected.set()
+        
+        for table in TABLES:
+            await cls.dispatch(ChangeEvent(table=table, op="RESYNC", all=True))
+        
+        while True:
+            try:
+                payload = await asyncio.wait_for(queue.get(), settings.notifications_keepalive)
+            except asyncio.TimeoutError:
+                await connection.fetchval("SELECT 1", timeout=settings.notifications_keepalive)
+                continue
+            
+            if payload is None:
+                raise ConnectionError("Listener connection was terminated")
+            
+            try:
+                event = ChangeEvent.from_payload(payload)
+            except (ValueError, KeyError, TypeError) as e:
+                logger.warning("Ignoring malformed change notification %r: %s", payload, e)
+                continue
+            await cls.dispatch(event)
@@ -0,0 +1,113 @@
+import asyncio
+import logging
+from contextlib import suppress
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+import asyncpg
+from asyncpg import Pool
+
+from src.core.config import settings
+from src.infrastructure.database.workloads import INTERACTIVE
+
+logger = logging.getLogger(__name__)
+
+LAG_QUERY = """
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+    END
+"""
+
+PoolFactory = Callable[[str, str], Awaitable[Dict[str, Pool]]]
+
+
+@dataclass
+class Replica:
+    name: str
+    dsn: str
+    pools: Dict[str, Pool] = field(default_factory=dict)
+    healthy: bool = False
+    lag: Optional[float] = None
+    failures: int = 0
+
+
+class ReplicaSet:
+    def __init__(self, dsns: List[str], pool_factory: PoolFactory) -> None:
+        self.replicas = [Replica(f"replica-{i}", dsn) for i, dsn in enumerate(dsns)]
+        self._pool_factory = pool_factory
+        self._next = 0
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        await self.check()
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        for replica in self.replicas:
+            pools, replica.pools = replica.pools, {}
+            for pool in pools.values():
+                await pool.close()
+            replica.healthy = False
+
+    def choose(self, workload: str) -> Optional[Pool]:
+        healthy = [replica for replica in self.replicas if replica.healthy]
+        if not healthy:
+            return None
+        replica = healthy[self._next % len(healthy)]
+        self._next += 1
+        return replica.pools[workload]
+
+    def eject(self, pool: Pool) -> None:
+        for replica in self.replicas:
+            if replica.healthy and any(candidate is pool for candidate in replica.pools.values()):
+                logger.warning("Ejecting %s after a connection failure", replica.name)
+                replica.healthy = False
+
+    async def check(self) -> None:
+        await asyncio.gather(*(self._check(replica) for replica in self.replicas))
+
+    def stats(self) -> List[Dict[str, Any]]:
+        return [
+            {
+                "name": replica.name,
+                "healthy": replica.healthy,
+                "lag": replica.lag,
+                "failures": replica.failures,
+            }
+            for replica in self.replicas
+        ]
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(settings.replica_check_interval)
+            await self.check()
+
+    async def _check(self, replica: Replica) -> None:
+        try:
+            if not replica.pools:
+                replica.pools = await self._pool_factory(replica.dsn, replica.name)
+            lag = await replica.pools[INTERACTIVE].fetchval(LAG_QUERY, timeout=settings.replica_check_interval)
+        except (OSError, asyncio.TimeoutError, asyncpg.PostgresError, asyncpg.InterfaceError) as exc:
+            replica.failures += 1
+            if replica.failures == 1:
+                logger.warning("Replica %s is unavailable: %s", replica.name, exc)
+            replica.healthy = False
+            replica.lag = None
+            return
+
+        replica.failures = 0
+        replica.lag = float(lag)
+        healthy = replica.lag <= settings.replica_max_lag
+        if replica.healthy and not healthy:
+            logger.warning("Ejecting %s: %.1fs behind the primary", replica.name, replica.lag)
+        elif healthy and not replica.healthy:
+            logger.info("Replica %s is serving reads", replica.name)
+        replica.healthy = healthy
@@ -0,0 +1,116 @@
+import asyncio
+import contextvars
+import logging
+import re
+import time
+from typing import Any, Awaitable, Callable, ClassVar, Dict, Optional, Sequence, Set
+
+from src.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE = re.compile(r"\s+")
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"(?<![$\w.])\d+(?:\.\d+)?\b")
+_EXPLAINABLE = ("SELECT", "WITH", "INSERT", "UPDATE", "DELETE")
+
+Explain = Callable[[str, Sequence[Any]], Awaitable[str]]
+
+
+def normalize_sql(query: str) -> str:
+    query = _STRING_LITERAL.sub("?", query)
+    query = _NUMBER_LITERAL.sub("?", query)
+    return _WHITESPACE.sub(" ", query).strip()
+
+
+def parameter_shape(args: Sequence[Any]) -> str:
+    shapes = []
+    for value in args:
+        if isinstance(value, (list, tuple)):
+            shapes.append(f"{type(value).__name__}[{len(value)}]")
+        else:
+            shapes.append(type(value).__name__)
+    return "(" + ", ".join(shapes) + ")"
+
+
+class SlowQueryLog:
+    _explained: ClassVar[Dict[str, float]] = {}
+    _tasks: ClassVar[Set[asyncio.Task]] = set()
+
+    @classmethod
+    def observe(
+        cls,
+        query: str,
+        args: Sequence[Any],
+        elapsed: float,
+        operation: str,
+        explain: Explain,
+    ) -> None:
+        threshold = settings.slow_query_threshold
+        if threshold <= 0 or elapsed < threshold:
+            return
+
+        normalized = normalize_sql(query)
+        if not cls._should_explain(normalized):
+            cls._log(normalized, args, elapsed, operation, None)
+            return
+
+        task = asyncio.create_task(
+            cls._explain(query, args, elapsed, operation, explain),
+            context=contextvars.Context(),
+        )
+        cls._tasks.add(task)
+        task.add_done_callback(cls._tasks.discard)
+
+    @classmethod
+    async def flush(cls) -> None:
+        if cls._tasks:
+            await asyncio.gather(*cls._tasks, return_exceptions=True)
+
+    @classmethod
+    def _should_explain(cls, normalized: str) -> bool:
+        if not settings.slow_query_explain or not normalized.upper().startswith(_EXPLAINABLE):
+            return False
+        if ";" in normalized.rstrip(";"):
+            return False
+        now = time.monotonic()
+        last = cls._explained.get(normalized)
+        if last is not None and now - last < settings.slow_query_explain_interval:
+            return False
+        cls._explained[normalized] = now
+        if len(cls._explained) > 1024:
+            oldest = min(cls._explained, key=cls._explained.__getitem__)
+            del cls._explained[oldest]
+        return True
+
+    @classmethod
+    async def _explain(
+        cls,
+        query: str,
+        args: Sequence[Any],
+        elapsed: float,
+        operation: str,
+        explain: Explain,
+    ) -> None:
+        try:
+            plan: Optional[str] = await explain(query, args)
+        except Exception as exc:
+            plan = f"EXPLAIN failed: {exc}"
+        cls._log(normalize_sql(query), args, elapsed, operation, plan)
+
+    @staticmethod
+    def _log(
+        normalized: str,
+        args: Sequence[Any],
+        elapsed: float,
+        operation: str,
+        plan: Optional[str],
+    ) -> None:
+        logger.warning(
+            "Slow query %.1fms in %s: %s params=%s%s",
+            elapsed * 1000,
+            operation,
+            normalized,
+            parameter_shape(args),
+            f"\n{plan}" if plan else "",
+        )
@@ -0,0 +1,35 @@
+from dataclasses import dataclass
+from typing import Dict
+
+from src.core.config import settings
+
+INTERACTIVE = "interactive"
+BATCH = "batch"
+
+
+@dataclass(frozen=True)
+class Workload:
+    name: str
+    min_size: int
+    max_size: int
+    acquire_timeout: float
+    command_timeout: float
+
+
+def configured_workloads() -> Dict[str, Workload]:
+    return {
+        INTERACTIVE: Workload(
+            INTERACTIVE,
+            min_size=settings.pool_min_size,
+            max_size=settings.pool_max_size,
+            acquire_timeout=settings.pool_acquire_timeout,
+            command_timeout=settings.pool_command_timeout,
+        ),
+        BATCH: Workload(
+            BATCH,
+            min_size=settings.batch_pool_min_size,
+            max_size=settings.batch_pool_max_size,
+            acquire_timeout=settings.batch_pool_acquire_timeout,
+            command_timeout=settings.batch_pool_command_timeout,
+        ),
+    }
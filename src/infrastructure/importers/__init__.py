@@ -0,0 +1,3 @@
+from .readers import JsonArrayReader, csv_rows, iter_batches
+
+__all__ = ["JsonArrayReader", "csv_rows", "iter_batches"]
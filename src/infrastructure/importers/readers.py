@@ -0,0 +1,112 @@
+import asyncio
+import csv
+import io
+import json
+from itertools import islice
+from typing import Any, AsyncIterator, BinaryIO, Dict, Iterator, List
+
+
+def csv_rows(file: BinaryIO) -> Iterator[Dict[str, str]]:
+    return csv.DictReader(io.TextIOWrapper(file, encoding="utf-8-sig", newline=""))
+
+
+class JsonArrayReader:
+    def __init__(
+        self,
+        file: BinaryIO,
+        chunk_size: int = 64 * 1024,
+        max_item_size: int = 1024 * 1024,
+    ) -> None:
+        self._text = io.TextIOWrapper(file, encoding="utf-8-sig")
+        self._decoder = json.JSONDecoder()
+        self._chunk_size = chunk_size
+        self._max_item_size = max_item_size
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+        self._started = False
+        self._done = False
+
+    def __iter__(self) -> "JsonArrayReader":
+        return self
+
+    def __next__(self) -> Any:
+        if not self._started:
+            self._started = True
+            self._skip_whitespace()
+            if self._peek() != "[":
+                raise ValueError("JSON must contain an array of books")
+            self._pos += 1
+            self._skip_whitespace()
+            if self._peek() == "]":
+                self._pos += 1
+                self._done = True
+
+        if self._done:
+            self._expect_end()
+            raise StopIteration
+
+        item = self._decode_item()
+
+        self._skip_whitespace()
+        separator = self._peek()
+        if separator == ",":
+            self._pos += 1
+            self._skip_whitespace()
+        elif separator == "]":
+            self._pos += 1
+            self._done = True
+        else:
+            raise ValueError("Invalid JSON format")
+        return item
+
+    def _decode_item(self) -> Any:
+        while True:
+            try:
+                item, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise ValueError("Invalid JSON format")
+                if len(self._buffer) - self._pos > self._max_item_size:
+                    raise ValueError("JSON array item exceeds the maximum allowed size")
+                self._fill()
+                continue
+
+            if end == len(self._buffer) and not self._eof:
+                self._fill()
+                continue
+
+            self._pos = end
+            return item
+
+    def _fill(self) -> None:
+        chunk = self._text.read(self._chunk_size)
+        self._buffer = self._buffer[self._pos:] + chunk
+        self._pos = 0
+        self._eof = not chunk
+
+    def _peek(self) -> str:
+        if self._pos >= len(self._buffer) and not self._eof:
+            self._fill()
+        return self._buffer[self._pos] if self._pos < len(self._buffer) else ""
+
+    def _skip_whitespace(self) -> None:
+        while True:
+            while self._pos < len(self._buffer) and self._buffer[self._pos].isspace():
+                self._pos += 1
+            if self._pos < len(self._buffer) or self._eof:
+                return
+            self._fill()
+
+    def _expect_end(self) -> None:
+        self._skip_whitespace()
+        if self._peek():
+            raise ValueError("Unexpected data after the JSON array")
+
+
+async def iter_batches(rows: Iterator[Any], batch_size: int) -> AsyncIterator[List[Any]]:
+    while True:
+        batch = await asyncio.to_thread(lambda: list(islice(rows, batch_size)))
+        if not batch:
+            return
+        yield batch
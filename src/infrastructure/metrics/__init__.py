@@ -0,0 +1,15 @@
+from .event_loop import LoopBlock, LoopMonitor
+from .instrumentation import current_operation, instrument_repository
+from .registry import Counter, Gauge, Histogram, MetricsRegistry, registry
+
+__all__ = [
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "MetricsRegistry",
+    "registry",
+    "current_operation",
+    "instrument_repository",
+    "LoopBlock",
+    "LoopMonitor",
+]
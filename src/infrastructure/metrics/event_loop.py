@@ -0,0 +1,131 @@
+import asyncio
+import logging
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from contextlib import suppress
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import ClassVar, Deque, List, Optional
+
+from src.core.config import settings
+from src.infrastructure.metrics.registry import registry
+
+logger = logging.getLogger(__name__)
+
+LAG_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+LOOP_LAG_SECONDS = registry.histogram(
+    "event_loop_lag_seconds",
+    "Delay between a scheduled loop wakeup and when it actually ran",
+    buckets=LAG_BUCKETS,
+)
+LOOP_BLOCKS = registry.counter(
+    "event_loop_blocks_total",
+    "Loop stalls longer than LOOP_BLOCK_THRESHOLD",
+)
+registry.gauge(
+    "event_loop_block_threshold_seconds",
+    "Configured lag above which a stall is recorded and logged",
+    collect=lambda: [((), settings.loop_block_threshold)],
+)
+
+
+@dataclass(frozen=True)
+class LoopBlock:
+    detected_at: datetime
+    duration: float
+    task: Optional[str]
+    stack: List[str]
+
+
+class LoopMonitor:
+    _task: ClassVar[Optional[asyncio.Task]] = None
+    _watchdog: ClassVar[Optional[threading.Thread]] = None
+    _stopping: ClassVar[threading.Event] = threading.Event()
+    _heartbeat: ClassVar[float] = 0.0
+    _captured: ClassVar[Optional[tuple]] = None
+    _blocks: ClassVar[Deque[LoopBlock]] = deque(maxlen=50)
+
+    @classmethod
+    async def start(cls) -> None:
+        if cls._task is not None:
+            return
+        loop = asyncio.get_running_loop()
+        cls._blocks = deque(maxlen=settings.loop_block_history)
+        cls._heartbeat = time.monotonic()
+        cls._captured = None
+        cls._stopping = threading.Event()
+        cls._task = asyncio.create_task(cls._sample())
+        cls._watchdog = threading.Thread(
+            target=cls._watch,
+            args=(loop, threading.get_ident(), cls._stopping),
+            name="loop-watchdog",
+            daemon=True,
+        )
+        cls._watchdog.start()
+
+    @classmethod
+    async def stop(cls) -> None:
+        cls._stopping.set()
+        if cls._task is not None:
+            cls._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await cls._task
+            cls._task = None
+        if cls._watchdog is not None:
+            cls._watchdog.join(timeout=1)
+            cls._watchdog = None
+
+    @classmethod
+    def blocks(cls, limit: int) -> List[LoopBlock]:
+        return list(cls._blocks)[-limit:][::-1] if limit > 0 else []
+
+    @classmethod
+    async def _sample(cls) -> None:
+        interval = settings.loop_monitor_interval
+        while True:
+            expected = time.monotonic() + interval
+            await asyncio.sleep(interval)
+            now = time.monotonic()
+            cls._heartbeat = now
+            lag = max(0.0, now - expected)
+            LOOP_LAG_SECONDS.observe(lag)
+            captured, cls._captured = cls._captured, None
+            if lag >= settings.loop_block_threshold:
+                cls._record(lag, captured)
+
+    @classmethod
+    def _record(cls, lag: float, captured: Optional[tuple]) -> None:
+        task, stack = captured if captured is not None else (None, [])
+        block = LoopBlock(datetime.now(timezone.utc), lag, task, stack)
+        cls._blocks.append(block)
+        LOOP_BLOCKS.inc()
+        logger.warning(
+            "Event loop blocked for %.0fms in %s%s",
+            lag * 1000,
+            task or "an unknown callback",
+            "\n" + "".join(stack) if stack else "",
+        )
+
+    @classmethod
+    def _watch(cls, loop: asyncio.AbstractEventLoop, thread_id: int, stopping: threading.Event) -> None:
+        interval = settings.loop_monitor_interval
+        threshold = settings.loop_block_threshold
+        beat = None
+        while not stopping.wait(max(threshold / 2, 0.01)):
+            heartbeat = cls._heartbeat
+            if heartbeat == beat or time.monotonic() - heartbeat < interval + threshold:
+                continue
+            frame = sys._current_frames().get(thread_id)
+            if frame is None:
+                continue
+            task = asyncio.current_task(loop)
+            name = f"{task.get_name()} ({getattr(task.get_coro(), '__qualname__', '?')})" if task else None
+            cls._captured = (
+                name,
+                traceback.format_stack(frame, limit=settings.loop_block_stack_depth),
+            )
+            beat = heartbeat
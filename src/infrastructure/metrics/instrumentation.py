@@ -0,0 +1,61 @@
+import functools
+import inspect
+import time
+from contextvars import ContextVar
+from typing import Any, Callable, Type, TypeVar
+
+from src.infrastructure.metrics.registry import registry
+
+T = TypeVar("T")
+
+_operation: ContextVar[str] = ContextVar("operation", default="other")
+
+REPOSITORY_CALL_SECONDS = registry.histogram(
+    "repository_call_duration_seconds",
+    "Time spent in repository methods, including connection waits",
+    ("repository", "method"),
+)
+
+
+def current_operation() -> str:
+    return _operation.get()
+
+
+def _instrument_coroutine(method: Callable[..., Any], repository: str, name: str) -> Callable[..., Any]:
+    operation = f"{repository}.{name}"
+
+    @functools.wraps(method)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        token = _operation.set(operation)
+        started = time.perf_counter()
+        try:
+            return await method(*args, **kwargs)
+        finally:
+            REPOSITORY_CALL_SECONDS.observe(time.perf_counter() - started, repository, name)
+            _operation.reset(token)
+
+    return wrapper
+
+
+def _instrument_generator(method: Callable[..., Any], repository: str, name: str) -> Callable[..., Any]:
+    @functools.wraps(method)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        started = time.perf_counter()
+        try:
+            async for item in method(*args, **kwargs):
+                yield item
+        finally:
+            REPOSITORY_CALL_SECONDS.observe(time.perf_counter() - started, repository, name)
+
+    return wrapper
+
+
+def instrument_repository(cls: Type[T]) -> Type[T]:
+    for name, attribute in list(vars(cls).items()):
+        if name.startswith("_"):
+            continue
+        if inspect.iscoroutinefunction(attribute):
+            setattr(cls, name, _instrument_coroutine(attribute, cls.__name__, name))
+        elif inspect.isasyncgenfunction(attribute):
+            setattr(cls, name, _instrument_generator(attribute, cls.__name__, name))
+    return cls
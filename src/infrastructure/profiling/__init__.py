@@ -0,0 +1,3 @@
+from .store import ProfileRecord, ProfileStore
+
+__all__ = ["ProfileRecord", "ProfileStore"]
@@ -0,0 +1,107 @@
+import cProfile
+import io
+import json
+import os
+import pstats
+import tracemalloc
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from typing import List, Optional
+
+from src.core.config import settings
+
+
+@dataclass(frozen=True)
+class ProfileRecord:
+    id: str
+    method: str
+    path: str
+    status_code: Optional[int]
+    duration_ms: float
+    created_at: datetime
+    files: List[str]
+
+
+class ProfileStore:
+    @staticmethod
+    def directory() -> str:
+        return os.path.abspath(settings.profiling_dir)
+
+    @classmethod
+    def save(
+        cls,
+        profile_id: str,
+        method: str,
+        path: str,
+        status_code: Optional[int],
+        duration: float,
+        profiler: cProfile.Profile,
+        allocations: Optional[List[tracemalloc.StatisticDiff]],
+    ) -> ProfileRecord:
+        directory = cls.directory()
+        os.makedirs(directory, exist_ok=True)
+        base = os.path.join(directory, profile_id)
+
+        profiler.dump_stats(f"{base}.prof")
+        report = io.StringIO()
+        report.write(f"{method} {path} -> {status_code} in {duration * 1000:.1f}ms\n\n")
+        pstats.Stats(profiler, stream=report).sort_stats("cumulative").print_stats(
+            settings.profiling_top_functions
+        )
+        if allocations is not None:
+            report.write("Top allocation sites (size delta during the request):\n")
+            for stat in allocations[: settings.profiling_top_allocations]:
+                report.write(f"{stat}\n")
+        with open(f"{base}.txt", "w", encoding="utf-8") as file:
+            file.write(report.getvalue())
+
+        record = ProfileRecord(
+            id=profile_id,
+            method=method,
+            path=path,
+            status_code=status_code,
+            duration_ms=duration * 1000,
+            created_at=datetime.now(timezone.utc),
+            files=[f"{profile_id}.prof", f"{profile_id}.txt"],
+        )
+        with open(f"{base}.json", "w", encoding="utf-8") as file:
+            json.dump(asdict(record), file, default=str)
+        cls._prune(directory)
+        return record
+
+    @classmethod
+    def list(cls) -> List[ProfileRecord]:
+        directory = cls.directory()
+        if not os.path.isdir(directory):
+            return []
+        records = []
+        for name in os.listdir(directory):
+            if not name.endswith(".json"):
+                continue
+            try:
+                with open(os.path.join(directory, name), encoding="utf-8") as file:
+                    data = json.load(file)
+            except (OSError, ValueError):
+                continue
+            data["created_at"] = datetime.fromisoformat(data["created_at"])
+            records.append(ProfileRecord(**data))
+        return sorted(records, key=lambda record: record.created_at, reverse=True)
+
+    @classmethod
+    def report(cls, profile_id: str) -> Optional[str]:
+        if os.path.basename(profile_id) != profile_id:
+            return None
+        try:
+            with open(os.path.join(cls.directory(), f"{profile_id}.txt"), encoding="utf-8") as file:
+                return file.read()
+        except OSError:
+            return None
+
+    @classmethod
+    def _prune(cls, directory: str) -> None:
+        for record in cls.list()[settings.profiling_max_profiles:]:
+            for name in record.files + [f"{record.id}.json"]:
+                try:
+                    os.remove(os.path.join(directory, name))
+                except OSError:
+                    pass
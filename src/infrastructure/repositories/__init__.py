@@ -1,5 +1,13 @@
 from .author_repository_impl import AuthorRepositoryImpl
 from .book_repository_impl import BookRepositoryImpl
+from .cache_invalidation import register_cache_invalidation
+from .cache_metrics import register_cache_metrics
 from .user_repository_impl import UserRepositoryImpl
 
-__all__ = ["BookRepositoryImpl", "AuthorRepositoryImpl", "UserRepositoryImpl"]
\ No newline at end of file
+__all__ = [
+    "BookRepositoryImpl",
+    "AuthorRepositoryImpl",
+    "UserRepositoryImpl",
+    "register_cache_invalidation",
+    "register_cache_metrics",
+]
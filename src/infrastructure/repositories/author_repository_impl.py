@@ -1,13 +1,47 @@
-from typing import List, Optional
+import json
+from dataclasses import replace
+from typing import Any, ClassVar, Dict, List, Optional, Set, Tuple
 
+from src.core.config import settings
+from src.core.tracing import traced
 from src.domain.entities import Author
 from src.domain.repositories import AuthorRepository
-from src.infrastructure.database import DatabasePool
+from src.infrastructure.cache import CachedEntity, TTLLRUCache
+from src.infrastructure.database import (
+    ChangeEvent,
+    DatabasePool,
+    Filter,
+    FilterSpec,
+    NotificationListener,
+)
+from src.infrastructure.metrics import instrument_repository
 
+AUTHOR_COLUMNS = [
+    "id",
+    "name",
+    "biography",
+    "birth_year",
+    "nationality",
+    "created_at",
+    "updated_at",
+]
 
+AUTHOR_FILTERS = FilterSpec(
+    name=Filter("name", "ILIKE", "%{}%"),
+    nationality=Filter("nationality", "ILIKE", "%{}%"),
+)
+
+
+@traced("repository")
+@instrument_repository
 class AuthorRepositoryImpl(AuthorRepository):
+    cache: ClassVar[TTLLRUCache[int, CachedEntity[Author]]] = TTLLRUCache(
+        max_size=settings.entity_cache_size,
+        ttl=settings.entity_cache_ttl,
+    )
+
     async def create(self, author: Author) -> Author:
-        async with DatabasePool.acquire() as connection:
+        async with DatabasePool.writer() as connection:
             row = await connection.fetchrow(
                 """
                 INSERT INTO authors (name, biography, birth_year, nationality)
@@ -22,6 +56,11 @@ class AuthorRepositoryImpl(AuthorRepository):
             return self._row_to_author(row)
 
     async def get_by_id(self, author_id: int) -> Optional[Author]:
+        cached = self.cache.get(author_id)
+        if cached is not None:
+            return replace(cached.entity)
+        
+        generation = self.cache.generation()
         async with DatabasePool.acquire() as connection:
             row = await connection.fetchrow(
                 """
@@ -31,7 +70,12 @@ class AuthorRepositoryImpl(AuthorRepository):
                 """,
                 author_id,
             )
-            return self._row_to_author(row) if row else None
+        if not row:
+            return None
+        
+        author = self._row_to_author(row)
+        self.cache.set(author_id, CachedEntity(replace(author)), generation)
+        return author
 
     async def get_by_name(self, name: str) -> Optional[Author]:
         async with DatabasePool.acquire() as connection:
@@ -45,6 +89,17 @@ class AuthorRepositoryImpl(AuthorRepository):
             )
             return self._row_to_author(row) if row else None
 
+    async def get_existing_ids(self, author_ids: List[int]) -> Set[int]:
+        if not author_ids:
+            return set()
+        
+        async with DatabasePool.acquire() as connection:
+            rows = await connection.fetch(
+                "SELECT id FROM authors WHERE id = ANY($1::int[])",
+                author_ids,
+            )
+            return {row["id"] for row in rows}
+
     async def get_all(
         self,
         limit: int = 100,
@@ -52,40 +107,57 @@ class AuthorRepositoryImpl(AuthorRepository):
         name: Optional[str] = None,
         nationality: Optional[str] = None,
     ) -> List[Author]:
-        query = """
-            SELECT id, name, biography, birth_year, nationality, created_at, updated_at
-            FROM authors
-            WHERE 1=1
-        """
-        params = []
-        param_count = 0
+        filters, params = self._build_filters(name, nationality)
+        query, params = self._build_page_query(filters, params, limit, offset)
 
-        if name:
-            param_count += 1
-            query += f" AND LOWER(name) LIKE LOWER(${param_count})"
-            params.append(f"%{name}%")
-
-        if nationality:
-            param_count += 1
-            query += f" AND LOWER(nationality) LIKE LOWER(${param_count})"
-            params.append(f"%{nationality}%")
+        async with DatabasePool.reader() as connection:
+            rows = await connection.fetch(query, *params)
+            return [self._row_to_author(row) for row in rows]
 
-        query += " ORDER BY name ASC"
+    async def get_page(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        name: Optional[str] = None,
+        nationality: Optional[str] = None,
+        with_total: bool = True,
+    ) -> Tuple[List[Author], Optional[int]]:
+        rows, total = await self.get_page_rows(limit, offset, name, nationality, with_total)
+        return [self._row_to_author(row) for row in rows], total
 
-        param_count += 1
-        query += f" LIMIT ${param_count}"
-        params.append(limit)
+    async def get_page_rows(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        name: Optional[str] = None,
+        nationality: Optional[str] = None,
+        with_total: bool = True,
+    ) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        filters, params = self._build_filters(name, nationality)
+        page_query, params = self._build_page_query(filters, params, limit, offset)
+        if not with_total:
+            async with DatabasePool.reader() as connection:
+                rows = await connection.fetch(page_query, *params)
+                return [dict(row) for row in rows], None
 
-        param_count += 1
-        query += f" OFFSET ${param_count}"
-        params.append(offset)
+        query = f"""
+            SELECT total.count AS total, page.*
+            FROM (SELECT COUNT(*) AS count FROM authors WHERE 1=1{filters}) AS total
+            LEFT JOIN LATERAL ({page_query}) AS page ON TRUE
+            ORDER BY page.name ASC, page.id ASC
+        """
 
-        async with DatabasePool.acquire() as connection:
+        async with DatabasePool.reader() as connection:
             rows = await connection.fetch(query, *params)
-            return [self._row_to_author(row) for row in rows]
+            total = rows[0]["total"] if rows else 0
+            return [
+                {column: row[column] for column in AUTHOR_COLUMNS}
+                for row in rows
+                if row["id"] is not None
+            ], total
 
     async def update(self, author_id: int, author: Author) -> Optional[Author]:
-        async with DatabasePool.acquire() as connection:
+        async with DatabasePool.writer() as connection:
             row = await connection.fetchrow(
                 """
                 UPDATE authors
@@ -99,39 +171,78 @@ class AuthorRepositoryImpl(AuthorRepository):
                 author.birth_year,
                 author.nationality,
             )
-            return self._row_to_author(row) if row else None
+        self.cache.invalidate(author_id)
+        return self._row_to_author(row) if row else None
 
     async def delete(self, author_id: int) -> bool:
-        async with DatabasePool.acquire() as connection:
+        async with DatabasePool.writer() as connection:
             result = await connection.execute(
                 "DELETE FROM authors WHERE id = $1",
                 author_id,
             )
-            return result != "DELETE 0"
+        self.cache.invalidate(author_id)
+        if result == "DELETE 0":
+            return False
+        
+        await NotificationListener.dispatch(
+            ChangeEvent(table="authors", op="DELETE", ids=[author_id])
+        )
+        return True
 
     async def count(
         self,
         name: Optional[str] = None,
         nationality: Optional[str] = None,
     ) -> int:
-        query = "SELECT COUNT(*) FROM authors WHERE 1=1"
-        params = []
-        param_count = 0
-
-        if name:
-            param_count += 1
-            query += f" AND LOWER(name) LIKE LOWER(${param_count})"
-            params.append(f"%{name}%")
-
-        if nationality:
-            param_count += 1
-            query += f" AND LOWER(nationality) LIKE LOWER(${param_count})"
-            params.append(f"%{nationality}%")
+        filters, params = self._build_filters(name, nationality)
+        query = f"SELECT COUNT(*) FROM authors WHERE 1=1{filters}"
 
-        async with DatabasePool.acquire() as connection:
+        async with DatabasePool.reader() as connection:
             count = await connection.fetchval(query, *params)
             return count or 0
 
+    async def estimate_count(
+        self,
+        name: Optional[str] = None,
+        nationality: Optional[str] = None,
+    ) -> int:
+        filters, params = self._build_filters(name, nationality)
+        query = f"EXPLAIN (FORMAT JSON) SELECT 1 FROM authors WHERE 1=1{filters}"
+
+        async with DatabasePool.reader() as connection:
+            plan = await connection.fetchval(query, *params)
+            return int(json.loads(plan)[0]["Plan"]["Plan Rows"])
+
+    @staticmethod
+    def _build_filters(
+        name: Optional[str],
+        nationality: Optional[str],
+    ) -> Tuple[str, List[Any]]:
+        return AUTHOR_FILTERS.compile(name=name, nationality=nationality)
+
+    @staticmethod
+    def _build_page_query(
+        filters: str,
+        params: List[Any],
+        limit: int,
+        offset: int,
+    ) -> Tuple[str, List[Any]]:
+        query = f"""
+            SELECT id, name, biography, birth_year, nationality, created_at, updated_at
+            FROM authors
+            WHERE 1=1{filters}
+            ORDER BY name ASC, id ASC
+        """
+        params = list(params)
+
+        params.append(limit)
+        query += f" LIMIT ${len(params)}"
+
+        params.append(offset)
+        query += f" OFFSET ${len(params)}"
+
+        return query, params
+
     @staticmethod
     def _row_to_author(row) -> Author:
         return Author(
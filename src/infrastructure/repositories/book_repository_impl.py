@@ -1,14 +1,80 @@
-from datetime import datetime
-from typing import List, Optional
+import json
+from dataclasses import replace
+from typing import (
+    Any,
+    AsyncIterator,
+    ClassVar,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+)
 
+import asyncpg
+
+from src.core.config import settings
+from src.core.exceptions import ConflictException, ValidationException
+from src.core.tracing import traced
 from src.domain.entities import Book, Genre
 from src.domain.repositories import BookRepository
-from src.infrastructure.database import DatabasePool
+from src.infrastructure.cache import CachedEntity, TTLLRUCache, VersionCounters
+from src.infrastructure.database import DatabasePool, Filter, FilterSpec
+from src.infrastructure.metrics import instrument_repository
+
+BOOK_COLUMNS = [
+    "id",
+    "title",
+    "author_id",
+    "genre",
+    "published_year",
+    "isbn",
+    "description",
+    "created_at",
+    "updated_at",
+]
+
+COPY_COLUMNS = ["title", "author_id", "genre", "published_year", "isbn", "description"]
+
+BOOK_FILTERS = FilterSpec(
+    title=Filter("title", "ILIKE", "%{}%"),
+    author_id=Filter("author_id"),
+    genre=Filter("genre"),
+    year_from=Filter("published_year", ">="),
+    year_to=Filter("published_year", "<="),
+)
+
+CachedPage = Tuple[List[Dict[str, Any]], Optional[int]]
 
 
+def _page_size(page: CachedPage) -> int:
+    rows, _ = page
+    return 256 + sum(
+        800 + len(row["title"]) + len(row["isbn"] or "") + len(row["description"] or "")
+        for row in rows
+    )
+
+
+@traced("repository")
+@instrument_repository
 class BookRepositoryImpl(BookRepository):
+    cache: ClassVar[TTLLRUCache[int, CachedEntity[Book]]] = TTLLRUCache(
+        max_size=settings.entity_cache_size,
+        ttl=settings.entity_cache_ttl,
+    )
+    list_cache: ClassVar[TTLLRUCache[Tuple[Any, ...], CachedPage]] = TTLLRUCache(
+        max_size=settings.list_cache_size,
+        ttl=settings.list_cache_ttl,
+        max_bytes=settings.list_cache_max_bytes,
+        sizer=_page_size,
+    )
+    list_versions: ClassVar[VersionCounters] = VersionCounters()
+
     async def create(self, book: Book) -> Book:
-        async with DatabasePool.acquire() as connection:
+        async with DatabasePool.writer() as connection:
             row = await connection.fetchrow(
                 """
                 INSERT INTO books (title, author_id, genre, published_year, isbn, description)
@@ -22,9 +88,15 @@ class BookRepositoryImpl(BookRepository):
                 book.isbn,
                 book.description,
             )
-            return self._row_to_book(row)
+        self.bump_list_versions([book.genre.value], [book.author_id])
+        return self._row_to_book(row)
 
     async def get_by_id(self, book_id: int) -> Optional[Book]:
+        cached = self.cache.get(book_id)
+        if cached is not None:
+            return replace(cached.entity)
+        
+        generation = self.cache.generation()
         async with DatabasePool.acquire() as connection:
             row = await connection.fetchrow(
                 """
@@ -34,7 +106,12 @@ class BookRepositoryImpl(BookRepository):
                 """,
                 book_id,
             )
-            return self._row_to_book(row) if row else None
+        if not row:
+            return None
+        
+        book = self._row_to_book(row)
+        self.cache.set(book_id, CachedEntity(replace(book)), generation)
+        return book
 
     async def get_all(
         self,
@@ -47,66 +124,224 @@ class BookRepositoryImpl(BookRepository):
         year_to: Optional[int] = None,
         sort_by: Optional[str] = None,
         order: str = "asc",
+        after: Optional[Tuple[Any, int]] = None,
     ) -> List[Book]:
-        query = """
+        filters, params = self._build_filters(title, author_id, genre, year_from, year_to)
+        query, params = self._build_page_query(
+            filters, params, limit, offset, sort_by, order, after
+        )
+
+        async with DatabasePool.reader() as connection:
+            rows = await connection.fetch(query, *params)
+            return [self._row_to_book(row) for row in rows]
+
+    async def get_page(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        title: Optional[str] = None,
+        author_id: Optional[int] = None,
+        genre: Optional[str] = None,
+        year_from: Optional[int] = None,
+        year_to: Optional[int] = None,
+        sort_by: Optional[str] = None,
+        order: str = "asc",
+        after: Optional[Tuple[Any, int]] = None,
+        with_total: bool = True,
+    ) -> Tuple[List[Book], Optional[int]]:
+        rows, total = await self.get_page_rows(
+            limit, offset, title, author_id, genre, year_from, year_to, sort_by, order, after, with_total
+        )
+        return [self._row_to_book(row) for row in rows], total
+
+    async def get_page_rows(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        title: Optional[str] = None,
+        author_id: Optional[int] = None,
+        genre: Optional[str] = None,
+        year_from: Optional[int] = None,
+        year_to: Optional[int] = None,
+        sort_by: Optional[str] = None,
+        order: str = "asc",
+        after: Optional[Tuple[Any, int]] = None,
+        with_total: bool = True,
+    ) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        key = (
+            self.list_versions.token(self._list_scopes(author_id, genre)),
+            limit,
+            offset,
+            title,
+            author_id,
+            genre,
+            year_from,
+            year_to,
+            self.resolve_sort(sort_by, order),
+            after,
+            with_total,
+        )
+        cached = self.list_cache.get(key)
+        if cached is not None:
+            return cached
+        
+        page = await self._fetch_page(
+            limit, offset, title, author_id, genre, year_from, year_to, sort_by, order, after, with_total
+        )
+        self.list_cache.set(key, page)
+        return page
+
+    async def _fetch_page(
+        self,
+        limit: int,
+        offset: int,
+        title: Optional[str],
+        author_id: Optional[int],
+        genre: Optional[str],
+        year_from: Optional[int],
+        year_to: Optional[int],
+        sort_by: Optional[str],
+        order: str,
+        after: Optional[Tuple[Any, int]],
+        with_total: bool,
+    ) -> CachedPage:
+        filters, params = self._build_filters(title, author_id, genre, year_from, year_to)
+        page_query, params = self._build_page_query(
+            filters, params, limit, offset, sort_by, order, after
+        )
+        if not with_total:
+            async with DatabasePool.acquire() as connection:
+                rows = await connection.fetch(page_query, *params)
+                return [dict(row) for row in rows], None
+
+        sort_field, direction = self.resolve_sort(sort_by, order)
+        query = f"""
+            SELECT total.count AS total, page.*
+            FROM (SELECT COUNT(*) AS count FROM books WHERE 1=1{filters}) AS total
+            LEFT JOIN LATERAL ({page_query}) AS page ON TRUE
+            ORDER BY page.{sort_field} {direction}, page.id {direction}
+        """
+
+        async with DatabasePool.acquire() as connection:
+            rows = await connection.fetch(query, *params)
+            total = rows[0]["total"] if rows else 0
+            return [
+                {column: row[column] for column in BOOK_COLUMNS}
+                for row in rows
+                if row["id"] is not None
+            ], total
+
+    async def search(
+        self,
+        query: str,
+        limit: int = 100,
+        offset: int = 0,
+        author_id: Optional[int] = None,
+        genre: Optional[str] = None,
+        year_from: Optional[int] = None,
+        year_to: Optional[int] = None,
+    ) -> Tuple[List[Book], int]:
+        filters, params = self._build_filters(None, author_id, genre, year_from, year_to)
+        params.append(query)
+        search = f"search_vector @@ websearch_to_tsquery('english', ${len(params)})"
+        rank = f"ts_rank_cd(search_vector, websearch_to_tsquery('english', ${len(params)}))"
+        params.extend([limit, offset])
+        sql = f"""
+            SELECT total.count AS total, page.*
+            FROM (SELECT COUNT(*) AS count FROM books WHERE {search}{filters}) AS total
+            LEFT JOIN LATERAL (
+                SELECT id, title, author_id, genre, published_year, isbn, description,
+                       created_at, updated_at, {rank} AS rank
+                FROM books
+                WHERE {search}{filters}
+                ORDER BY rank DESC, id ASC
+                LIMIT ${len(params) - 1} OFFSET ${len(params)}
+            ) AS page ON TRUE
+            ORDER BY page.rank DESC, page.id ASC
+        """
+
+        async with DatabasePool.reader() as connection:
+            rows = await connection.fetch(sql, *params)
+            total = rows[0]["total"] if rows else 0
+            return [self._row_to_book(row) for row in rows if row["id"] is not None], total
+
+    async def stream(
+        self,
+        title: Optional[str] = None,
+        author_id: Optional[int] = None,
+        genre: Optional[str] = None,
+        year_from: Optional[int] = None,
+        year_to: Optional[int] = None,
+        sort_by: Optional[str] = None,
+        order: str = "asc",
+        chunk_size: int = 1000,
+    ) -> AsyncIterator[List[Book]]:
+        async for rows in self.stream_rows(
+            title, author_id, genre, year_from, year_to, sort_by, order, chunk_size
+        ):
+            yield [self._row_to_book(row) for row in rows]
+
+    async def stream_rows(
+        self,
+        title: Optional[str] = None,
+        author_id: Optional[int] = None,
+        genre: Optional[str] = None,
+        year_from: Optional[int] = None,
+        year_to: Optional[int] = None,
+        sort_by: Optional[str] = None,
+        order: str = "asc",
+        chunk_size: int = 1000,
+    ) -> AsyncIterator[List[Mapping[str, Any]]]:
+        filters, params = self._build_filters(title, author_id, genre, year_from, year_to)
+        sort_field, direction = self.resolve_sort(sort_by, order)
+        query = f"""
             SELECT id, title, author_id, genre, published_year, isbn, description, created_at, updated_at
             FROM books
-            WHERE 1=1
+            WHERE 1=1{filters}
+            ORDER BY {sort_field} {direction}, id {direction}
         """
-        params = []
-        param_count = 0
-
-        if title:
-            param_count += 1
-            query += f" AND LOWER(title) LIKE LOWER(${param_count})"
-            params.append(f"%{title}%")
-
-        if author_id:
-            param_count += 1
-            query += f" AND author_id = ${param_count}"
-            params.append(author_id)
-
-        if genre:
-            param_count += 1
-            query += f" AND genre = ${param_count}"
-            params.append(genre)
-
-        if year_from:
-            param_count += 1
-            query += f" AND published_year >= ${param_count}"
-            params.append(year_from)
-
-        if year_to:
-            param_count += 1
-            query += f" AND published_year <= ${param_count}"
-            params.append(year_to)
-
-        valid_sort_fields = {"title", "published_year", "created_at", "updated_at"}
-        if sort_by and sort_by in valid_sort_fields:
-            query += f" ORDER BY {sort_by} {order.upper()}"
-        else:
-            query += " ORDER BY created_at DESC"
-
-        param_count += 1
-        query += f" LIMIT ${param_count}"
-        params.append(limit)
 
-        param_count += 1
-        query += f" OFFSET ${param_count}"
-        params.append(offset)
+        async with DatabasePool.transaction(readonly=True) as connection:
+            cursor = await connection.cursor(query, *params)
+            while True:
+                rows = await cursor.fetch(chunk_size)
+                if not rows:
+                    break
+                yield rows
 
-        async with DatabasePool.acquire() as connection:
-            rows = await connection.fetch(query, *params)
-            return [self._row_to_book(row) for row in rows]
+    async def copy_csv(
+        self,
+        title: Optional[str] = None,
+        author_id: Optional[int] = None,
+        genre: Optional[str] = None,
+        year_from: Optional[int] = None,
+        year_to: Optional[int] = None,
+        sort_by: Optional[str] = None,
+        order: str = "asc",
+    ) -> AsyncIterator[bytes]:
+        filters, params = self._build_filters(title, author_id, genre, year_from, year_to)
+        sort_field, direction = self.resolve_sort(sort_by, order)
+        query = f"""
+            SELECT id, title, author_id, genre, published_year, isbn, description
+            FROM books
+            WHERE 1=1{filters}
+            ORDER BY {sort_field} {direction}, id {direction}
+        """
+
+        async for chunk in DatabasePool.copy_out(query, *params, format="csv", header=True):
+            yield chunk
 
     async def update(self, book_id: int, book: Book) -> Optional[Book]:
-        async with DatabasePool.acquire() as connection:
+        async with DatabasePool.writer() as connection:
             row = await connection.fetchrow(
                 """
                 UPDATE books
                 SET title = $2, author_id = $3, genre = $4, published_year = $5, isbn = $6, description = $7
-                WHERE id = $1
-                RETURNING id, title, author_id, genre, published_year, isbn, description, created_at, updated_at
+                FROM (SELECT id, genre, author_id FROM books WHERE id = $1 FOR UPDATE) AS old
+                WHERE books.id = old.id
+                RETURNING books.id, books.title, books.author_id, books.genre, books.published_year,
+                          books.isbn, books.description, books.created_at, books.updated_at,
+                          old.genre AS old_genre, old.author_id AS old_author_id
                 """,
                 book_id,
                 book.title,
@@ -116,15 +351,27 @@ class BookRepositoryImpl(BookRepository):
                 book.isbn,
                 book.description,
             )
-            return self._row_to_book(row) if row else None
+        self.cache.invalidate(book_id)
+        if not row:
+            return None
+        
+        self.bump_list_versions(
+            [row["genre"], row["old_genre"]], [row["author_id"], row["old_author_id"]]
+        )
+        return self._row_to_book(row)
 
     async def delete(self, book_id: int) -> bool:
-        async with DatabasePool.acquire() as connection:
-            result = await connection.execute(
-                "DELETE FROM books WHERE id = $1",
+        async with DatabasePool.writer() as connection:
+            row = await connection.fetchrow(
+                "DELETE FROM books WHERE id = $1 RETURNING genre, author_id",
                 book_id,
             )
-            return result != "DELETE 0"
+        self.cache.invalidate(book_id)
+        if not row:
+            return False
+        
+        self.bump_list_versions([row["genre"]], [row["author_id"]])
+        return True
 
     async def count(
         self,
@@ -134,39 +381,28 @@ class BookRepositoryImpl(BookRepository):
         year_from: Optional[int] = None,
         year_to: Optional[int] = None,
     ) -> int:
-        query = "SELECT COUNT(*) FROM books WHERE 1=1"
-        params = []
-        param_count = 0
-
-        if title:
-            param_count += 1
-            query += f" AND LOWER(title) LIKE LOWER(${param_count})"
-            params.append(f"%{title}%")
-
-        if author_id:
-            param_count += 1
-            query += f" AND author_id = ${param_count}"
-            params.append(author_id)
-
-        if genre:
-            param_count += 1
-            query += f" AND genre = ${param_count}"
-            params.append(genre)
-
-        if year_from:
-            param_count += 1
-            query += f" AND published_year >= ${param_count}"
-            params.append(year_from)
-
-        if year_to:
-            param_count += 1
-            query += f" AND published_year <= ${param_count}"
-            params.append(year_to)
+        filters, params = self._build_filters(title, author_id, genre, year_from, year_to)
+        query = f"SELECT COUNT(*) FROM books WHERE 1=1{filters}"
 
-        async with DatabasePool.acquire() as connection:
+        async with DatabasePool.reader() as connection:
             count = await connection.fetchval(query, *params)
             return count or 0
 
+    async def estimate_count(
+        self,
+        title: Optional[str] = None,
+        author_id: Optional[int] = None,
+        genre: Optional[str] = None,
+        year_from: Optional[int] = None,
+        year_to: Optional[int] = None,
+    ) -> int:
+        filters, params = self._build_filters(title, author_id, genre, year_from, year_to)
+        query = f"EXPLAIN (FORMAT JSON) SELECT 1 FROM books WHERE 1=1{filters}"
+
+        async with DatabasePool.reader() as connection:
+            plan = await connection.fetchval(query, *params)
+            return int(json.loads(plan)[0]["Plan"]["Plan Rows"])
+
     async def bulk_create(self, books: List[Book]) -> List[Book]:
         async with DatabasePool.transaction() as connection:
             values = [
@@ -187,7 +423,55 @@ class BookRepositoryImpl(BookRepository):
                 [v[4] for v in values],
                 [v[5] for v in values],
             )
-            return [self._row_to_book(row) for row in rows]
+        self.bump_list_versions([b.genre.value for b in books], [b.author_id for b in books])
+        return [self._row_to_book(row) for row in rows]
+
+    async def copy_create(self, books: List[Book]) -> List[Book]:
+        async with DatabasePool.transaction() as connection:
+            await connection.execute(
+                """
+                CREATE TEMP TABLE books_staging (
+                    position INTEGER,
+                    title TEXT,
+                    author_id INTEGER,
+                    genre TEXT,
+                    published_year INTEGER,
+                    isbn TEXT,
+                    description TEXT
+                ) ON COMMIT DROP
+                """
+            )
+            await connection.copy_records_to_table(
+                "books_staging",
+                records=[(i, *self._book_to_record(b)) for i, b in enumerate(books)],
+                columns=["position", *COPY_COLUMNS],
+            )
+            rows = await connection.fetch(
+                """
+                INSERT INTO books (title, author_id, genre, published_year, isbn, description)
+                SELECT title, author_id, genre, published_year, isbn, description
+                FROM books_staging
+                ORDER BY position
+                RETURNING id, title, author_id, genre, published_year, isbn, description, created_at, updated_at
+                """
+            )
+        self.bump_list_versions([b.genre.value for b in books], [b.author_id for b in books])
+        return [self._row_to_book(row) for row in rows]
+
+    async def copy_insert(self, books: List[Book]) -> int:
+        try:
+            async with DatabasePool.transaction() as connection:
+                result = await connection.copy_records_to_table(
+                    "books",
+                    records=[self._book_to_record(b) for b in books],
+                    columns=COPY_COLUMNS,
+                )
+        except asyncpg.DataError as e:
+            raise ValidationException(str(e)) from e
+        except asyncpg.IntegrityConstraintViolationError as e:
+            raise ConflictException(str(e)) from e
+        self.bump_list_versions([b.genre.value for b in books], [b.author_id for b in books])
+        return int(result.split()[-1])
 
     async def get_by_isbn(self, isbn: str) -> Optional[Book]:
         async with DatabasePool.acquire() as connection:
@@ -201,6 +485,92 @@ class BookRepositoryImpl(BookRepository):
             )
             return self._row_to_book(row) if row else None
 
+    async def get_existing_isbns(self, isbns: List[str]) -> Set[str]:
+        if not isbns:
+            return set()
+
+        async with DatabasePool.acquire() as connection:
+            rows = await connection.fetch(
+                "SELECT isbn FROM books WHERE isbn = ANY($1::text[])",
+                isbns,
+            )
+            return {row["isbn"] for row in rows}
+
+    @classmethod
+    def bump_list_versions(cls, genres: Iterable[str], author_ids: Iterable[int]) -> None:
+        scopes: Set[Hashable] = {("genre", genre) for genre in genres}
+        scopes.update(("author", author_id) for author_id in author_ids)
+        cls.list_versions.bump(scopes)
+
+    @staticmethod
+    def _list_scopes(author_id: Optional[int], genre: Optional[str]) -> List[Hashable]:
+        scopes: List[Hashable] = []
+        if genre is not None:
+            scopes.append(("genre", genre))
+        if author_id is not None:
+            scopes.append(("author", author_id))
+        return scopes
+
+    @staticmethod
+    def _build_filters(
+        title: Optional[str],
+        author_id: Optional[int],
+        genre: Optional[str],
+        year_from: Optional[int],
+        year_to: Optional[int],
+    ) -> Tuple[str, List[Any]]:
+        return BOOK_FILTERS.compile(
+            title=title,
+            author_id=author_id,
+            genre=genre,
+            year_from=year_from,
+            year_to=year_to,
+        )
+
+    def _build_page_query(
+        self,
+        filters: str,
+        params: List[Any],
+        limit: int,
+        offset: int,
+        sort_by: Optional[str],
+        order: str,
+        after: Optional[Tuple[Any, int]],
+    ) -> Tuple[str, List[Any]]:
+        query = f"""
+            SELECT id, title, author_id, genre, published_year, isbn, description, created_at, updated_at
+            FROM books
+            WHERE 1=1{filters}
+        """
+        params = list(params)
+        sort_field, direction = self.resolve_sort(sort_by, order)
+
+        if after is not None:
+            comparator = ">" if direction == "ASC" else "<"
+            params.extend(after)
+            query += f" AND ({sort_field}, id) {comparator} (${len(params) - 1}, ${len(params)})"
+
+        query += f" ORDER BY {sort_field} {direction}, id {direction}"
+
+        params.append(limit)
+        query += f" LIMIT ${len(params)}"
+
+        params.append(offset)
+        query += f" OFFSET ${len(params)}"
+
+        return query, params
+
+    @staticmethod
+    def _book_to_record(book: Book) -> Tuple[Any, ...]:
+        return (
+            book.title,
+            book.author_id,
+            book.genre.value,
+            book.published_year,
+            book.isbn,
+            book.description,
+        )
+
     @staticmethod
     def _row_to_book(row) -> Book:
         return Book(
@@ -0,0 +1,47 @@
+from src.domain.entities import Genre
+from src.infrastructure.database import ChangeEvent, NotificationListener
+from src.infrastructure.repositories.author_repository_impl import AuthorRepositoryImpl
+from src.infrastructure.repositories.book_repository_impl import BookRepositoryImpl
+from src.infrastructure.repositories.user_repository_impl import UserRepositoryImpl
+
+
+def invalidate_books(event: ChangeEvent) -> None:
+    if event.all:
+        BookRepositoryImpl.cache.clear()
+        BookRepositoryImpl.list_versions.bump_all()
+        return
+    
+    for book_id in event.ids:
+        BookRepositoryImpl.cache.invalidate(book_id)
+    BookRepositoryImpl.bump_list_versions(event.genres, event.author_ids)
+
+
+def invalidate_authors(event: ChangeEvent) -> None:
+    if event.all:
+        AuthorRepositoryImpl.cache.clear()
+        return
+    
+    for author_id in event.ids:
+        AuthorRepositoryImpl.cache.invalidate(author_id)
+    
+    if event.op == "DELETE" and event.ids:
+        deleted = set(event.ids)
+        BookRepositoryImpl.cache.invalidate_where(
+            lambda cached: cached.entity.author_id in deleted
+        )
+        BookRepositoryImpl.bump_list_versions([genre.value for genre in Genre], deleted)
+
+
+def invalidate_users(event: ChangeEvent) -> None:
+    if event.all:
+        UserRepositoryImpl.cache.clear()
+        return
+    
+    for user_id in event.ids:
+        UserRepositoryImpl.cache.invalidate(user_id)
+
+
+def register_cache_invalidation() -> None:
+    NotificationListener.register("books", invalidate_books)
+    NotificationListener.register("authors", invalidate_authors)
+    NotificationListener.register("users", invalidate_users)
@@ -0,0 +1,54 @@
+from typing import Dict, Iterable, Tuple
+
+from src.infrastructure.cache import TTLLRUCache
+from src.infrastructure.metrics import registry
+from src.infrastructure.repositories.author_repository_impl import AuthorRepositoryImpl
+from src.infrastructure.repositories.book_repository_impl import BookRepositoryImpl
+from src.infrastructure.repositories.user_repository_impl import UserRepositoryImpl
+
+
+def _caches() -> Dict[str, TTLLRUCache]:
+    return {
+        "books": BookRepositoryImpl.cache,
+        "book_lists": BookRepositoryImpl.list_cache,
+        "authors": AuthorRepositoryImpl.cache,
+        "users": UserRepositoryImpl.cache,
+    }
+
+
+def _samples(key: str) -> Iterable[Tuple[Tuple[str, ...], float]]:
+    for name, cache in _caches().items():
+        yield (name,), cache.stats()[key]
+
+
+def register_cache_metrics() -> None:
+    registry.gauge(
+        "cache_entries",
+        "Entries held by an in-process cache",
+        ("cache",),
+        collect=lambda: _samples("size"),
+    )
+    registry.gauge(
+        "cache_bytes",
+        "Approximate bytes held by an in-process cache",
+        ("cache",),
+        collect=lambda: _samples("bytes"),
+    )
+    registry.counter(
+        "cache_hits_total",
+        "Cache lookups answered from memory",
+        ("cache",),
+        collect=lambda: _samples("hits"),
+    )
+    registry.counter(
+        "cache_misses_total",
+        "Cache lookups that fell through to the database",
+        ("cache",),
+        collect=lambda: _samples("misses"),
+    )
+    registry.counter(
+        "cache_evictions_total",
+        "Entries evicted for size or byte budget",
+        ("cache",),
+        collect=lambda: _samples("evictions"),
+    )
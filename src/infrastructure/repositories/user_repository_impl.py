@@ -1,13 +1,25 @@
-from typing import Optional
+from dataclasses import replace
+from typing import ClassVar, Optional
 
+from src.core.config import settings
+from src.core.tracing import traced
 from src.domain.entities import User
 from src.domain.repositories import UserRepository
+from src.infrastructure.cache import TTLLRUCache
 from src.infrastructure.database import DatabasePool
+from src.infrastructure.metrics import instrument_repository
 
 
+@traced("repository")
+@instrument_repository
 class UserRepositoryImpl(UserRepository):
+    cache: ClassVar[TTLLRUCache[int, User]] = TTLLRUCache(
+        max_size=settings.user_cache_size,
+        ttl=settings.user_cache_ttl,
+    )
+
     async def create(self, user: User) -> User:
-        async with DatabasePool.acquire() as connection:
+        async with DatabasePool.writer() as connection:
             row = await connection.fetchrow(
                 """
                 INSERT INTO users (email, username, hashed_password, is_active, is_superuser)
@@ -23,6 +35,11 @@ class UserRepositoryImpl(UserRepository):
             return self._row_to_user(row)
 
     async def get_by_id(self, user_id: int) -> Optional[User]:
+        cached = self.cache.get(user_id)
+        if cached is not None:
+            return replace(cached)
+        
+        generation = self.cache.generation()
         async with DatabasePool.acquire() as connection:
             row = await connection.fetchrow(
                 """
@@ -32,7 +49,13 @@ class UserRepositoryImpl(UserRepository):
                 """,
                 user_id,
             )
-            return self._row_to_user(row) if row else None
+        if not row:
+            return None
+        
+        user = self._row_to_user(row)
+        if user.is_active:
+            self.cache.set(user_id, replace(user), generation)
+        return user
 
     async def get_by_email(self, email: str) -> Optional[User]:
         async with DatabasePool.acquire() as connection:
@@ -59,7 +82,7 @@ class UserRepositoryImpl(UserRepository):
             return self._row_to_user(row) if row else None
 
     async def update(self, user_id: int, user: User) -> Optional[User]:
-        async with DatabasePool.acquire() as connection:
+        async with DatabasePool.writer() as connection:
             row = await connection.fetchrow(
                 """
                 UPDATE users
@@ -74,15 +97,17 @@ class UserRepositoryImpl(UserRepository):
                 user.is_active,
                 user.is_superuser,
             )
-            return self._row_to_user(row) if row else None
+        self.cache.invalidate(user_id)
+        return self._row_to_user(row) if row else None
 
     async def delete(self, user_id: int) -> bool:
-        async with DatabasePool.acquire() as connection:
+        async with DatabasePool.writer() as connection:
             result = await connection.execute(
                 "DELETE FROM users WHERE id = $1",
                 user_id,
             )
-            return result != "DELETE 0"
+        self.cache.invalidate(user_id)
+        return result != "DELETE 0"
 
     @staticmethod
     def _row_to_user(row) -> User:
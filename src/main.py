@@ -1,11 +1,17 @@
+import asyncio
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+from fastapi import FastAPI, status
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, PlainTextResponse
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
 from src.api.middleware import (
+    DatabaseRoutingMiddleware,
+    ProfilingMiddleware,
+    ServerTimingMiddleware,
+    TracingMiddleware,
     domain_exception_handler,
     http_exception_handler,
     validation_exception_handler,
@@ -13,14 +19,26 @@ from src.api.middleware import (
 from src.api.v1.endpoints import api_router
 from src.core.config import settings
 from src.core.exceptions import DomainException
-from src.infrastructure.database import DatabasePool
+from src.core.security import shutdown_password_executor
+from src.infrastructure.database import DatabasePool, NotificationListener
+from src.infrastructure.metrics import LoopMonitor, registry
+from src.infrastructure.repositories import register_cache_invalidation, register_cache_metrics
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     await DatabasePool.initialize()
+    register_cache_metrics()
+    if settings.loop_monitor_enabled:
+        await LoopMonitor.start()
+    register_cache_invalidation()
+    if settings.notifications_enabled:
+        await NotificationListener.start()
     yield
+    await LoopMonitor.stop()
+    await NotificationListener.stop()
     await DatabasePool.close()
+    shutdown_password_executor()
 
 
 app = FastAPI(
@@ -37,6 +55,10 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(DatabaseRoutingMiddleware)
+app.add_middleware(ServerTimingMiddleware)
+app.add_middleware(TracingMiddleware)
+app.add_middleware(ProfilingMiddleware)
 
 app.add_exception_handler(DomainException, domain_exception_handler)
 app.add_exception_handler(RequestValidationError, validation_exception_handler)
@@ -57,4 +79,32 @@ async def root():
 
 @app.get("/health")
 async def health_check():
-    return {"status": "healthy"}
\ No newline at end of file
+    try:
+        round_trip = await asyncio.wait_for(DatabasePool.ping(), settings.health_check_timeout)
+    except Exception as e:
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content={
+                "status": "unavailable",
+                "detail": str(e) or type(e).__name__,
+                "pools": DatabasePool.pool_stats(),
+            },
+        )
+    
+    pools = DatabasePool.pool_stats()
+    saturated = any(
+        pool["saturation"] >= settings.health_pool_saturation
+        for pool in pools
+        if pool["pool"] == "primary"
+    )
+    return {
+        "status": "degraded" if saturated else "healthy",
+        "database": {"round_trip_ms": round(round_trip * 1000, 3)},
+        "pools": pools,
+        "replicas": DatabasePool.replica_stats(),
+    }
+
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    return PlainTextResponse(registry.render(), media_type="text/plain; version=0.0.4")
\ No newline at end of file
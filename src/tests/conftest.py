@@ -4,7 +4,9 @@ from typing import AsyncGenerator, Generator
 import pytest
 from httpx import ASGITransport, AsyncClient
 
-from src.infrastructure.database import DatabasePool
+from src.core.config import settings
+from src.infrastructure.database import ChangeEvent, DatabasePool, NotificationListener
+from src.infrastructure.repositories import UserRepositoryImpl, register_cache_invalidation
 from src.main import app
 
 
@@ -18,6 +20,7 @@ def event_loop() -> Generator:
 @pytest.fixture(scope="session")
 async def setup_database():
     await DatabasePool.initialize()
+    register_cache_invalidation()
     yield
     await DatabasePool.close()
 
@@ -49,4 +52,40 @@ async def authenticated_client(client: AsyncClient) -> AsyncClient:
     token = response.json()["access_token"]
     
     client.headers["Authorization"] = f"Bearer {token}"
-    return client
\ No newline at end of file
+    return client
+
+
+@pytest.fixture
+async def promote_to_superuser(setup_database) -> AsyncGenerator:
+    async def set_superuser(value: bool) -> None:
+        async with DatabasePool.acquire() as connection:
+            await connection.execute(
+                "UPDATE users SET is_superuser = $1 WHERE username = 'testuser'", value
+            )
+        UserRepositoryImpl.cache.clear()
+    
+    async def promote() -> None:
+        await set_superuser(True)
+    
+    yield promote
+    await set_superuser(False)
+
+@pytest.fixture
+async def notification_listener(setup_database, monkeypatch) -> AsyncGenerator[asyncio.Queue, None]:
+    monkeypatch.setattr(settings, "notifications_reconnect_delay", 0.05)
+    events: asyncio.Queue = asyncio.Queue()
+    
+    def capture(event: ChangeEvent) -> None:
+        events.put_nowait(event)
+    
+    register_cache_invalidation()
+    for table in ("books", "authors", "users"):
+        NotificationListener.register(table, capture)
+    await NotificationListener.start()
+    await NotificationListener.wait_connected(timeout=5)
+    try:
+        yield events
+    finally:
+        await NotificationListener.stop()
+        for table in ("books", "authors", "users"):
+            NotificationListener.unregister(table, capture)
@@ -53,4 +53,25 @@ async def test_create_author_unauthorized(client: AsyncClient):
     }
     
     response = await client.post("/api/v1/authors/", json=author_data)
-    assert response.status_code == 403
\ No newline at end of file
+    assert response.status_code == 403
+
+@pytest.mark.asyncio
+async def test_get_authors_total_past_last_page(client: AsyncClient):
+    first_page = await client.get("/api/v1/authors/?page=1&size=5")
+    past_end = await client.get("/api/v1/authors/?page=100000&size=5")
+    
+    assert past_end.status_code == 200
+    assert past_end.json()["items"] == []
+    assert past_end.json()["total"] == first_page.json()["total"]
+
+
+@pytest.mark.asyncio
+async def test_get_authors_count_modes(client: AsyncClient):
+    response = await client.get("/api/v1/authors/?count=none")
+    
+    assert response.status_code == 200
+    assert response.json()["count_mode"] == "none"
+    assert response.json()["total"] is None
+    
+    response = await client.get("/api/v1/authors/?count=invalid")
+    assert response.status_code == 422
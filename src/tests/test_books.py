@@ -1,6 +1,9 @@
 import pytest
 from httpx import AsyncClient
 
+from src.api.dependencies import body_etag
+from src.api.v1.schemas import BookPagination
+
 
 @pytest.mark.asyncio
 async def test_create_book_unauthorized(client: AsyncClient):
@@ -78,4 +81,237 @@ async def test_bulk_import_books_unauthorized(client: AsyncClient):
     }
     
     response = await client.post("/api/v1/books/bulk", json=bulk_data)
-    assert response.status_code == 403
\ No newline at end of file
+    assert response.status_code == 403
+
+@pytest.mark.asyncio
+async def test_get_books_invalid_cursor(client: AsyncClient):
+    response = await client.get("/api/v1/books/?cursor=not-a-cursor")
+    
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_get_books_cursor_pagination(authenticated_client: AsyncClient):
+    author_response = await authenticated_client.post(
+        "/api/v1/authors/",
+        json={"name": "Cursor Author", "nationality": "USA"},
+    )
+    author_id = author_response.json()["id"]
+    
+    for i in range(5):
+        await authenticated_client.post(
+            "/api/v1/books/",
+            json={
+                "title": f"Cursor Book {i}",
+                "author_id": author_id,
+                "genre": "Fiction",
+                "published_year": 2000 + i,
+            },
+        )
+    
+    seen: list[int] = []
+    url = f"/api/v1/books/?author_id={author_id}&size=2&sort_by=published_year&order=desc"
+    response = await authenticated_client.get(url)
+    while True:
+        assert response.status_code == 200
+        data = response.json()
+        seen.extend(book["published_year"] for book in data["items"])
+        if not data["next_cursor"]:
+            break
+        response = await authenticated_client.get(f"{url}&cursor={data['next_cursor']}")
+    
+    assert seen == [2004, 2003, 2002, 2001, 2000]
+
+
+@pytest.mark.asyncio
+async def test_get_books_without_count(client: AsyncClient):
+    response = await client.get("/api/v1/books/?count=none")
+    
+    assert response.status_code == 200
+    data = response.json()
+    assert data["count_mode"] == "none"
+    assert data["total"] is None
+    assert data["pages"] is None
+    assert isinstance(data["has_next"], bool)
+
+
+@pytest.mark.asyncio
+async def test_get_books_estimated_count_below_threshold(client: AsyncClient):
+    response = await client.get("/api/v1/books/?count=estimate&genre=Fiction")
+    
+    assert response.status_code == 200
+    data = response.json()
+    assert data["count_mode"] == "exact"
+    assert isinstance(data["total"], int)
+
+
+@pytest.mark.asyncio
+async def test_search_books_ranks_title_matches_first(authenticated_client: AsyncClient):
+    author_response = await authenticated_client.post(
+        "/api/v1/authors/",
+        json={"name": "Search Author"},
+    )
+    author_id = author_response.json()["id"]
+    
+    await authenticated_client.post(
+        "/api/v1/books/",
+        json={
+            "title": "Voyage Home",
+            "author_id": author_id,
+            "genre": "Fiction",
+            "published_year": 2001,
+            "description": "A story about lighthouses.",
+        },
+    )
+    await authenticated_client.post(
+        "/api/v1/books/",
+        json={
+            "title": "Lighthouses of the North",
+            "author_id": author_id,
+            "genre": "History",
+            "published_year": 2005,
+        },
+    )
+    
+    response = await authenticated_client.get(
+        f"/api/v1/books/search?q=lighthouse&author_id={author_id}"
+    )
+    
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total"] == 2
+    assert [book["title"] for book in data["items"]] == ["Lighthouses of the North", "Voyage Home"]
+    
+    response = await authenticated_client.get(
+        f"/api/v1/books/search?q=lighthouse&author_id={author_id}&genre=Fiction"
+    )
+    assert [book["title"] for book in response.json()["items"]] == ["Voyage Home"]
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_books_with_and_without_returning(authenticated_client: AsyncClient):
+    author_response = await authenticated_client.post(
+        "/api/v1/authors/", json={"name": "Bulk Author"}
+    )
+    author_id = author_response.json()["id"]
+    books = [
+        {"title": f"Bulk {i}", "author_id": author_id, "genre": "Poetry", "published_year": 1999}
+        for i in range(3)
+    ]
+    
+    response = await authenticated_client.post("/api/v1/books/bulk", json={"books": books})
+    assert response.status_code == 201
+    assert [book["title"] for book in response.json()] == ["Bulk 0", "Bulk 1", "Bulk 2"]
+    
+    response = await authenticated_client.post(
+        "/api/v1/books/bulk?returning=false", json={"books": books}
+    )
+    assert response.status_code == 201
+    assert response.json() == {"created": 3}
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_books_reports_offending_rows(authenticated_client: AsyncClient):
+    author_response = await authenticated_client.post(
+        "/api/v1/authors/", json={"name": "Row Author"}
+    )
+    author_id = author_response.json()["id"]
+    books = [
+        {"title": "Row 1", "author_id": author_id, "genre": "Poetry", "published_year": 1999, "isbn": "111-1"},
+        {"title": "Row 2", "author_id": 999999, "genre": "Poetry", "published_year": 1999},
+        {"title": "Row 3", "author_id": author_id, "genre": "Poetry", "published_year": 1999},
+    ]
+    
+    response = await authenticated_client.post("/api/v1/books/bulk", json={"books": books})
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Row 2: Author with id 999999 does not exist"
+    
+    books[1]["author_id"] = author_id
+    books[2]["isbn"] = "111-1"
+    response = await authenticated_client.post("/api/v1/books/bulk", json={"books": books})
+    assert response.status_code == 400
+    assert "Row 3: Duplicate ISBN 111-1" in response.json()["detail"]
+    
+    books[2]["isbn"] = None
+    response = await authenticated_client.post("/api/v1/books/bulk", json={"books": books})
+    assert response.status_code == 201
+    
+    response = await authenticated_client.post("/api/v1/books/bulk", json={"books": books})
+    assert response.status_code == 409
+    assert response.json()["detail"] == "Row 1: Book with ISBN 111-1 already exists"
+
+
+@pytest.mark.asyncio
+async def test_conditional_requests_for_books(authenticated_client: AsyncClient):
+    author_response = await authenticated_client.post(
+        "/api/v1/authors/", json={"name": "Conditional Author"}
+    )
+    author_id = author_response.json()["id"]
+    book = {"title": "Conditional Book", "author_id": author_id, "genre": "History", "published_year": 1990}
+    book_id = (await authenticated_client.post("/api/v1/books/", json=book)).json()["id"]
+    
+    for url in (f"/api/v1/books/{book_id}", f"/api/v1/books/?author_id={author_id}"):
+        response = await authenticated_client.get(url)
+        etag = response.headers["etag"]
+        
+        response = await authenticated_client.get(url, headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.headers["etag"] == etag
+        assert response.content == b""
+    
+    response = await authenticated_client.get(f"/api/v1/books/{book_id}")
+    response = await authenticated_client.get(
+        f"/api/v1/books/{book_id}", headers={"If-Modified-Since": response.headers["last-modified"]}
+    )
+    assert response.status_code == 304
+    
+    response = await authenticated_client.get(f"/api/v1/books/?author_id={author_id}")
+    assert "last-modified" not in response.headers
+    assert response.headers["etag"] == body_etag(response.content)
+    
+    list_etag = (await authenticated_client.get(f"/api/v1/books/?author_id={author_id}")).headers["etag"]
+    book_etag = (await authenticated_client.get(f"/api/v1/books/{book_id}")).headers["etag"]
+    await authenticated_client.put(f"/api/v1/books/{book_id}", json={**book, "title": "Changed"})
+    
+    response = await authenticated_client.get(
+        f"/api/v1/books/?author_id={author_id}", headers={"If-None-Match": list_etag}
+    )
+    assert response.status_code == 200
+    assert response.json()["items"][0]["title"] == "Changed"
+    response = await authenticated_client.get(
+        f"/api/v1/books/{book_id}", headers={"If-None-Match": book_etag}
+    )
+    assert response.status_code == 200
+    assert response.headers["etag"] != book_etag
+
+
+@pytest.mark.asyncio
+async def test_book_list_fast_path_matches_response_schema(authenticated_client: AsyncClient):
+    author_response = await authenticated_client.post(
+        "/api/v1/authors/", json={"name": "Fast Path Author"}
+    )
+    author_id = author_response.json()["id"]
+    await authenticated_client.post(
+        "/api/v1/books/",
+        json={
+            "title": "Fast Path Book",
+            "author_id": author_id,
+            "genre": "Science",
+            "published_year": 2015,
+            "isbn": "978-0000000001",
+            "description": "Ünïcode description",
+        },
+    )
+    
+    response = await authenticated_client.get(f"/api/v1/books/?author_id={author_id}")
+    assert response.status_code == 200
+    page = response.json()
+    assert BookPagination.model_validate(page).model_dump(mode="json") == page
+    
+    book = page["items"][0]
+    single = await authenticated_client.get(f"/api/v1/books/{book['id']}")
+    assert single.json() == book
+    
+    schema = (await authenticated_client.get("/api/v1/openapi.json")).json()
+    list_schema = schema["paths"]["/api/v1/books/"]["get"]["responses"]["200"]["content"]
+    assert list_schema["application/json"]["schema"]["$ref"].endswith("/BookPagination")
@@ -0,0 +1,133 @@
+import pytest
+from httpx import AsyncClient
+
+from src.domain.entities import User
+from src.infrastructure.cache import TTLLRUCache
+from src.infrastructure.repositories import BookRepositoryImpl, UserRepositoryImpl
+
+
+def test_ttl_lru_cache_evicts_least_recently_used():
+    cache = TTLLRUCache(max_size=2, ttl=60)
+    cache.set(1, "one")
+    cache.set(2, "two")
+    assert cache.get(1) == "one"
+    
+    cache.set(3, "three")
+    
+    assert cache.get(2) is None
+    assert cache.get(1) == "one"
+    assert cache.get(3) == "three"
+    assert cache.stats()["evictions"] == 1
+    assert (cache.hits, cache.misses) == (3, 1)
+
+
+def test_ttl_lru_cache_expires_entries(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr("src.infrastructure.cache.ttl_lru.time.monotonic", lambda: now[0])
+    cache = TTLLRUCache(max_size=10, ttl=5)
+    cache.set("key", "value")
+    
+    now[0] += 4
+    assert cache.get("key") == "value"
+    now[0] += 2
+    assert cache.get("key") is None
+    assert len(cache) == 0
+
+
+def test_ttl_lru_cache_skips_stale_writes():
+    cache = TTLLRUCache(max_size=10, ttl=60)
+    generation = cache.generation()
+    cache.invalidate("key")
+    
+    cache.set("key", "stale", generation)
+    
+    assert cache.get("key") is None
+
+
+@pytest.mark.asyncio
+async def test_user_cache_is_invalidated_on_update(setup_database):
+    repository = UserRepositoryImpl()
+    user = await repository.create(
+        User(id=None, email="cached@example.com", username="cached", hashed_password="x")
+    )
+    
+    assert (await repository.get_by_id(user.id)).is_active
+    hits = repository.cache.hits
+    assert (await repository.get_by_id(user.id)).is_active
+    assert repository.cache.hits == hits + 1
+    
+    user.is_active = False
+    await repository.update(user.id, user)
+    
+    assert not (await repository.get_by_id(user.id)).is_active
+    assert repository.cache.get(user.id) is None
+
+
+@pytest.mark.asyncio
+async def test_book_and_author_responses_are_cached_and_invalidated(
+    authenticated_client: AsyncClient,
+):
+    author_response = await authenticated_client.post(
+        "/api/v1/authors/", json={"name": "Cached Author"}
+    )
+    author_id = author_response.json()["id"]
+    book_response = await authenticated_client.post(
+        "/api/v1/books/",
+        json={"title": "Cached Book", "author_id": author_id, "genre": "Fiction", "published_year": 2001},
+    )
+    book_id = book_response.json()["id"]
+    
+    first = await authenticated_client.get(f"/api/v1/books/{book_id}")
+    hits, misses = BookRepositoryImpl.cache.hits, BookRepositoryImpl.cache.misses
+    second = await authenticated_client.get(f"/api/v1/books/{book_id}")
+    assert second.json() == first.json()
+    cached = BookRepositoryImpl.cache.peek(book_id)
+    assert cached is not None and cached.body == second.content
+    assert (BookRepositoryImpl.cache.hits, BookRepositoryImpl.cache.misses) == (hits + 1, misses)
+    
+    await authenticated_client.put(
+        f"/api/v1/books/{book_id}",
+        json={"title": "Renamed Book", "author_id": author_id, "genre": "Fiction", "published_year": 2001},
+    )
+    response = await authenticated_client.get(f"/api/v1/books/{book_id}")
+    assert response.json()["title"] == "Renamed Book"
+    
+    response = await authenticated_client.get(f"/api/v1/authors/{author_id}")
+    assert response.json()["name"] == "Cached Author"
+    
+    await authenticated_client.delete(f"/api/v1/authors/{author_id}")
+    assert (await authenticated_client.get(f"/api/v1/authors/{author_id}")).status_code == 404
+    assert (await authenticated_client.get(f"/api/v1/books/{book_id}")).status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_book_list_cache_is_versioned_by_genre(authenticated_client: AsyncClient):
+    author_response = await authenticated_client.post(
+        "/api/v1/authors/", json={"name": "Versioned Author"}
+    )
+    author_id = author_response.json()["id"]
+    book = {"title": "Versioned Book", "author_id": author_id, "genre": "Mystery", "published_year": 2003}
+    
+    mystery = await authenticated_client.get("/api/v1/books/?genre=Mystery")
+    await authenticated_client.get("/api/v1/books/?genre=Romance")
+    hits = BookRepositoryImpl.list_cache.hits
+    
+    response = await authenticated_client.post("/api/v1/books/", json=book)
+    book_id = response.json()["id"]
+    
+    await authenticated_client.get("/api/v1/books/?genre=Romance")
+    assert BookRepositoryImpl.list_cache.hits == hits + 1
+    response = await authenticated_client.get("/api/v1/books/?genre=Mystery")
+    assert response.json()["total"] == mystery.json()["total"] + 1
+    
+    await authenticated_client.put(
+        f"/api/v1/books/{book_id}", json={**book, "genre": "Romance"}
+    )
+    response = await authenticated_client.get("/api/v1/books/?genre=Mystery")
+    assert response.json()["total"] == mystery.json()["total"]
+    response = await authenticated_client.get(f"/api/v1/books/?author_id={author_id}")
+    assert [item["genre"] for item in response.json()["items"]] == ["Romance"]
+    
+    await authenticated_client.delete(f"/api/v1/authors/{author_id}")
+    response = await authenticated_client.get("/api/v1/books/?genre=Romance")
+    assert book_id not in [item["id"] for item in response.json()["items"]]
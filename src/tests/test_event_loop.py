@@ -0,0 +1,53 @@
+import asyncio
+import time
+
+import pytest
+from httpx import AsyncClient
+
+from src.core.config import settings
+from src.infrastructure.metrics import LoopMonitor, registry
+
+
+@pytest.fixture
+async def loop_monitor(monkeypatch):
+    monkeypatch.setattr(settings, "loop_monitor_interval", 0.02)
+    monkeypatch.setattr(settings, "loop_block_threshold", 0.1)
+    await LoopMonitor.start()
+    try:
+        yield
+    finally:
+        await LoopMonitor.stop()
+
+
+async def parse_upload_synchronously() -> None:
+    time.sleep(0.3)
+
+
+@pytest.mark.asyncio
+async def test_blocking_call_is_recorded_with_its_stack(loop_monitor):
+    blocks_before = registry.get("event_loop_blocks_total").value()
+    await asyncio.sleep(0.05)
+    
+    await asyncio.create_task(parse_upload_synchronously(), name="csv-import")
+    await asyncio.sleep(0.05)
+    
+    block = LoopMonitor.blocks(1)[0]
+    assert block.duration >= 0.25
+    assert block.task == "csv-import (parse_upload_synchronously)"
+    assert any("time.sleep(0.3)" in frame for frame in block.stack)
+    assert registry.get("event_loop_blocks_total").value() == blocks_before + 1
+
+
+@pytest.mark.asyncio
+async def test_loop_blocks_are_listed_for_admins(
+    authenticated_client: AsyncClient, loop_monitor, promote_to_superuser
+):
+    await promote_to_superuser()
+    await asyncio.sleep(0.05)
+    time.sleep(0.2)
+    await asyncio.sleep(0.05)
+    
+    response = await authenticated_client.get("/api/v1/admin/loop-blocks", params={"limit": 1})
+    
+    assert response.status_code == 200
+    assert response.json()[0]["duration_ms"] >= 150
@@ -0,0 +1,221 @@
+import csv
+import io
+import json
+
+import asyncpg
+import pytest
+from httpx import AsyncClient
+
+from src.infrastructure.repositories import BookRepositoryImpl
+
+
+async def create_author_with_books(client: AsyncClient, name: str, count: int) -> int:
+    author_response = await client.post("/api/v1/authors/", json={"name": name})
+    author_id: int = author_response.json()["id"]
+    
+    for i in range(count):
+        await client.post(
+            "/api/v1/books/",
+            json={
+                "title": f"{name} Book {i}",
+                "author_id": author_id,
+                "genre": "Science",
+                "published_year": 1990 + i,
+            },
+        )
+    return author_id
+
+
+@pytest.mark.asyncio
+async def test_export_json_is_valid_array(client: AsyncClient):
+    response = await client.get("/api/v1/import-export/export/json")
+    
+    assert response.status_code == 200
+    assert isinstance(response.json(), list)
+
+
+@pytest.mark.asyncio
+async def test_export_json_honours_filters(authenticated_client: AsyncClient):
+    author_id = await create_author_with_books(authenticated_client, "Export Author", 3)
+    
+    response = await authenticated_client.get(
+        f"/api/v1/import-export/export/json?author_id={author_id}&sort_by=published_year"
+    )
+    
+    assert response.status_code == 200
+    data = response.json()
+    assert [book["published_year"] for book in data] == [1990, 1991, 1992]
+    assert all(book["author_id"] == author_id for book in data)
+
+
+@pytest.mark.asyncio
+async def test_export_ndjson(authenticated_client: AsyncClient):
+    author_id = await create_author_with_books(authenticated_client, "Ndjson Author", 2)
+    
+    response = await authenticated_client.get(
+        f"/api/v1/import-export/export/ndjson?author_id={author_id}"
+    )
+    
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert len(lines) == 2
+    assert {book["title"] for book in lines} == {"Ndjson Author Book 0", "Ndjson Author Book 1"}
+
+
+@pytest.mark.asyncio
+async def test_export_csv_honours_filters(authenticated_client: AsyncClient):
+    author_id = await create_author_with_books(authenticated_client, "Csv Author", 2)
+    
+    response = await authenticated_client.get(
+        f"/api/v1/import-export/export/csv?author_id={author_id}&sort_by=title"
+    )
+    
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert [row["title"] for row in rows] == ["Csv Author Book 0", "Csv Author Book 1"]
+    assert rows[0]["isbn"] == ""
+
+
+@pytest.mark.asyncio
+async def test_import_csv_stream_reports_batches(authenticated_client: AsyncClient):
+    author_response = await authenticated_client.post(
+        "/api/v1/authors/", json={"name": "Stream Import Author"}
+    )
+    author_id = author_response.json()["id"]
+    
+    lines = ["title,author_id,genre,published_year,isbn,description"]
+    for i, genre in enumerate(["Fiction", "Science", "Unknown", "History", "Poetry"]):
+        lines.append(f"Streamed {i},{author_id},{genre},{2000 + i},,\"Line one\nline two\"")
+    content = "\n".join(lines).encode("utf-8")
+    
+    response = await authenticated_client.post(
+        "/api/v1/import-export/import/csv/stream?batch_size=2",
+        files={"file": ("books.csv", content, "text/csv")},
+    )
+    
+    assert response.status_code == 201
+    report = response.json()
+    assert report["completed"] is True
+    assert report["total_rows"] == 5
+    assert report["inserted"] == 3
+    assert report["failed_rows"] == 2
+    assert [batch["inserted"] for batch in report["batches"]] == [2, 0, 1]
+    assert "Row 3" in report["batches"][1]["error"]
+
+
+@pytest.mark.asyncio
+async def test_import_json_stream_stops_on_malformed_input(authenticated_client: AsyncClient):
+    author_response = await authenticated_client.post(
+        "/api/v1/authors/", json={"name": "Malformed Import Author"}
+    )
+    author_id = author_response.json()["id"]
+    
+    item = json.dumps({
+        "title": "Streamed JSON",
+        "author_id": author_id,
+        "genre": "Fiction",
+        "published_year": 2010,
+    })
+    content = f"[{item}, {item} {{".encode("utf-8")
+    
+    response = await authenticated_client.post(
+        "/api/v1/import-export/import/json/stream?batch_size=1",
+        files={"file": ("books.json", content, "application/json")},
+    )
+    
+    assert response.status_code == 201
+    report = response.json()
+    assert report["completed"] is False
+    assert report["inserted"] == 1
+    assert "Invalid JSON format" in report["error"]
+
+
+@pytest.mark.asyncio
+async def test_import_json_stream_reports_overlong_fields(authenticated_client: AsyncClient):
+    author_response = await authenticated_client.post(
+        "/api/v1/authors/", json={"name": "Overlong Import Author"}
+    )
+    author_id = author_response.json()["id"]
+    
+    items = [
+        {"title": f"Fits {i}", "author_id": author_id, "genre": "Fiction", "published_year": 2001}
+        for i in range(2)
+    ]
+    items.append(
+        {"title": "x" * 600, "author_id": author_id, "genre": "Fiction", "published_year": 2001}
+    )
+    
+    response = await authenticated_client.post(
+        "/api/v1/import-export/import/json/stream?batch_size=2",
+        files={"file": ("books.json", json.dumps(items).encode("utf-8"), "application/json")},
+    )
+    
+    assert response.status_code == 201
+    report = response.json()
+    assert report["completed"] is True
+    assert report["inserted"] == 2
+    assert report["failed_rows"] == 1
+    assert "Row 3" in report["batches"][1]["error"]
+    assert "500 characters" in report["batches"][1]["error"]
+
+
+@pytest.mark.asyncio
+async def test_import_json_stream_reports_non_string_fields(authenticated_client: AsyncClient):
+    author_response = await authenticated_client.post(
+        "/api/v1/authors/", json={"name": "Non String Import Author"}
+    )
+    author_id = author_response.json()["id"]
+    
+    items = [
+        {"title": 123, "author_id": author_id, "genre": "Fiction", "published_year": 2001},
+        {"title": "Fine", "author_id": author_id, "genre": "Fiction", "published_year": 2001},
+    ]
+    
+    response = await authenticated_client.post(
+        "/api/v1/import-export/import/json/stream?batch_size=1",
+        files={"file": ("books.json", json.dumps(items).encode("utf-8"), "application/json")},
+    )
+    
+    assert response.status_code == 201
+    report = response.json()
+    assert report["inserted"] == 1
+    assert report["batches"][0]["error"] == "Row 1: title must be a string"
+
+
+@pytest.mark.asyncio
+async def test_import_json_stream_stops_when_the_database_fails(
+    authenticated_client: AsyncClient, monkeypatch
+):
+    author_response = await authenticated_client.post(
+        "/api/v1/authors/", json={"name": "Database Failure Import Author"}
+    )
+    author_id = author_response.json()["id"]
+    copy_insert = BookRepositoryImpl.copy_insert
+    calls = []
+    
+    async def fail_second_batch(self, books):
+        calls.append(len(books))
+        if len(calls) == 2:
+            raise asyncpg.TooManyConnectionsError("sorry, too many clients already")
+        return await copy_insert(self, books)
+    
+    monkeypatch.setattr(BookRepositoryImpl, "copy_insert", fail_second_batch)
+    items = [
+        {"title": f"Outage {i}", "author_id": author_id, "genre": "Fiction", "published_year": 2001}
+        for i in range(4)
+    ]
+    
+    response = await authenticated_client.post(
+        "/api/v1/import-export/import/json/stream?batch_size=1",
+        files={"file": ("books.json", json.dumps(items).encode("utf-8"), "application/json")},
+    )
+    
+    assert response.status_code == 201
+    report = response.json()
+    assert report["completed"] is False
+    assert report["inserted"] == 1
+    assert len(report["batches"]) == 1
+    assert len(calls) == 2
+    assert "Import stopped after row 2" in report["error"]
@@ -0,0 +1,60 @@
+import pytest
+from httpx import AsyncClient
+
+from src.infrastructure.metrics import MetricsRegistry
+from src.infrastructure.repositories import register_cache_metrics
+
+
+def test_histogram_renders_cumulative_buckets():
+    registry = MetricsRegistry()
+    histogram = registry.histogram("query_seconds", "Query time", ("operation",), buckets=(0.1, 1.0))
+    for value in (0.05, 0.1, 3.0):
+        histogram.observe(value, "count")
+    registry.gauge("pool_size", "Pool size", ("pool",), collect=lambda: [(("primary",), 12)])
+    
+    assert registry.render().splitlines() == [
+        "# HELP query_seconds Query time",
+        "# TYPE query_seconds histogram",
+        'query_seconds_bucket{operation="count",le="0.1"} 2',
+        'query_seconds_bucket{operation="count",le="1"} 2',
+        'query_seconds_bucket{operation="count",le="+Inf"} 3',
+        'query_seconds_count{operation="count"} 3',
+        'query_seconds_sum{operation="count"} 3.15',
+        "# HELP pool_size Pool size",
+        "# TYPE pool_size gauge",
+        'pool_size{pool="primary"} 12',
+    ]
+    with pytest.raises(ValueError):
+        histogram.observe(1.0)
+
+
+@pytest.mark.asyncio
+async def test_metrics_endpoint_exposes_pool_and_statement_metrics(client: AsyncClient):
+    register_cache_metrics()
+    await client.get("/api/v1/books/")
+    
+    response = await client.get("/metrics")
+    
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    body = response.text
+    assert 'db_pool_connections{pool="primary",workload="interactive",state="max"} 20' in body
+    assert 'db_pool_acquire_wait_seconds_count{pool="primary",workload="interactive"}' in body
+    assert 'db_statement_duration_seconds_count{operation="BookRepositoryImpl.get_page_rows"}' in body
+    assert 'repository_call_duration_seconds_count{repository="BookRepositoryImpl",method="get_page_rows"}' in body
+    assert 'cache_entries{cache="book_lists"}' in body
+    assert "db_statement_cache_misses_total" in body
+
+
+@pytest.mark.asyncio
+async def test_health_reports_round_trip_and_pool_saturation(client: AsyncClient):
+    response = await client.get("/health")
+    
+    assert response.status_code == 200
+    data = response.json()
+    assert data["status"] == "healthy"
+    assert data["database"]["round_trip_ms"] > 0
+    assert {(pool["pool"], pool["workload"]) for pool in data["pools"]} == {
+        ("primary", "interactive"),
+        ("primary", "batch"),
+    }
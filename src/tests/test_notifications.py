@@ -0,0 +1,118 @@
+import asyncio
+
+import asyncpg
+import pytest
+from httpx import AsyncClient
+
+from src.infrastructure.database import ChangeEvent, DatabasePool, NotificationListener
+from src.infrastructure.repositories import BookRepositoryImpl
+
+
+async def next_event(events: "asyncio.Queue[ChangeEvent]", table: str, op: str) -> ChangeEvent:
+    while True:
+        event = await asyncio.wait_for(events.get(), timeout=5)
+        if event.table == table and event.op == op:
+            return event
+
+
+def test_change_event_from_payload():
+    event = ChangeEvent.from_payload(
+        '{"table": "books", "op": "UPDATE", "ids": [1, 2], "genres": ["Fiction"], "author_ids": [3]}'
+    )
+    
+    assert event == ChangeEvent("books", "UPDATE", [1, 2], ["Fiction"], [3])
+    assert ChangeEvent.from_payload('{"table": "users", "op": "DELETE", "all": true}').all
+
+
+@pytest.mark.asyncio
+async def test_external_write_invalidates_cached_book(
+    authenticated_client: AsyncClient, notification_listener: asyncio.Queue
+):
+    author_response = await authenticated_client.post(
+        "/api/v1/authors/", json={"name": "Notified Author"}
+    )
+    author_id = author_response.json()["id"]
+    book_response = await authenticated_client.post(
+        "/api/v1/books/",
+        json={"title": "Notified Book", "author_id": author_id, "genre": "Fiction", "published_year": 2004},
+    )
+    book_id = book_response.json()["id"]
+    await next_event(notification_listener, "books", "INSERT")
+    await authenticated_client.get(f"/api/v1/books/{book_id}")
+    assert BookRepositoryImpl.cache.peek(book_id) is not None
+    
+    connection = await asyncpg.connect(DatabasePool.dsn())
+    try:
+        await connection.execute("UPDATE books SET title = 'Changed Elsewhere' WHERE id = $1", book_id)
+    finally:
+        await connection.close()
+    
+    event = await next_event(notification_listener, "books", "UPDATE")
+    assert event.ids == [book_id]
+    assert event.genres == ["Fiction"]
+    assert event.author_ids == [author_id]
+    assert BookRepositoryImpl.cache.peek(book_id) is None
+    
+    response = await authenticated_client.get(f"/api/v1/books/{book_id}")
+    assert response.json()["title"] == "Changed Elsewhere"
+
+
+@pytest.mark.asyncio
+async def test_listener_reconnects_and_resyncs(notification_listener: asyncio.Queue):
+    pid = NotificationListener.backend_pid()
+    while not notification_listener.empty():
+        notification_listener.get_nowait()
+    
+    async with DatabasePool.acquire() as connection:
+        await connection.execute("SELECT pg_terminate_backend($1)", pid)
+    
+    event = await next_event(notification_listener, "books", "RESYNC")
+    assert event.all
+    assert NotificationListener.backend_pid() != pid
+
+
+@pytest.mark.asyncio
+async def test_listener_recovers_from_unexpected_errors(
+    notification_listener: asyncio.Queue, monkeypatch
+):
+    pid = NotificationListener.backend_pid()
+    from_payload = ChangeEvent.from_payload
+    failures: list[str] = []
+    
+    def fail(payload: str) -> ChangeEvent:
+        if not failures:
+            failures.append(payload)
+            raise RuntimeError("handler bug")
+        return from_payload(payload)
+    
+    monkeypatch.setattr(ChangeEvent, "from_payload", fail)
+    while not notification_listener.empty():
+        notification_listener.get_nowait()
+    async with DatabasePool.acquire() as connection:
+        await connection.execute("SELECT pg_notify('table_changes', '{}')")
+    
+    event = await next_event(notification_listener, "books", "RESYNC")
+    assert event.all
+    assert NotificationListener.backend_pid() != pid
+
+
+@pytest.mark.asyncio
+async def test_truncate_notifies_resync(notification_listener: asyncio.Queue):
+    NotificationListener.register("truncate_probe", notification_listener.put_nowait)
+    connection = await asyncpg.connect(DatabasePool.dsn())
+    try:
+        await connection.execute("CREATE TABLE truncate_probe (id INTEGER)")
+        await connection.execute(
+            """
+            CREATE TRIGGER truncate_probe_notify_truncate AFTER TRUNCATE ON truncate_probe
+                FOR EACH STATEMENT EXECUTE FUNCTION notify_table_truncate()
+            """
+        )
+        await connection.execute("TRUNCATE truncate_probe")
+        
+        event = await next_event(notification_listener, "truncate_probe", "RESYNC")
+        assert event.all
+    finally:
+        NotificationListener.unregister("truncate_probe", notification_listener.put_nowait)
+        await connection.execute("DROP TABLE IF EXISTS truncate_probe")
+        await connection.close()
@@ -0,0 +1,53 @@
+import pytest
+from httpx import AsyncClient
+
+from src.core.config import settings
+
+
+@pytest.fixture
+def profiling(monkeypatch, tmp_path):
+    monkeypatch.setattr(settings, "profiling_enabled", True)
+    monkeypatch.setattr(settings, "profiling_token", "debug-secret")
+    monkeypatch.setattr(settings, "profiling_min_interval", 0.0)
+    monkeypatch.setattr(settings, "profiling_dir", str(tmp_path))
+    return tmp_path
+
+
+@pytest.mark.asyncio
+async def test_profile_requires_matching_token(client: AsyncClient, profiling):
+    response = await client.get("/api/v1/books/", headers={"X-Debug-Profile": "wrong"})
+    
+    assert response.status_code == 200
+    assert "x-profile-id" not in response.headers
+    assert list(profiling.iterdir()) == []
+
+
+@pytest.mark.asyncio
+async def test_profiled_request_is_listed_for_admins(
+    authenticated_client: AsyncClient, profiling, promote_to_superuser
+):
+    await promote_to_superuser()
+    
+    response = await authenticated_client.get(
+        "/api/v1/books/", params={"title": "profiled"}, headers={"X-Debug-Profile": "debug-secret"}
+    )
+    
+    assert response.status_code == 200
+    profile_id = response.headers["x-profile-id"]
+    assert {path.name for path in profiling.iterdir()} == {
+        f"{profile_id}.prof",
+        f"{profile_id}.txt",
+        f"{profile_id}.json",
+    }
+    
+    profiles = (await authenticated_client.get("/api/v1/admin/profiles")).json()
+    assert profiles[0]["id"] == profile_id
+    assert profiles[0]["path"] == "/api/v1/books/"
+    assert profiles[0]["status_code"] == 200
+    
+    report = await authenticated_client.get(f"/api/v1/admin/profiles/{profile_id}")
+    assert report.status_code == 200
+    assert "function calls" in report.text
+    assert "Top allocation sites" in report.text
+    missing = await authenticated_client.get("/api/v1/admin/profiles/..%2Fsecrets")
+    assert missing.status_code == 404
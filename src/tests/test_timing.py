@@ -0,0 +1,54 @@
+import logging
+
+import pytest
+from httpx import AsyncClient
+
+from src.core.config import settings
+from src.infrastructure.database.slow_queries import SlowQueryLog, normalize_sql, parameter_shape
+from src.infrastructure.repositories import BookRepositoryImpl
+
+
+def test_normalize_sql_collapses_literals_and_whitespace():
+    query = """
+        SELECT id FROM books
+        WHERE genre = 'Fiction' AND published_year >= $1
+        LIMIT 20
+    """
+    
+    assert normalize_sql(query) == (
+        "SELECT id FROM books WHERE genre = ? AND published_year >= $1 LIMIT ?"
+    )
+    assert parameter_shape(["dune", 3, [1, 2], None]) == "(str, int, list[2], NoneType)"
+
+
+@pytest.mark.asyncio
+async def test_server_timing_header_breaks_down_request(client: AsyncClient):
+    response = await client.get("/api/v1/books/", params={"title": "server timing"})
+    
+    assert response.status_code == 200
+    entries = dict(
+        entry.strip().split(";dur=") for entry in response.headers["server-timing"].split(",")
+    )
+    assert set(entries) == {"db", "service", "serialize", "total"}
+    assert 0 < float(entries["db"]) <= float(entries["service"]) <= float(entries["total"])
+
+
+@pytest.mark.asyncio
+async def test_slow_queries_are_logged_with_plan(setup_database, monkeypatch, caplog):
+    monkeypatch.setattr(settings, "slow_query_threshold", 1e-9)
+    monkeypatch.setattr(SlowQueryLog, "_explained", {})
+    caplog.set_level(logging.WARNING, logger="src.infrastructure.database.slow_queries")
+    
+    await BookRepositoryImpl().count(title="slow query log", author_id=1)
+    await SlowQueryLog.flush()
+    
+    messages = [
+        record.getMessage()
+        for record in caplog.records
+        if "in BookRepositoryImpl.count" in record.getMessage()
+    ]
+    assert any(
+        "AND title ILIKE $1 AND author_id = $2 params=(str, int)\n" in message
+        and "books" in message.split("\n", 1)[1]
+        for message in messages
+    )
@@ -0,0 +1,71 @@
+import json
+
+import pytest
+from httpx import AsyncClient
+
+from src.core.config import settings
+from src.core.tracing import exporter
+
+
+@pytest.fixture
+def tracing(monkeypatch, tmp_path):
+    monkeypatch.setattr(settings, "tracing_enabled", True)
+    monkeypatch.setattr(settings, "tracing_file", str(tmp_path / "spans.jsonl"))
+    exporter.clear()
+    yield tmp_path / "spans.jsonl"
+    exporter.clear()
+
+
+@pytest.mark.asyncio
+async def test_request_is_traced_through_each_layer(client: AsyncClient, tracing):
+    response = await client.get("/api/v1/books/", params={"title": "tracing"})
+    
+    assert response.status_code == 200
+    spans = exporter.recent(1)[0]
+    by_id = {span["span_id"]: span for span in spans}
+    root = spans[0]
+    assert response.headers["x-trace-id"] == root["trace_id"]
+    assert root["name"] == "GET /api/v1/books/"
+    assert root["attributes"]["status_code"] == 200
+    
+    statement = next(
+        span
+        for span in spans
+        if span["layer"] == "database" and "title ILIKE $1" in span["attributes"]["statement"]
+    )
+    repository = by_id[statement["parent_id"]]
+    service = by_id[repository["parent_id"]]
+    assert repository["name"] == "BookRepositoryImpl.get_page_rows"
+    assert service["name"] == "BookService.get_book_rows"
+    assert service["parent_id"] == root["span_id"]
+    
+    exporter.flush()
+    lines = [json.loads(line) for line in tracing.read_text().splitlines()]
+    assert {line["span_id"] for line in lines} == set(by_id)
+
+
+@pytest.mark.asyncio
+async def test_tracing_is_off_by_default(client: AsyncClient):
+    exporter.clear()
+    
+    response = await client.get("/api/v1/books/")
+    
+    assert "x-trace-id" not in response.headers
+    assert exporter.recent(10) == []
+
+
+@pytest.mark.asyncio
+async def test_admin_traces_require_superuser(
+    authenticated_client: AsyncClient, tracing, promote_to_superuser
+):
+    response = await authenticated_client.get("/api/v1/admin/traces")
+    assert response.status_code == 403
+    
+    await promote_to_superuser()
+    
+    response = await authenticated_client.get("/api/v1/admin/traces", params={"limit": 5})
+    
+    assert response.status_code == 200
+    data = response.json()
+    assert data["enabled"] is True
+    assert data["traces"][0][0]["name"] == "GET /api/v1/admin/traces"